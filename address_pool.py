@@ -0,0 +1,223 @@
+from collections import deque
+from socket import inet_aton, inet_ntoa
+
+# Address bookkeeping for new nodes. Used addresses are kept in a bitmap split into
+# blocks of 256 addresses (a /24 for IPv4), so loaded topologies with scattered
+# addresses only allocate the blocks they touch. Allocation takes a reclaimed address
+# if there is one and otherwise moves a cursor past the used addresses, so both
+# allocating and freeing are O(1) amortized.
+
+BLOCK_BITS = 8
+
+def ipv4_to_int(text: str) -> int | None:
+	try:
+		return int.from_bytes(inet_aton(text.split("/")[0].strip()), "big")
+	except (OSError, ValueError):
+		return None
+
+def int_to_ipv4(value: int, prefixlen: int = 24) -> str:
+	return f"{inet_ntoa(value.to_bytes(4, 'big'))}/{prefixlen}"
+
+def mac_to_int(text: str) -> int | None:
+	digits = text.replace(":", "").replace("-", "").strip()
+	if len(digits) != 12:
+		return None
+	try:
+		return int(digits, 16)
+	except ValueError:
+		return None
+
+def int_to_mac(value: int) -> str:
+	return ":".join(f"{b:02x}" for b in value.to_bytes(6, "big"))
+
+def node_addresses(type: str, nodeInfo: dict) -> tuple[list[int], list[int]]:
+	# IPv4 and MAC addresses owned by a node. LINK_MAC refers to another node's interface.
+	ips, macs = [], []
+	for iface in nodeInfo.get("INTERFACES", []):
+		if iface.get("IP"):
+			ips.append(ipv4_to_int(iface["IP"]))
+		if iface.get("MAC"):
+			macs.append(mac_to_int(iface["MAC"]))
+	if type == "Controller" and nodeInfo.get("IP"):
+		ips.append(ipv4_to_int(nodeInfo["IP"]))
+	if nodeInfo.get("MANAGEMENT_MAC"):
+		macs.append(mac_to_int(nodeInfo["MANAGEMENT_MAC"]))
+	return [ip for ip in ips if ip is not None], [mac for mac in macs if mac is not None]
+
+class AddressPool:
+	def __init__(self, first: int, last: int, reserved=None, capacity: int | None = None):
+		# Allocates from first..last; reserved(value) excludes addresses such as network and broadcast addresses,
+		# capacity being the number of addresses left once they are excluded
+		self.first = first
+		self.last = last
+		self.reserved = reserved
+		self.capacity = last - first + 1 if capacity is None else capacity
+		self.usedInRange = 0 # Used addresses counted in capacity
+		self.blocks: dict[int, bytearray] = dict()
+		self.duplicates: dict[int, int] = dict() # Extra owners of addresses used more than once
+		self.freed: deque[int] = deque()
+		self.cursor = first
+		self.used = 0
+
+	def isUsed(self, value: int) -> bool:
+		block = self.blocks.get(value >> BLOCK_BITS)
+		if block is None:
+			return False
+		offset = value & ((1 << BLOCK_BITS) - 1)
+		return block[offset >> 3] >> (offset & 7) & 1 == 1
+
+	def reserve(self, value: int) -> bool:
+		# Marks value as used, returns False if it already was
+		if self.isUsed(value):
+			self.duplicates[value] = self.duplicates.get(value, 0) + 1
+			return False
+		block = self.blocks.get(value >> BLOCK_BITS)
+		if block is None:
+			block = self.blocks[value >> BLOCK_BITS] = bytearray(1 << (BLOCK_BITS - 3))
+		offset = value & ((1 << BLOCK_BITS) - 1)
+		block[offset >> 3] |= 1 << (offset & 7)
+		self.used += 1
+		if self.inCapacity(value):
+			self.usedInRange += 1
+		return True
+
+	def release(self, value: int):
+		if not self.isUsed(value):
+			return
+		extra = self.duplicates.get(value, 0)
+		if extra > 0:
+			if extra == 1:
+				del self.duplicates[value]
+			else: self.duplicates[value] = extra - 1
+			return
+		block = self.blocks[value >> BLOCK_BITS]
+		offset = value & ((1 << BLOCK_BITS) - 1)
+		block[offset >> 3] &= ~(1 << (offset & 7)) & 0xff
+		self.used -= 1
+		if self.inCapacity(value):
+			self.usedInRange -= 1
+		if not any(block):
+			del self.blocks[value >> BLOCK_BITS]
+		if self.first <= value < self.cursor:
+			self.freed.append(value)
+
+	def allocate(self) -> int | None:
+		# Returns a free address without reserving it; it is reserved once the node using it is added.
+		# Consecutive calls return different addresses.
+		while len(self.freed) > 0:
+			value = self.freed.popleft()
+			if self.isAvailable(value):
+				return value
+		while self.cursor <= self.last:
+			value = self.cursor
+			self.cursor += 1
+			if self.isAvailable(value):
+				return value
+		return None
+
+	def allocateSubnet(self, count: int, size: int) -> list[int] | None:
+		# count free addresses inside one aligned block of size addresses past the cursor. A block larger
+		# than a bitmap block must have no used address, and the rest of it is left unused, since
+		# smaller subnets in it would overlap it. Free addresses skipped on the way are kept for allocate().
+		base = self.cursor - self.cursor % size
+		while base <= self.last:
+			start, end = max(base, self.cursor), min(base + size, self.last + 1)
+			untouched = start == max(base, self.first) and not any(b in self.blocks for b in range(base >> BLOCK_BITS, (base + size) >> BLOCK_BITS))
+			if size <= 1 << BLOCK_BITS or untouched:
+				values = [v for v in range(start, end) if self.isAvailable(v)]
+				if len(values) >= count:
+					self.freed.extend(v for v in range(self.cursor, start) if self.isAvailable(v))
+					self.cursor = values[count - 1] + 1 if size <= 1 << BLOCK_BITS else end
+					return values[:count]
+			base += size
+		return None
+
+	def isAvailable(self, value: int) -> bool:
+		return not self.isUsed(value) and (self.reserved is None or not self.reserved(value))
+
+	def inCapacity(self, value: int) -> bool:
+		return self.first <= value <= self.last and (self.reserved is None or not self.reserved(value))
+
+	def free(self) -> int:
+		# Addresses that can still be allocated, including ones returned by allocate() but not reserved yet
+		return self.capacity - self.usedInRange
+
+	def checkpoint(self) -> tuple[int, list[int]]:
+		return self.cursor, list(self.freed)
+
+	def restore(self, state: tuple[int, list[int]]):
+		# Gives back the addresses allocated since checkpoint() when they were not reserved
+		self.cursor = state[0]
+		self.freed = deque(state[1])
+
+	def clear(self):
+		self.blocks.clear()
+		self.duplicates.clear()
+		self.freed.clear()
+		self.cursor = self.first
+		self.used = 0
+		self.usedInRange = 0
+
+class AddressAllocator:
+	# IPv4 and MAC pools of a scene, plus the addresses each node holds so that they
+	# can be reclaimed when the node or one of its interfaces is removed
+	def __init__(self):
+		# 192.168.0.1 to 192.168.255.254 as /24 networks, skipping network and broadcast addresses
+		self.ipv4 = AddressPool(0xc0a80001, 0xc0a8fffe, lambda v: v & 0xff in (0, 0xff), 256 * 254)
+		self.mac = AddressPool(0x000000000001, 0xfffffffffffe)
+		self.nodeAddresses: dict[str, tuple[list[int], list[int]]] = dict()
+
+	def newIPv4(self) -> str:
+		value = self.ipv4.allocate()
+		if value is None:
+			raise RuntimeError("IPv4 address pool exhausted")
+		return int_to_ipv4(value)
+
+	def newIPv4Subnet(self, count: int) -> list[str]:
+		# Addresses of one subnet for the interfaces of a link segment: a /24 while they fit in one,
+		# otherwise the smallest larger subnet made of whole /24s
+		blocks = 1 << (-(-count // 254) - 1).bit_length()
+		values = self.ipv4.allocateSubnet(count, blocks << BLOCK_BITS)
+		if values is None:
+			raise RuntimeError("IPv4 address pool exhausted")
+		return [int_to_ipv4(value, 24 - (blocks.bit_length() - 1)) for value in values]
+
+	def newMAC(self) -> str:
+		value = self.mac.allocate()
+		if value is None:
+			raise RuntimeError("MAC address pool exhausted")
+		return int_to_mac(value)
+
+	def checkpoint(self):
+		return self.ipv4.checkpoint(), self.mac.checkpoint()
+
+	def restore(self, state):
+		self.ipv4.restore(state[0])
+		self.mac.restore(state[1])
+
+	def setNode(self, name: str, type: str, nodeInfo: dict):
+		# Reserves the node's current addresses and releases the ones it no longer has
+		ips, macs = node_addresses(type, nodeInfo)
+		oldIps, oldMacs = self.nodeAddresses.get(name, ([], []))
+		for pool, old, new in ((self.ipv4, oldIps, ips), (self.mac, oldMacs, macs)):
+			for value in new:
+				pool.reserve(value)
+			for value in old:
+				pool.release(value)
+		self.nodeAddresses[name] = (ips, macs)
+
+	def removeNode(self, name: str):
+		ips, macs = self.nodeAddresses.pop(name, ([], []))
+		for value in ips:
+			self.ipv4.release(value)
+		for value in macs:
+			self.mac.release(value)
+
+	def renameNode(self, name: str, newName: str):
+		if name in self.nodeAddresses:
+			self.nodeAddresses[newName] = self.nodeAddresses.pop(name)
+
+	def clear(self):
+		self.ipv4.clear()
+		self.mac.clear()
+		self.nodeAddresses.clear()
@@ -5,21 +5,37 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 from PySide6.QtWidgets import QWidget
-import networkx as nx
 from enum import Enum
 import random
 import resources_rc
 import itertools
 import sys
-import file_export
 import copy
-from webbrowser import open as webopen
-from socket import inet_ntoa, inet_aton
+from socket import inet_aton
 import regexdef
-import os
+import time
+import spatial_index
+import search_index
+import address_pool
+import name_allocator
+import validation
+import theme
+import reachability
+import tracing
+import counters
+import lazy_modules
+# Imported on first use, see lazy_modules
+nx = lazy_modules.LazyModule("networkx")
+file_export = lazy_modules.LazyModule("file_export")
+layout_engine = lazy_modules.LazyModule("layout_engine")
+subnet_analysis = lazy_modules.LazyModule("subnet_analysis")
+topology_generators = lazy_modules.LazyModule("topology_generators")
 
 rad = 5
-NODE_RAD = 50
+NODE_RAD = theme.NODE_RADIUS
+VIRTUALIZATION_MARGIN = 0.5 # Fraction of the viewport size materialized around it
+ANNOTATION_COLOR = QColor(220, 40, 40)
+HIGHLIGHT_COLOR = QColor(255, 140, 0)
 userSettings: QSettings = None
 
 class ToolMode(Enum):
@@ -29,35 +45,30 @@ class ToolMode(Enum):
 	NEW=4
 	DELETE=5
 
-def createNodeNameGenerator(basename: str):
-	for i in itertools.count(1, 1):
-		yield f"{basename}{i}"
-
-def createIPv4Generator():
-	# 0xc0a80001 = 192.168.0.1
-	for i in itertools.count(0xc0a80001, 1):
-		ip = inet_ntoa(i.to_bytes(4, byteorder="big"))
-		ip += "/24"
-		yield ip
-
-def createMACAddrGenerator():
-	for i in itertools.count(0x000000000000, 1):
-		bs = i.to_bytes(6, "big")
-		mac = ""
-		for b in bs:
-			mac += f"{b:02x}:"
-		yield mac[0:-1]
-
-def clearLayout(layout: QLayout):
-	while (item := layout.itemAt(0)) != None:
-		item.widget().deleteLater()
-		layout.removeWidget(item.widget())
-
 def initializeUserSettings():
 	showKeys = ["OVSSingleControllerWarn"]
 	for k in showKeys:
 		if userSettings.value(f"Show/{k}") == None:
 			userSettings.setValue(f"Show/{k}", True)
+	defaults = {
+		"Scene/VirtualizationThreshold": 5000, # Node count from which loaded topologies use a virtualized scene
+		"Scene/ReuseNodeNames": False # New nodes take the lowest free number instead of the next one
+	}
+	for k, v in defaults.items():
+		if userSettings.value(k) == None:
+			userSettings.setValue(k, v)
+
+class TopologyDocument:
+	# A tab of the window. Only the shown one has its topology in the scene: the others keep it
+	# as an NPGI dict, and the view transform and center to restore with it.
+	def __init__(self, title: str, filepath: str = "", npgi: dict | None = None):
+		self.title = title
+		self.filepath = filepath
+		self.npgi = npgi
+		self.virtualized = False
+		self.groups: tuple[int, list[tuple[int, list[str]]]] = (0, [])
+		self.transform: QTransform | None = None
+		self.center = QPointF()
 
 class WindowClass(QMainWindow):
 	def __init__(self):
@@ -72,38 +83,104 @@ class WindowClass(QMainWindow):
 		self.filepath = ""
 		self.setToolMode(ToolMode.SELECT)
 		self.niep = ["127.0.0.1", "5000"]
+		self.layoutWorkers: list[LayoutWorker] = []
+		self.analysisWorkers: list[SubnetWorker] = []
+		self.importWorkers: list[ImportWorker] = []
+		self.document: TopologyDocument | None = None
+		self.untitledCount = 0
+		self.clipboard: topology_generators.Template | None = None
+		self.tabBar = QTabBar()
+		self.tabBar.setTabsClosable(True)
+		self.tabBar.setMovable(True)
+		self.tabBar.setDocumentMode(True)
+		self.tabBar.setExpanding(False)
+		self.tabBar.currentChanged.connect(self.activateTab)
+		self.tabBar.tabCloseRequested.connect(self.closeTab)
+		central = QWidget()
+		layout = QVBoxLayout()
+		layout.setContentsMargins(0, 0, 0, 0)
+		layout.setSpacing(0)
+		layout.addWidget(self.tabBar)
+		layout.addWidget(self.mainWidget)
+		central.setLayout(layout)
 
 		self.setMenuBar(self.menu)
-		self.setCentralWidget(self.mainWidget)
+		self.setCentralWidget(central)
+		self.minimapDock = self.createDock("Overview", MinimapWidget(self.view))
+		self.searchDock = self.createDock("Search", SearchWidget(self.view))
+		self.issuesDock = self.createDock("Issues", IssuesWidget(self.view))
+		self.reachabilityDock = self.createDock("Reachability", ReachabilityWidget(self.view))
+		self.performanceDock = self.createDock("Performance", PerformanceWidget(self))
+		self.performanceDock.hide()
+		self.newDocument()
+
+	def createDock(self, title: str, widget: QWidget) -> QDockWidget:
+		dock = QDockWidget(title)
+		dock.setWidget(widget)
+		self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, dock)
+		self.menus["&View"].addAction(dock.toggleViewAction())
+		return dock
+
+	def showSearch(self):
+		self.searchDock.show()
+		self.searchDock.raise_()
+		self.searchDock.widget().focusInput()
 
 	def createMenuBar(self) -> QMenuBar:
 		menuBar = QMenuBar()
 		menus = {
 			"&File": {
-				"New": (None, None),
+				"New": (self.newDocument, "Ctrl+T"),
+				"Close tab": (lambda: self.closeTab(self.tabBar.currentIndex()), "Ctrl+W"),
 				"Load": (self.loadTopology, "Ctrl+L"),
 				"Save": (self.saveTopology, "Ctrl+S"),
 				"Save as ...": (self.saveTopologyAs, "Ctrl+Shift+S"),
+				"Import NIEP topology ...": (lambda: self.importTopology(False), "Ctrl+I"),
+				"Import NIEP directory ...": (lambda: self.importTopology(True), "Ctrl+Shift+I"),
 				"Export as ...": (lambda: self.exportDir(), "Ctrl+E")
 			},
+			"&Edit": {
+				"Find": (self.showSearch, "Ctrl+F"),
+				"Copy selection": (self.copySelection, "Ctrl+C"),
+				"Paste": (self.pasteSelection, "Ctrl+V"),
+				"Generate topology ...": (self.generateTopology, "Ctrl+Shift+T"),
+				"Replicate selection ...": (self.replicateSelection, "Ctrl+Shift+D"),
+				"Delete selection": (lambda: self.mainWidget.view.scene.removeElements(self.mainWidget.view.scene.selectedElements()), "Del"),
+				"Reuse freed node names": (lambda checked: userSettings.setValue("Scene/ReuseNodeNames", checked), None),
+				"Collapse selection": (lambda: self.mainWidget.view.scene.collapseSelection(), "Ctrl+G"),
+				"Expand selected groups": (lambda: self.mainWidget.view.scene.expandSelection(), "Ctrl+Shift+G")
+			},
+			"&View": {
+				"Virtualized rendering": (self.setVirtualized, None)
+			},
+			"&Layout": {
+				"Force-directed layout": (lambda: self.autoLayout("FORCE"), "Ctrl+Shift+F"),
+				"Hierarchical layout": (lambda: self.autoLayout("HIERARCHICAL"), "Ctrl+Shift+H")
+			},
 			"&Help": {
-				"Documentation": (lambda: webopen("https://github.com/marzelop/NIEP-GUI/tree/main/docs"), None),
+				"Documentation": (self.openDocumentation, None),
 				"Report a bug": (None, None),
-				"Troubleshooting": (None, None)
+				"Troubleshooting": (None, None),
+				"Record trace ...": (self.recordTrace, None)
 			},
 			"&Run": {
 				"Configure NIEP": (self.configureNiep, "Ctrl+N"),
+				"Analyze subnets": (self.analyzeSubnets, "Ctrl+Shift+A"),
 				"Run topology (local)": (self.runTopology, "Ctrl+R"),
 				"Run topology (remote)": (self.runRemote, "Ctrl+Shift+R"),
 				"Kill topology": (self.killTopology, "Ctrl+K")
 			}
 		}
 		self.actions = []
+		self.menuActions: dict[str, QAction] = {}
+		self.menus: dict[str, QMenu] = {}
 		for menu in menus.keys():
 			newmenu = QMenu(menu)
+			self.menus[menu] = newmenu
 			for action in menus[menu].keys():
 				a = QAction(action)
 				self.actions.append(a) # Save actions so that they won't be destroyed when this function ends for some reason
+				self.menuActions[action] = a
 				# Conditional for development: Should be removed after complete menu functionality
 				if menus[menu][action][0] != None:
 					a.triggered.connect(menus[menu][action][0])
@@ -116,8 +193,34 @@ class WindowClass(QMainWindow):
 
 			menuBar.addMenu(newmenu)
 
+		# Keys that also edit text or tables only act on the topology while the view has focus
+		for action in ("Delete selection", "Copy selection", "Paste"):
+			self.menuActions[action].setShortcutContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+			self.view.addAction(self.menuActions[action])
+		self.menuActions["Virtualized rendering"].setCheckable(True)
+		self.menuActions["Reuse freed node names"].setCheckable(True)
+		self.menuActions["Reuse freed node names"].setChecked(userSettings.value("Scene/ReuseNodeNames", type=bool))
+		self.menuActions["Record trace ..."].setCheckable(True)
+		self.menuActions["Record trace ..."].setChecked(tracing.recording)
 		return menuBar
 	
+	def openDocumentation(self):
+		import webbrowser
+		webbrowser.open("https://github.com/marzelop/NIEP-GUI/tree/main/docs")
+
+	def recordTrace(self, checked: bool):
+		# Spans of the slow paths go to a Chrome trace file while checked
+		if checked:
+			filepath = QFileDialog.getSaveFileName(self, "Record trace", filter="Chrome trace (*.json)")[0]
+			if filepath == "":
+				self.menuActions["Record trace ..."].setChecked(False)
+				return
+			tracing.start(file_export.add_default_extension(filepath, "json"))
+			self.statusBar().showMessage(f"Recording a trace to {tracing.filepath}")
+		elif tracing.recording:
+			count = tracing.stop()
+			self.statusBar().showMessage(f"Trace of {count} events written to {tracing.filepath}")
+
 	def createEditToolBar(self):
 		self.editActions: list[QAction] = []
 		toolbar = QToolBar("Edit")
@@ -171,104 +274,325 @@ class WindowClass(QMainWindow):
 		if self.filepath == "":
 			self.saveTopologyAs()
 		else:
-			file_export.generate_NPGI_file(self.mainWidget.view.scene.netgraph, self.filepath)
+			with counters.timed("Save"):
+				file_export.generate_NPGI_file(self.mainWidget.view.scene.netgraph, self.filepath)
 	
 	def saveTopologyAs(self):
-		self.filepath = QFileDialog.getSaveFileName(filter="NPGI file (*.npgi)")[0]
-		if self.filepath == "":
+		filepath = QFileDialog.getSaveFileName(filter="NPGI file (*.npgi)")[0]
+		if filepath == "":
 			return
+		self.filepath = filepath
+		self.document.title = file_export.get_filename_no_extension(filepath)
+		self.tabBar.setTabText(self.tabBar.currentIndex(), self.document.title)
+		self.updateTitle()
 		self.saveTopology()
 	
 	def loadTopology(self):
 		filepath = QFileDialog.getOpenFileName(filter="Topology file (*.npgi)")[0]
 		if filepath == "":
 			return
-		topo = file_export.load_NPGI_file(filepath)
+		with tracing.span("WindowClass.loadTopology", path=filepath), counters.timed("Load"):
+			topo = file_export.load_NPGI_file(filepath)
+			self.openDocument(file_export.get_filename_no_extension(filepath), filepath, topo)
+
+	# Tabs: every tab is a TopologyDocument, and switching tabs rebuilds the scene from the
+	# shown one, so memory grows with the shown topology rather than with the open ones
+
+	def newDocument(self):
+		self.untitledCount += 1
+		self.addDocument(TopologyDocument(f"Untitled {self.untitledCount}"))
+
+	def addDocument(self, document: TopologyDocument):
+		index = self.tabBar.addTab(document.title)
+		self.tabBar.setTabData(index, document)
+		self.tabBar.setCurrentIndex(index)
+		# The first tab is current as soon as it is added, before it has its document
+		self.activateTab(index)
+
+	def openDocument(self, title: str, filepath: str, topo: dict):
+		# Opens a topology in a new tab, or in the current one while it is empty and unsaved
+		if self.filepath == "" and self.mainWidget.view.scene.netgraph.number_of_nodes() == 0:
+			self.document.title = title
+			self.tabBar.setTabText(self.tabBar.currentIndex(), title)
+			self.filepath = filepath
+			self.openTopologyDict(topo)
+			self.updateTitle()
+		else:
+			self.addDocument(TopologyDocument(title, filepath, topo))
+
+	def activateTab(self, index: int):
+		document: TopologyDocument | None = self.tabBar.tabData(index) if index >= 0 else None
+		if document is None or document is self.document:
+			return
+		with tracing.span("WindowClass.activateTab", title=document.title), counters.timed("Switch tab"):
+			if self.document is not None:
+				self.unloadDocument(self.document)
+			self.document = document
+			self.loadDocument(document)
+
+	def unloadDocument(self, document: TopologyDocument):
+		view: ViewClass = self.mainWidget.view
+		scene: SceneClass = view.scene
+		document.filepath = self.filepath
+		document.virtualized = scene.isVirtualized()
+		document.groups = scene.groupState()
+		document.transform = view.transform()
+		document.center = view.mapToScene(view.viewport().rect().center())
+		if scene.netgraph.number_of_nodes() > 0:
+			document.npgi = file_export.generate_NPGI_dict(scene.netgraph, document.filepath or document.title)
+
+	def loadDocument(self, document: TopologyDocument):
+		view: ViewClass = self.mainWidget.view
+		self.filepath = document.filepath
+		self.menuActions["Virtualized rendering"].setChecked(document.virtualized)
+		if document.npgi is None:
+			view.scene.setVirtualized(document.virtualized)
+			view.scene.clear()
+		else:
+			self.openTopologyDict(document.npgi)
+			view.scene.restoreGroups(document.groups)
+			document.npgi = None # The scene holds it while the tab is shown
+		if document.transform is not None:
+			view.setTransform(document.transform)
+			view.centerOn(document.center)
+		self.updateTitle()
+
+	def closeTab(self, index: int):
+		if index < 0:
+			return
+		if self.tabBar.tabData(index) is self.document:
+			# Dropped rather than unloaded, the next tab shown rebuilds the scene
+			self.document = None
+		self.tabBar.removeTab(index)
+		if self.tabBar.count() == 0:
+			self.newDocument()
+
+	def updateTitle(self):
+		self.setWindowTitle(f"{self.document.title} - NIEP eXperience")
+
+	def copySelection(self):
+		# Kept as a template, which can be pasted in any tab
+		template = self.mainWidget.view.scene.selectionTemplate()
+		if template is None:
+			return
+		self.clipboard = template
+		self.statusBar().showMessage(f"Copied {len(template.types)} nodes")
+
+	def pasteSelection(self):
+		if self.clipboard is None:
+			return
+		scene: SceneClass = self.mainWidget.view.scene
+		# Links to controllers outside the copied nodes are kept where that controller exists
+		template = self.clipboard._replace(external=[(i, name) for i, name in self.clipboard.external if scene.hasNode(name)])
+		threshold = int(userSettings.value("Scene/VirtualizationThreshold"))
+		if not scene.isVirtualized() and scene.netgraph.number_of_nodes() + len(template.types) >= threshold:
+			self.menuActions["Virtualized rendering"].setChecked(True)
+			self.setVirtualized(True)
+		try:
+			nodes = scene.stampTemplate(template, 1)
+		except RuntimeError as e:
+			QMessageBox.warning(self, "Paste", str(e))
+			return
+		self.statusBar().showMessage(f"Pasted {len(nodes)} nodes")
+
+	@tracing.traced("WindowClass.openTopologyDict")
+	def openTopologyDict(self, topo: dict):
+		# Loads a topology, turning virtualized rendering on for large ones
+		mininet = topo["TOPO"]["MININET"]
+		nodeCount = len(mininet["HOSTS"]) + len(mininet["SWITCHES"]) + len(mininet["CONTROLLERS"]) + len(mininet["OVSWITCHES"]) + len(topo["VMS"])
+		threshold = int(userSettings.value("Scene/VirtualizationThreshold"))
+		if nodeCount >= threshold:
+			self.menuActions["Virtualized rendering"].setChecked(True)
+		self.mainWidget.view.scene.setVirtualized(self.menuActions["Virtualized rendering"].isChecked())
+		self.loadTopologyDict(topo)
+
+	def importTopology(self, directory: bool):
+		if directory:
+			path = QFileDialog.getExistingDirectory(self, "Import NIEP export directory")
+		else: path = QFileDialog.getOpenFileName(self, "Import NIEP topology", filter="NIEP topology (*.json)")[0]
+		if path == "":
+			return
+		worker = ImportWorker(path)
+		worker.topologyReady.connect(self.showImportedTopology)
+		worker.failed.connect(lambda message: (self.statusBar().clearMessage(), QMessageBox.warning(self, "Import failed", message)))
+		worker.finished.connect(lambda: self.importWorkers.remove(worker))
+		self.importWorkers.append(worker)
+		self.statusBar().showMessage(f"Importing {path}...")
+		worker.start()
+
+	def showImportedTopology(self, topo: dict, elapsed: float):
+		start = time.perf_counter()
+		self.openDocument(topo["TOPO"].get("ID") or "Imported", "", topo)
+		nodeCount = self.mainWidget.view.scene.netgraph.number_of_nodes()
+		counters.durations["Import"] = elapsed / 1000 + time.perf_counter() - start
+		self.statusBar().showMessage(f"Imported {nodeCount} nodes: read and laid out in {elapsed:.0f} ms, inserted in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+	def loadTopologyDict(self, topo: dict):
 		hosts: list[dict] = topo["TOPO"]["MININET"]["HOSTS"]
 		positions: dict = topo["POSITIONS"]
 		scene: SceneClass = self.mainWidget.view.scene
 		scene.clear()
 		nodes_without_pos = []
-		# Load Hosts
-		for h in hosts:
-			name, hostInterfaces = h["ID"], h["INTERFACES"]
+
+		def nodePosition(name: str) -> QPointF:
 			pos = positions.get(name, None)
 			if pos is None:
-				pos = QPointF(0.0, 0.0)
 				nodes_without_pos.append(name)
-			else:
-				pos = QPointF(pos[0], pos[1])
-			scene.addNode(name, pos, "Host", {"INTERFACES": hostInterfaces})
+				return QPointF(0.0, 0.0)
+			return QPointF(pos[0], pos[1])
+
+		with tracing.span("WindowClass.loadTopologyDict.nodes"):
+			# Load Hosts
+			for h in hosts:
+				name, hostInterfaces = h["ID"], h["INTERFACES"]
+				scene.addNode(name, nodePosition(name), "Host", {"INTERFACES": hostInterfaces})
 		
-		# Load Switches
-		for s in topo["TOPO"]["MININET"]["SWITCHES"]:
-			name = s
-			pos = positions.get(name, None)
-			if pos is None:
-				pos = QPointF(0.0, 0.0)
-				nodes_without_pos.append(name)
-			else:
-				pos = QPointF(pos[0], pos[1])
-			scene.addNode(name, pos, "Switch", {})
+			# Load Switches
+			for s in topo["TOPO"]["MININET"]["SWITCHES"]:
+				name = s
+				scene.addNode(name, nodePosition(name), "Switch", {})
 		
-		# Load VMS
-		for vm in topo["VMS"]:
-			name = vm["ID"]
-			vminfo = copy.deepcopy(vm)
-			vminfo.pop("ID")
-			if name[-4:] == "@VNF":
-				name = name[0:-4]
-				vminfo["VNF"] = True
-			else: vminfo["VNF"] = False
-
-			for iface in vminfo["INTERFACES"]:
-				if "LINK_MAC" not in iface.keys():
-					iface["LINK_MAC"] = ""
-			pos = positions.get(name, None)
-			if pos is None:
-				pos = QPointF(0.0, 0.0)
-				nodes_without_pos.append(name)
-			else:
-				pos = QPointF(pos[0], pos[1])
-			scene.addNode(name, pos, "VM", vminfo)	
+			# Load VMS
+			for vm in topo["VMS"]:
+				name = vm["ID"]
+				vminfo = copy.deepcopy(vm)
+				vminfo.pop("ID")
+				if name[-4:] == "@VNF":
+					name = name[0:-4]
+					vminfo["VNF"] = True
+				else: vminfo["VNF"] = False
+
+				for iface in vminfo["INTERFACES"]:
+					if "LINK_MAC" not in iface.keys():
+						iface["LINK_MAC"] = ""
+				scene.addNode(name, nodePosition(name), "VM", vminfo)	
 		
-		# Load Controllers
-		for c in topo["TOPO"]["MININET"]["CONTROLLERS"]:
-			name, ip, port = c["ID"], c["IP"], c["PORT"]
-			pos = positions.get(name, None)
-			if pos is None:
-				pos = QPointF(0.0, 0.0)
-				nodes_without_pos.append(name)
-			else:
-				pos = QPointF(pos[0], pos[1])
-			scene.addNode(name, pos, "Controller", {"IP": ip, "PORT": port})
+			# Load Controllers
+			for c in topo["TOPO"]["MININET"]["CONTROLLERS"]:
+				name, ip, port = c["ID"], c["IP"], c["PORT"]
+				scene.addNode(name, nodePosition(name), "Controller", {"IP": ip, "PORT": port})
 		
-		for ovs in topo["TOPO"]["MININET"]["OVSWITCHES"]:
-			name, ctrl = ovs["ID"], ovs["CONTROLLER"]
-			ctrlobj = None if ctrl is None else scene.getNode(ctrl)['obj']
-			pos = positions.get(name, None)
-			if pos is None:
-				pos = QPointF(0.0, 0.0)
-				nodes_without_pos.append(name)
-			else:
-				pos = QPointF(pos[0], pos[1])
-			ovsnode = scene.addNode(name, pos, "OVSwitch", {"CONTROLLER": ctrlobj})
-			scene.connectNodes(ovsnode, ctrlobj)
+			for ovs in topo["TOPO"]["MININET"]["OVSWITCHES"]:
+				name, ctrl = ovs["ID"], ovs["CONTROLLER"]
+				ctrlobj = None if ctrl is None else scene.getNode(ctrl)['obj']
+				ovsnode = scene.addNode(name, nodePosition(name), "OVSwitch", {"CONTROLLER": ctrlobj})
+				if ctrlobj is not None:
+					scene.connectNodes(ovsnode, ctrlobj)
 		
 		# Load connections
-		connections = topo["TOPO"]["CONNECTIONS"]
-		for c in connections:
-			u, ui, v, vi = c["IN/OUT"], c.get("IN/OUTIFACE", None), c["OUT/IN"], c.get("OUT/INIFACE", None)
-			uobj, vobj = scene.getNode(u)["obj"], scene.getNode(v)["obj"]
-			uinfo, vinfo = uobj.nodeInfo, vobj.nodeInfo
-			uiindex, viindex = None, None
-			if uobj.hasInterface():
-				uiindex = next((index for (index, iface) in enumerate(uinfo["INTERFACES"]) if iface["MAC"] == ui), None)
-			if vobj.hasInterface():
-				viindex = next((index for (index, iface) in enumerate(vinfo["INTERFACES"]) if iface["MAC"] == vi), None)		
-			edgeInfo = {"INTERFACES": [uiindex, viindex]}
-			scene.connectNodes(uobj, vobj, edgeInfo)
-		self.filepath = filepath
+		with tracing.span("WindowClass.loadTopologyDict.connections"):
+			connections = topo["TOPO"]["CONNECTIONS"]
+			for c in connections:
+				u, ui, v, vi = c["IN/OUT"], c.get("IN/OUTIFACE", None), c["OUT/IN"], c.get("OUT/INIFACE", None)
+				uobj, vobj = scene.getNode(u)["obj"], scene.getNode(v)["obj"]
+				uinfo, vinfo = uobj.nodeInfo, vobj.nodeInfo
+				uiindex, viindex = None, None
+				if uobj.hasInterface():
+					uiindex = next((index for (index, iface) in enumerate(uinfo["INTERFACES"]) if iface["MAC"] == ui), None)
+				if vobj.hasInterface():
+					viindex = next((index for (index, iface) in enumerate(vinfo["INTERFACES"]) if iface["MAC"] == vi), None)		
+				edgeInfo = {"INTERFACES": [uiindex, viindex]}
+				scene.connectNodes(uobj, vobj, edgeInfo)
+		scene.searchIndex.flush() # Sorts the loaded names now rather than on the first search
+		if not scene.isVirtualized():
+			scene.growSceneRect(scene.itemsBoundingRect())
+		scene.modelRegionChanged.emit(QRectF())
+
+		if len(nodes_without_pos) > 0:
+			self.autoLayout("FORCE", nodes_without_pos)
+
+	def generateTopology(self):
+		dialog = GeneratorDialog()
+		if dialog.exec() != QDialog.DialogCode.Accepted:
+			return
+		blueprint = dialog.blueprint()
+		scene: SceneClass = self.mainWidget.view.scene
+		needed = topology_generators.ipv4_count(blueprint)
+		if needed > scene.addresses.ipv4.free():
+			QMessageBox.warning(self, "Generate topology", f"The topology needs {needed} IPv4 addresses, but only {scene.addresses.ipv4.free()} are free")
+			return
+		threshold = int(userSettings.value("Scene/VirtualizationThreshold"))
+		if not scene.isVirtualized() and scene.netgraph.number_of_nodes() + len(blueprint.types) >= threshold:
+			self.menuActions["Virtualized rendering"].setChecked(True)
+			self.setVirtualized(True)
+		# Placed to the right of the current topology
+		center = QPointF(0, 0)
+		if scene.netgraph.number_of_nodes() > 0 and len(blueprint.types) > 0:
+			rect = scene.nodesBoundingRect([obj for _, obj in scene.netgraph.nodes(data="obj")])
+			center = QPointF(rect.right() + 4*NODE_RAD - blueprint.positions[:, 0].min(), rect.center().y())
+		start = time.perf_counter()
+		try:
+			scene.insertBlueprint(blueprint, center)
+		except RuntimeError as e:
+			QMessageBox.warning(self, "Generate topology", str(e))
+			return
+		self.view.centerOn(center)
+		self.statusBar().showMessage(f"Generated {len(blueprint.types)} nodes and {len(blueprint.edges)} links in {time.perf_counter() - start:.1f} s")
+
+	def replicateSelection(self):
+		scene: SceneClass = self.mainWidget.view.scene
+		template = scene.selectionTemplate()
+		if template is None:
+			return
+		count, ok = QInputDialog.getInt(self, "Replicate selection", f"Copies of the {len(template.types)} selected nodes:", 1, 1, 100000)
+		if not ok:
+			return
+		threshold = int(userSettings.value("Scene/VirtualizationThreshold"))
+		if not scene.isVirtualized() and scene.netgraph.number_of_nodes() + count * len(template.types) >= threshold:
+			self.menuActions["Virtualized rendering"].setChecked(True)
+			self.setVirtualized(True)
+		start = time.perf_counter()
+		try:
+			nodes = scene.stampTemplate(template, count)
+		except RuntimeError as e:
+			QMessageBox.warning(self, "Replicate selection", str(e))
+			return
+		self.statusBar().showMessage(f"Added {len(nodes)} nodes in {count} copies in {time.perf_counter() - start:.1f} s")
+
+	def autoLayout(self, method: str, nodeNames: list[str] | None = None):
+		scene: SceneClass = self.mainWidget.view.scene
+		layoutInput = scene.layoutInput(nodeNames)
+		if len(layoutInput[0]) == 0:
+			return
+		worker = LayoutWorker(method, *layoutInput)
+		generation = scene.generation
+		worker.layoutReady.connect(lambda names, positions: scene.applyLayout(names, positions) if scene.generation == generation else None)
+		worker.finished.connect(lambda: self.layoutWorkers.remove(worker))
+		self.layoutWorkers.append(worker) # Keeps the thread object alive while it runs
+		worker.start()
+
+	def analyzeSubnets(self):
+		scene: SceneClass = self.mainWidget.view.scene
+		worker = SubnetWorker(*scene.subnetInput())
+		generation = scene.generation
+		worker.reportReady.connect(lambda *report: self.showSubnetReport(*report) if scene.generation == generation else None)
+		worker.finished.connect(lambda: self.analysisWorkers.remove(worker))
+		self.analysisWorkers.append(worker)
+		self.statusBar().showMessage("Analyzing subnets...")
+		worker.start()
+
+	def showSubnetReport(self, owners: list[NodeModel], linkEdges: dict[int, list[EdgeModel]], messages: dict[int, list[str]], linkMessages: dict[int, list[str]], elapsed: float):
+		scene: SceneClass = self.mainWidget.view.scene
+		annotations: dict[NodeModel | EdgeModel, list[str]] = dict()
+		for i, notes in messages.items():
+			annotations.setdefault(owners[i], []).extend(f"{owners[i].getName()}: {note}" for note in notes)
+		for i, notes in linkMessages.items():
+			for edge in linkEdges.get(i, []):
+				annotations.setdefault(edge, []).extend(f"{owners[i].getName()}: {note}" for note in notes)
+		scene.setAnnotations({obj: "\n".join(notes) for obj, notes in annotations.items()})
+		nodeCount = sum(1 for obj in annotations if isinstance(obj, NodeModel))
+		self.statusBar().showMessage(f"Subnet analysis: {sum(len(n) for n in messages.values())} problems on {nodeCount} nodes, {len(owners)} interfaces checked in {elapsed:.0f} ms")
+
+	def setVirtualized(self, enabled: bool):
+		scene: SceneClass = self.mainWidget.view.scene
+		if enabled == scene.isVirtualized():
+			return
+		# Rebuild the current topology with the other kind of scene elements
+		topo = file_export.generate_NPGI_dict(scene.netgraph, "Topology")
+		groups = scene.groupState()
+		scene.setVirtualized(enabled)
+		self.loadTopologyDict(topo)
+		scene.restoreGroups(groups)
 
 	def configureNiep(self):
 		
@@ -308,7 +632,7 @@ class WindowClass(QMainWindow):
 		if filepath == "":
 			return
 		try:
-			with open(filepath, 'rb') as f:
+			with open(filepath, 'rb') as f, tracing.span("NIEP /remote"):
 				responseData = requests.post("http://" + self.niep[0] + ":" + self.niep[1] + "/remote", files={'package': f})
 				print(responseData)
 		except requests.ConnectionError as e:
@@ -321,7 +645,8 @@ class WindowClass(QMainWindow):
 		if filepath == "":
 			return
 		try:
-			responseData = requests.post("http://" + self.niep[0] + ":" + self.niep[1] + "/setup", params={"path":filepath})
+			with tracing.span("NIEP /setup"):
+				responseData = requests.post("http://" + self.niep[0] + ":" + self.niep[1] + "/setup", params={"path":filepath})
 			print(responseData)
 		except requests.ConnectionError as e:
 			msg = QMessageBox(QMessageBox.Icon.Critical, "Failed to run topology", f"Failed to run topology, verify if the local NIEP HTTP server is running.")
@@ -330,15 +655,19 @@ class WindowClass(QMainWindow):
 	def killTopology(self):
 		import requests
 		try:
-			responseData = requests.post("http://" + self.niep[0] + ":" + self.niep[1] + "/kill", params={})
+			with tracing.span("NIEP /kill"):
+				responseData = requests.post("http://" + self.niep[0] + ":" + self.niep[1] + "/kill", params={})
 			print(responseData)
 		except requests.ConnectionError:
 			msg = QMessageBox(QMessageBox.Icon.Critical, "Failed to kill topology", f"Failed to kill topology, verify if NIEP HTTP server is running.")
 			msg.exec()
 
 	def exportDir(self):
-		import json
-		import shutil
+		errorCount = self.mainWidget.view.scene.validator.errorCount
+		if errorCount > 0:
+			answer = QMessageBox.question(self, "Topology has errors", f"The topology has {errorCount} validation errors, listed in the Issues panel. Export anyway?")
+			if answer != QMessageBox.StandardButton.Yes:
+				return
 		responseDict = {}
 		dialog = ExportDialog(responseDict)
 		dialog.exec()
@@ -352,24 +681,8 @@ class WindowClass(QMainWindow):
 			if filepath[-4:] == ".zip":
 				filepath = filepath[:-4]
 			zipname = f"{filepath}.zip"
-		os.mkdir(filepath)
-		os.mkdir(f"{filepath}/VMS")
-		os.mkdir(f"{filepath}/VNFS")
-		scene: SceneClass = self.mainWidget.view.scene
-		topo = file_export.generate_topo_dict(scene.netgraph, "Topology")
-		topo["ID"] = topoid
-		vms = file_export.generate_VM_definitions(scene.netgraph)
-		vnfs = file_export.generate_VNF_definitions(topo)
-		with open(f"{filepath}/{topo['ID']}.json", "w") as fp:
-			json.dump(topo, fp, indent=4)
-		for vm in vms:
-			with open(f"{filepath}/VMS/{vm['ID']}.json", "w") as fp:
-				json.dump(vm, fp, indent=4)
-		for vnf in vnfs:
-			with open(f"{filepath}/VNFS/{vnf['ID']}.json", "w") as fp:
-				json.dump(vnf, fp, indent=4)
-		if mode == "ZIP":
-			shutil.make_archive(filepath, "zip", f"{filepath}/../", filepath)
+		with counters.timed("Export"):
+			file_export.export_directory(self.mainWidget.view.scene.netgraph, filepath, topoid, mode == "ZIP")
 
 
 class ExportDialog(QDialog):
@@ -459,6 +772,64 @@ class ExportDialog(QDialog):
 		self.accept()
 
 
+class GeneratorDialog(QDialog):
+	def __init__(self):
+		super().__init__()
+		self.setWindowTitle("Generate topology")
+		self.setModal(True)
+		layout = QVBoxLayout()
+		self.family = QComboBox()
+		self.family.addItems(topology_generators.FAMILIES.keys())
+		layout.addWidget(self.family)
+		# One page of parameters per family
+		self.pages = QStackedWidget()
+		self.spins: dict[str, list[QSpinBox]] = {}
+		for family, (parameters, _) in topology_generators.FAMILIES.items():
+			page = QWidget()
+			form = QFormLayout()
+			self.spins[family] = []
+			for name, minimum, maximum, default in parameters:
+				spin = QSpinBox()
+				spin.setRange(minimum, maximum)
+				spin.setValue(default)
+				spin.valueChanged.connect(self.updateSize)
+				form.addRow(f"{name}:", spin)
+				self.spins[family].append(spin)
+			page.setLayout(form)
+			self.pages.addWidget(page)
+		layout.addWidget(self.pages)
+		self.controller = QCheckBox("OVSwitches with a controller")
+		self.controller.toggled.connect(self.updateSize)
+		layout.addWidget(self.controller)
+		self.sizeLabel = QLabel()
+		layout.addWidget(self.sizeLabel)
+		self.generateButton = QPushButton("Generate")
+		self.generateButton.clicked.connect(self.accept)
+		layout.addWidget(self.generateButton)
+		self.setLayout(layout)
+		self.family.currentIndexChanged.connect(self.pages.setCurrentIndex)
+		self.family.currentIndexChanged.connect(self.updateSize)
+		self.updateSize()
+
+	def values(self) -> list[int]:
+		return [spin.value() for spin in self.spins[self.family.currentText()]]
+
+	def updateSize(self):
+		count = topology_generators.node_count(self.family.currentText(), self.values())
+		if self.controller.isChecked() and self.family.currentText() != "Service chains":
+			count += 1
+		if count > topology_generators.MAX_NODES:
+			self.sizeLabel.setText(f"{count} nodes, over the limit of {topology_generators.MAX_NODES}")
+		else: self.sizeLabel.setText(f"{count} nodes")
+		self.generateButton.setEnabled(count <= topology_generators.MAX_NODES)
+
+	def blueprint(self) -> topology_generators.Blueprint:
+		blueprint = topology_generators.FAMILIES[self.family.currentText()][1](*self.values())
+		if self.controller.isChecked() and "Switch" in blueprint.types:
+			blueprint = topology_generators.with_controller(blueprint)
+		return blueprint
+
+
 class MainWidget(QWidget):
 	def __init__(self):
 		super(MainWidget, self).__init__()
@@ -496,6 +867,10 @@ class ElementViewer(QWidget):
 		self.element: Node | Edge | None = None
 		self.attributes: dict | None = None
 		self.scene: SceneClass = None
+		# One panel per node type, edge and group, and one per node type for several nodes selected
+		# together, created on first use and rebound on every selection
+		self.panels: dict[str, NodePanel | EdgePanel | GroupPanel | BulkNodePanel] = {}
+		self.panel: NodePanel | EdgePanel | GroupPanel | BulkNodePanel | None = None
 		self.setAutoFillBackground(True)
 		self.setPalette(QColor(255, 255, 255))
 		self.setLayout(QVBoxLayout())
@@ -508,127 +883,170 @@ class ElementViewer(QWidget):
 		self.setElement(None)
 		
 	
-	def setElement(self, element: Node | Edge | None):
-		clearLayout(self.layout())
+	def setElement(self, element: Node | Edge | list[NodeModel] | None):
 		self.element = element
-		self.scroll.setWidget(self)
-		if type(element) == Node:
-			self.setNode(element)
-		elif type(element) == Edge:
-			self.setEdge(element)
+		if isinstance(element, list):
+			kind, bound = f"Bulk{element[0].type}", element
+		elif isinstance(element, NodeModel):
+			kind, bound = element.type, element
+		elif isinstance(element, EdgeModel):
+			kind, bound = "Edge", element
+		elif isinstance(element, GroupNode):
+			kind, bound = "Group", element.group
 		else:
-			self.scroll.setWidget(None)
-
-	def setNode(self, node: Node):
-		setFunctions = {
-			"Host": self.setHost,
-			"Switch": self.setSwitch,
-			"Controller": self.setController,
-			"OVSwitch": self.setOVSwitch,
-			"VM": self.setVM
-		}
-		f = setFunctions[node.type]
-		nodeName = node.getName()
-		layout = self.layout()
-		layout.setSpacing(0)
+			kind, bound = None, None
+		panel = None if kind is None else self.getPanel(kind, bound)
+		if panel is not self.panel and self.panel is not None:
+			self.panel.hide()
+		self.panel = panel
+		if panel is not None:
+			panel.bind(bound)
+			panel.show()
+
+	def getPanel(self, kind: str, element: NodeModel | EdgeModel | NodeGroup | list[NodeModel]) -> NodePanel | EdgePanel | GroupPanel | BulkNodePanel:
+		panel = self.panels.get(kind)
+		if panel is None:
+			if kind == "Edge":
+				panel = EdgePanel(element, self.scene)
+			elif kind == "Group":
+				panel = GroupPanel(self.scene)
+			elif isinstance(element, list):
+				panel = BulkNodePanel(element[0].type, self.scene)
+			else: panel = NodePanel(element, self.scene)
+			panel.hide()
+			self.layout().addWidget(panel)
+			self.panels[kind] = panel
+		return panel
 
-		nameLabel = QLabel(node.type)
-		nameLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-		nameEdit = NodeNameEditor(nodeName, self.scene)
-		layout.addWidget(nameLabel)
-		layout.addWidget(nameEdit)
+	def setScene(self, scene: SceneClass):
+		self.scene = scene
+		scene.selectionSettled.connect(self.updateElement)
+		# Panels keep the scene they were created for
+		self.setElement(None)
+		for panel in self.panels.values():
+			self.layout().removeWidget(panel)
+			panel.deleteLater()
+		self.panels.clear()
 
-		f(node)
+	def getNodeFromScene(self, nodeName: str) -> dict:
+		return self.scene.getNode(nodeName)
 
-	def setHost(self, node: Node):
+	# Slot
+	@tracing.traced("ElementViewer.updateElement")
+	def updateElement(self):
+		# Several selected nodes of the same type are edited together, selected links aside
+		nodes = self.scene.selectedNodeModels()
+		if len(nodes) > 1 and all(n.type == nodes[0].type for n in nodes):
+			self.setElement(nodes)
+		else: self.setElement(self.scene.currentElement())
+
+
+class NodePanel(QWidget):
+	# Editors for the nodes of one type. Each editor is paired with whether it edits the node
+	# itself or its nodeInfo dict, which is what it is rebound to.
+	def __init__(self, node: NodeModel, scene: SceneClass):
+		super(NodePanel, self).__init__()
+		self.node = node
+		self.scene = scene
 		nodeInfo = node.nodeInfo
+		layout = QVBoxLayout()
+		layout.setContentsMargins(0, 0, 0, 0)
+		layout.setSpacing(0)
+		self.setLayout(layout)
 
-		layout = self.layout()
-
-		iviewer = InterfaceViewer(node)
-		layout.addWidget(iviewer)
-	
-	def setSwitch(self, node: Node):
-		pass
-
-	def setController(self, node: Node):
-		nodeInfo = node.nodeInfo
+		nameLabel = QLabel(node.type)
+		nameLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+		self.nameEdit = NodeNameEditor(node.getName(), scene)
+		layout.addWidget(nameLabel)
+		layout.addWidget(self.nameEdit)
+
+		if node.type == "Host":
+			self.editors = [(InterfaceViewer(node, scene), True)]
+		elif node.type == "Controller":
+			self.editors = [(ElementLineEditor(nodeInfo, "IP"), False), (ElementLineEditor(nodeInfo, "PORT"), False)]
+		elif node.type == "VM":
+			self.editors = [
+				(CheckBoxKeyEditor(nodeInfo, "VNF"), False),
+				(ElementSpinEditor(nodeInfo, "MEMORY", 1, 4096), False),
+				(ElementSpinEditor(nodeInfo, "VCPU", 1, 16), False),
+				(VMDiskEditor(node), True),
+				(ElementLineEditor(nodeInfo, "MANAGEMENT_MAC"), False),
+				(InterfaceViewer(node, scene), True)
+			]
+		else: self.editors = []
+		for editor, _ in self.editors:
+			editor.edited.connect(lambda: self.scene.nodeInfoChanged(self.node))
+			layout.addWidget(editor)
 
-		layout = self.layout()
-		IPEditor = ElementLineEditor(nodeInfo, "IP")
-		portEditor = ElementLineEditor(nodeInfo, "PORT")
-		layout.addWidget(IPEditor)
-		layout.addWidget(portEditor)
-	
-	def setOVSwitch(self, node: Node):
-		pass
+	def bind(self, node: NodeModel):
+		self.node = node
+		self.nameEdit.bind(node.getName())
+		for editor, editsNode in self.editors:
+			editor.bind(node if editsNode else node.nodeInfo)
 
-	def setVM(self, node: Node):
-		nodeInfo = node.nodeInfo
 
-		layout = self.layout()
-		vnfCheckBox = CheckBoxKeyEditor(nodeInfo, "VNF")
-		memoryEditor = ElementSpinEditor(nodeInfo, "MEMORY", 1, 4096)
-		vcpuEditor = ElementSpinEditor(nodeInfo, "VCPU", 1, 16)
-		diskEditor = VMDiskEditor(node)
-		managementMACEditor = ElementLineEditor(nodeInfo, "MANAGEMENT_MAC")
-
-		layout.addWidget(vnfCheckBox)
-		layout.addWidget(memoryEditor)
-		layout.addWidget(vcpuEditor)
-		layout.addWidget(diskEditor)
-		layout.addWidget(managementMACEditor)
-
-		ifaceviewer = InterfaceViewer(node)
-		layout.addWidget(ifaceviewer)
-			
-	def addInterface(self):
-		node: Node = self.element
-		iface = {"IP": None, "MAC": "00:00:00:00:00:00"}
-		node.nodeInfo["INTERFACES"].append(iface)
-		inum = len(node.nodeInfo["INTERFACES"])
-		layout = self.layout()
-		ilabel = InterfaceLabel(node, inum-1)
-		button = layout.itemAt(layout.count()-1).widget()
-		layout.removeWidget(button)
-		layout.addWidget(ilabel)
-		for k in iface.keys():
-			layout.addWidget(ElementLineEditor(iface, k))
-		layout.addWidget(button)		
-
-	def setEdge(self, edge: Edge):
-		layout = self.layout()
+class EdgePanel(QWidget):
+	def __init__(self, edge: EdgeModel, scene: SceneClass):
+		super(EdgePanel, self).__init__()
+		self.edge = edge
+		self.scene = scene
+		layout = QVBoxLayout()
+		layout.setContentsMargins(0, 0, 0, 0)
 		layout.setSpacing(0)
+		self.setLayout(layout)
 
 		nameLabel = QLabel("Edge")
 		nameLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-
-		nodes = edge.nodes
-		u, v = nodes
-
-		nodesLabel = QLabel(f"Endpoints: {u.getName()} - {v.getName()}")
+		self.nodesLabel = QLabel()
 		layout.addWidget(nameLabel)
-		layout.addWidget(nodesLabel)
+		layout.addWidget(self.nodesLabel)
+
+		# Interface selectors of both endpoints, hidden for endpoints without interfaces
+		self.interfaceLabels: list[QLabel] = []
+		self.selectors: list[InterfaceComboSelector] = []
+		for _ in range(2):
+			label = QLabel()
+			selector = InterfaceComboSelector()
+			selector.currentIndexChanged.connect(lambda: self.scene.edgeInfoChanged(self.edge))
+			layout.addWidget(label)
+			layout.addWidget(selector)
+			self.interfaceLabels.append(label)
+			self.selectors.append(selector)
 
-		for i, n in enumerate(nodes):
+	def bind(self, edge: EdgeModel):
+		self.edge = edge
+		u, v = edge.nodes
+		self.nodesLabel.setText(f"Endpoints: {u.getName()} - {v.getName()}")
+		for n, label, selector in zip(edge.nodes, self.interfaceLabels, self.selectors):
+			label.setVisible(n.hasInterface())
+			selector.setVisible(n.hasInterface())
 			if n.hasInterface():
-				layout.addWidget(QLabel(f"{n.getName()} interface:"))
-				layout.addWidget(InterfaceComboSelector(n, edge))
+				label.setText(f"{n.getName()} interface:")
+				selector.bind(n, edge)
 
-	def setScene(self, scene: SceneClass):
+
+class GroupPanel(QWidget):
+	def __init__(self, scene: SceneClass):
+		super(GroupPanel, self).__init__()
+		self.group: NodeGroup | None = None
 		self.scene = scene
-		scene.selectionChanged.connect(self.updateElement)
+		layout = QVBoxLayout()
+		layout.setContentsMargins(0, 0, 0, 0)
+		layout.setSpacing(0)
+		self.setLayout(layout)
 
-	def getNodeFromScene(self, nodeName: str) -> dict:
-		return self.scene.getNode(nodeName)
+		nameLabel = QLabel("Group")
+		nameLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+		self.infoLabel = QLabel()
+		expandButton = QPushButton("Expand")
+		expandButton.clicked.connect(lambda: self.scene.expandGroup(self.group))
+		layout.addWidget(nameLabel)
+		layout.addWidget(self.infoLabel)
+		layout.addWidget(expandButton)
 
-	# Slot
-	def updateElement(self):
-		elements = self.scene.selectedItems()
-		if len(elements) == 0:
-			self.setElement(None)
-			return
-		self.setElement(elements[0])
+	def bind(self, group: NodeGroup):
+		self.group = group
+		self.infoLabel.setText(f"{group.name}: {len(group.members)} nodes")
 
 
 class NodeNameEditor(QWidget):
@@ -645,6 +1063,10 @@ class NodeNameEditor(QWidget):
 		layout.addWidget(nameEdit)
 		self.setLayout(layout)
 		self.nameEdit = nameEdit
+
+	def bind(self, nodeName: str):
+		self.nodeName = nodeName
+		self.nameEdit.setText(nodeName)
 	
 	def updateNodeName(self):
 		newName = self.nameEdit.text()
@@ -661,25 +1083,36 @@ class NodeNameEditor(QWidget):
 
 
 class ElementLineEditor(QWidget):
+	edited = Signal()
+
 	def __init__(self, modDict: dict, modKey: str, validRegex: str = None):
 		super(ElementLineEditor, self).__init__()
 		self.modDict = modDict
 		self.modKey = modKey
 
 		layout = QHBoxLayout()
-		keyEdit = QLineEdit(modDict[modKey])
+		keyEdit = QLineEdit()
 		if validRegex is not None:
 			regex = QRegularExpression(validRegex)
 			validator = QRegularExpressionValidator(regex)
 			keyEdit.setValidator(validator)
 		keyEdit.setFixedWidth(110)
-		keyEdit.editingFinished.connect(lambda: self.modDict.update({self.modKey: keyEdit.text()}))
+		keyEdit.editingFinished.connect(lambda: (self.modDict.update({self.modKey: keyEdit.text()}), self.edited.emit()))
 		layout.addWidget(QLabel(f"{modKey.replace('_', ' ')}:"))
 		layout.addWidget(keyEdit)
 		self.setLayout(layout)
+		self.keyEdit = keyEdit
+		self.bind(modDict)
+
+	def bind(self, modDict: dict):
+		self.modDict = modDict
+		value = modDict[self.modKey]
+		self.keyEdit.setText("" if value is None else str(value))
 
 
 class ElementSpinEditor(QWidget):
+	edited = Signal()
+
 	def __init__(self, modDict: dict, modKey: str, min: int, max: int):
 		super(ElementSpinEditor, self).__init__()
 		self.modDict = modDict
@@ -690,13 +1123,22 @@ class ElementSpinEditor(QWidget):
 		keyEdit.setRange(min, max)
 		keyEdit.setValue(modDict[modKey])
 		keyEdit.setFixedWidth(110)
-		keyEdit.valueChanged.connect(lambda: self.modDict.update({self.modKey: keyEdit.value()}))
+		keyEdit.valueChanged.connect(lambda: (self.modDict.update({self.modKey: keyEdit.value()}), self.edited.emit()))
 		layout.addWidget(QLabel(f"{modKey}:"))
 		layout.addWidget(keyEdit)
 		self.setLayout(layout)
+		self.keyEdit = keyEdit
+
+	def bind(self, modDict: dict):
+		self.modDict = modDict
+		self.keyEdit.blockSignals(True) # Showing another node's value is not an edit
+		self.keyEdit.setValue(modDict[self.modKey])
+		self.keyEdit.blockSignals(False)
 
 
 class CheckBoxKeyEditor(QCheckBox):
+	edited = Signal()
+
 	def __init__(self, modDict: dict, modKey: str, negateBool: bool = False):
 		super(CheckBoxKeyEditor, self).__init__(modKey)
 
@@ -707,102 +1149,223 @@ class CheckBoxKeyEditor(QCheckBox):
 		self.setChecked(self.modDict[self.modKey] != negateBool)
 
 		self.stateChanged.connect(self.updateKey)
+
+	def bind(self, modDict: dict):
+		self.modDict = modDict
+		self.blockSignals(True)
+		self.setChecked(self.modDict[self.modKey] != self.negate)
+		self.blockSignals(False)
 	
 	def updateKey(self):
 		self.modDict[self.modKey] = self.isChecked() != self.negate
-
-
-class InterfaceLabel(QWidget):
-	def __init__(self, node: Node, ifaceidx: int):
-		super(InterfaceLabel, self).__init__()
-		layout = QHBoxLayout()
-		self.node = node
-		self.ifidx = ifaceidx
-		self.deleteBtn : QPushButton | None = None
-		label = QLabel(f"Interface {ifaceidx+1}")
-		layout.addWidget(label)
-		if ifaceidx > 0:
-			deleteBtn = QPushButton("Delete IFACE")
-			deleteBtn.clicked.connect(lambda: (self.node.removeInterface(self.ifidx)))
-			layout.addWidget(deleteBtn)
-			self.deleteBtn = deleteBtn
-		self.setLayout(layout)
+		self.edited.emit()
 
 
 class InterfaceComboSelector(QComboBox):
-	def __init__(self, node: Node, edge: Edge):
+	def __init__(self):
 		super(InterfaceComboSelector, self).__init__()
+		self.node: NodeModel | None = None
+		self.edge: EdgeModel | None = None
+		self.currentIndexChanged.connect(lambda: self.edge.updateNodeInterface(self.node, self.currentIndex()) if self.edge is not None else None)
+
+	def bind(self, node: NodeModel, edge: EdgeModel):
+		self.blockSignals(True)
 		self.node = node
 		self.edge = edge
+		self.clear()
 		ni = node.nodeInfo["INTERFACES"]
 		for j in range(1, len(ni)+1):
 			self.addItem(f"{j} - {ni[j-1]['MAC']}")
-		self.setCurrentIndex(edge.getNodeInterfaceIndex(node))
-		self.currentIndexChanged.connect(lambda: self.edge.updateNodeInterface(self.node, self.currentIndex()))
+		index = edge.getNodeInterfaceIndex(node)
+		self.setCurrentIndex(-1 if index is None else index)
+		self.blockSignals(False)
+
+
+class InterfaceTableModel(QAbstractTableModel):
+	# Rows are the interfaces of the bound node, columns their keys
+	edited = Signal()
+	defaultKeys = {
+		"Host": ["IP", "MAC"],
+		"VM": ["ID", "MAC", "LINK_MAC"]
+	}
+
+	def __init__(self):
+		super(InterfaceTableModel, self).__init__()
+		self.node: NodeModel | None = None
+		self.interfaces: list[dict] = []
+		self.keys: list[str] = []
+
+	def bind(self, node: NodeModel):
+		self.beginResetModel()
+		self.node = node
+		self.interfaces = node.nodeInfo["INTERFACES"]
+		keys = dict.fromkeys(self.defaultKeys.get(node.type, []))
+		for iface in self.interfaces:
+			keys.update(dict.fromkeys(iface.keys()))
+		self.keys = list(keys)
+		self.endResetModel()
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.interfaces)
+
+	def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.keys)
+
+	def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+		if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+			value = self.interfaces[index.row()].get(self.keys[index.column()])
+			return "" if value is None else str(value)
+		return None
+
+	def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+		if role != Qt.ItemDataRole.DisplayRole:
+			return None
+		if orientation == Qt.Orientation.Horizontal:
+			return self.keys[section].replace("_", " ")
+		return str(section + 1)
+
+	def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+		return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+	def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+		if role != Qt.ItemDataRole.EditRole:
+			return False
+		self.interfaces[index.row()][self.keys[index.column()]] = value
+		self.dataChanged.emit(index, index)
+		self.edited.emit()
+		return True
+
+	def appendInterface(self, iface: dict):
+		row = len(self.interfaces)
+		self.beginInsertRows(QModelIndex(), row, row)
+		self.interfaces.append(iface)
+		self.endInsertRows()
+		self.edited.emit()
+
+	def removeInterface(self, row: int):
+		self.beginRemoveRows(QModelIndex(), row, row)
+		self.node.removeInterface(row)
+		self.endRemoveRows()
+		self.edited.emit()
+
+
+class InterfaceDelegate(QStyledItemDelegate):
+	# Validates edits with one validator per key, shared by the editors of all cells
+	ifaceKeyValidatorRegexTable = {
+		"IP": regexdef.ipv4, # Host
+		"MAC": regexdef.mac, # VM, Host
+		"ID": regexdef.defaultNaming, #VM
+		"LINK_MAC": regexdef.mac # VM
+	}
+
+	def __init__(self, model: InterfaceTableModel):
+		super(InterfaceDelegate, self).__init__()
+		self.model = model
+		self.validators = {k: QRegularExpressionValidator(QRegularExpression(regex)) for k, regex in self.ifaceKeyValidatorRegexTable.items()}
+
+	def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex) -> QWidget:
+		editor = QLineEdit(parent)
+		validator = self.validators.get(self.model.keys[index.column()])
+		if validator is not None:
+			editor.setValidator(validator)
+		return editor
+
+	def setEditorData(self, editor: QLineEdit, index: QModelIndex):
+		editor.setText(index.data(Qt.ItemDataRole.EditRole))
+
+	def setModelData(self, editor: QLineEdit, model: InterfaceTableModel, index: QModelIndex):
+		# Incomplete values are discarded, like in the line editors
+		if editor.hasAcceptableInput() and editor.text() != index.data(Qt.ItemDataRole.EditRole):
+			model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
 
 
 class InterfaceViewer(QWidget):
-	def __init__(self, node : Node):
+	edited = Signal()
+	maxVisibleRows = 10 # The table scrolls past this many interfaces
+
+	def __init__(self, node : Node, scene: SceneClass):
 		super(InterfaceViewer, self).__init__()
 		self.node = node
-
-		layout = QVBoxLayout()
-		self.setLayout(layout)
-		self.updateInterfaces()
-	
-	def updateInterfaces(self):
-		node = self.node
-		nodeInfo = node.nodeInfo
-		layout = self.layout()
-		clearLayout(layout)
-		ifaceKeyValidatorRegexTable = {
-			"IP": regexdef.ipv4, # Host
-			"MAC": regexdef.mac, # VM, Host
-			"ID": regexdef.defaultNaming, #VM
-			"LINK_MAC": regexdef.mac # VM
-		}
-		for i, interface in enumerate(nodeInfo["INTERFACES"]):
-			ilabel = self.createIfaceLabel(node, i)
-			layout.addWidget(ilabel)
-			for k in interface.keys():
-				layout.addWidget(ElementLineEditor(interface, k, ifaceKeyValidatorRegexTable[k]))
+		self.scene = scene
+		self.model = InterfaceTableModel()
+		self.model.edited.connect(self.edited)
+		self.delegate = InterfaceDelegate(self.model)
+
+		table = QTableView()
+		table.setModel(self.model)
+		table.setItemDelegate(self.delegate)
+		table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+		table.setEditTriggers(QAbstractItemView.EditTrigger.DoubleClicked | QAbstractItemView.EditTrigger.EditKeyPressed | QAbstractItemView.EditTrigger.AnyKeyPressed)
+		table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+		table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+		table.selectionModel().selectionChanged.connect(self.updateButtons)
+		self.table = table
 
 		newInterfaceButton = QPushButton(QIcon(":add.png"), "")
 		newInterfaceButton.setToolTip("Add new interface")
 		newInterfaceButton.clicked.connect(self.addInterface)
-		layout.addWidget(newInterfaceButton)
+		deleteButton = QPushButton("Delete IFACE")
+		deleteButton.setToolTip("Delete the selected interfaces")
+		deleteButton.clicked.connect(self.removeSelectedInterfaces)
+		self.deleteButton = deleteButton
+		buttons = QHBoxLayout()
+		buttons.addWidget(newInterfaceButton)
+		buttons.addWidget(deleteButton)
+
+		layout = QVBoxLayout()
+		layout.addWidget(table)
+		layout.addLayout(buttons)
+		self.setLayout(layout)
+		self.bind(node)
+
+	def bind(self, node: NodeModel):
+		self.node = node
+		self.model.bind(node)
+		self.updateHeight()
+		self.updateButtons()
+
+	def updateHeight(self):
+		rows = max(1, min(self.model.rowCount(), self.maxVisibleRows))
+		table = self.table
+		height = rows * table.verticalHeader().defaultSectionSize() + table.horizontalHeader().sizeHint().height() + 2 * table.frameWidth()
+		table.setFixedHeight(height)
+
+	def updateButtons(self):
+		# The first interface cannot be deleted
+		self.deleteButton.setEnabled(any(index.row() > 0 for index in self.table.selectionModel().selectedRows()))
 	
 	def addInterface(self):
 		node: Node = self.node
-		iface = {"IP": None, "MAC": "00:00:00:00:00:00"} if node.type == "Host" else {"ID": "", "MAC": "00:00:00:00:00:00", "LINK_MAC": ""}
-		node.nodeInfo["INTERFACES"].append(iface)
-		inum = len(node.nodeInfo["INTERFACES"])
-		layout : QVBoxLayout = self.layout()
-		ilabel = self.createIfaceLabel(node, inum-1)
-		button = layout.itemAt(layout.count()-1).widget()
-		layout.removeWidget(button)
-		layout.addWidget(ilabel)
-		for k in iface.keys():
-			layout.addWidget(ElementLineEditor(iface, k))
-		layout.addWidget(button)
-
-	def createIfaceLabel(self, node: Node, idx: int):
-		ilabel = InterfaceLabel(node, idx)
-		ideletebtn = ilabel.deleteBtn
-		if (ideletebtn is not None):
-			ideletebtn.clicked.connect(self.updateInterfaces)
-		return ilabel
+		mac = self.scene.getNewMACaddr()
+		iface = {"IP": None, "MAC": mac} if node.type == "Host" else {"ID": "", "MAC": mac, "LINK_MAC": ""}
+		self.model.appendInterface(iface)
+		self.updateHeight()
+		self.table.scrollToBottom()
+
+	def removeSelectedInterfaces(self):
+		rows = sorted({index.row() for index in self.table.selectionModel().selectedRows() if index.row() > 0}, reverse=True)
+		for row in rows:
+			self.model.removeInterface(row)
+		self.updateHeight()
+		self.updateButtons()
 
 
 class VMDiskEditor(QWidget):
+	edited = Signal()
+
 	def __init__(self, node: Node):
 		super(VMDiskEditor, self).__init__()
 		layout = QHBoxLayout()
 		label = QLabel("DISK:")
 		combo = VMDiskComboSelector(node)
+		combo.currentIndexChanged.connect(self.edited)
 		layout.addWidget(label)
 		layout.addWidget(combo)
 		self.setLayout(layout)
+		self.combo = combo
+
+	def bind(self, node: NodeModel):
+		self.combo.bind(node)
 
 
 class VMDiskComboSelector(QComboBox):
@@ -817,11 +1380,136 @@ class VMDiskComboSelector(QComboBox):
 			self.addItem(option)
 		self.setCurrentIndex(self.options.index(node.nodeInfo["DISK"]))
 		self.currentIndexChanged.connect(self.setVMDisk)
+
+	def bind(self, node: NodeModel):
+		self.node = node
+		self.blockSignals(True)
+		self.setCurrentIndex(self.options.index(node.nodeInfo["DISK"]))
+		self.blockSignals(False)
 	
 	def setVMDisk(self):
 		self.node.nodeInfo["DISK"] = self.options[self.currentIndex()]
 
 
+class BulkNodePanel(QWidget):
+	# Edits the nodes of one type selected together. Every editable key shows the value shared by
+	# all the nodes or "(mixed)", and a change is applied to all of them in one batch.
+	editableKeys = {
+		"VM": [("VNF", "check", None), ("MEMORY", "spin", (1, 4096)), ("VCPU", "spin", (1, 16)), ("DISK", "combo", VMDiskComboSelector.options)],
+		"Controller": [("PORT", "line", None)]
+	}
+
+	def __init__(self, type: str, scene: SceneClass):
+		super(BulkNodePanel, self).__init__()
+		self.scene = scene
+		self.nodes: list[NodeModel] = []
+		layout = QVBoxLayout()
+		layout.setContentsMargins(0, 0, 0, 0)
+		layout.setSpacing(0)
+		self.setLayout(layout)
+
+		self.titleLabel = QLabel()
+		self.titleLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+		layout.addWidget(self.titleLabel)
+		self.editors: list[BulkKeyEditor] = []
+		for key, kind, options in self.editableKeys.get(type, []):
+			editor = BulkKeyEditor(key, kind, options)
+			editor.edited.connect(self.setValue)
+			layout.addWidget(editor)
+			self.editors.append(editor)
+		# Keys that differ per node, such as addresses, are only summarized
+		self.summaryLabel = QLabel()
+		self.summaryLabel.setWordWrap(True)
+		layout.addWidget(self.summaryLabel)
+
+	def bind(self, nodes: list[NodeModel]):
+		self.nodes = nodes
+		self.titleLabel.setText(f"{len(nodes)} {nodes[0].type} nodes")
+		for editor in self.editors:
+			editor.bind(commonValue(node.nodeInfo.get(editor.key) for node in nodes))
+		editable = {editor.key for editor in self.editors}
+		keys = dict.fromkeys(k for node in nodes for k in node.nodeInfo.keys() if k not in editable)
+		lines = []
+		for key in keys:
+			if key == "INTERFACES":
+				counts = [len(node.nodeInfo.get(key, [])) for node in nodes]
+				lines.append(f"INTERFACES: {min(counts)}" + (f" to {max(counts)}" if max(counts) != min(counts) else "") + " per node")
+				continue
+			value = commonValue(node.nodeInfo.get(key) for node in nodes)
+			if isinstance(value, NodeModel):
+				value = value.getName()
+			lines.append(f"{key.replace('_', ' ')}: {'(mixed)' if value is MIXED else value}")
+		self.summaryLabel.setText("\n".join(lines))
+
+	def setValue(self, key: str, value):
+		self.scene.setNodesInfo(self.nodes, key, value)
+		self.bind(self.nodes)
+
+
+MIXED = object() # Value of a key that differs between the nodes edited together
+
+def commonValue(values) -> object:
+	first = MIXED
+	for i, value in enumerate(values):
+		if i == 0:
+			first = value
+		elif value != first:
+			return MIXED
+	return first
+
+
+class BulkKeyEditor(QWidget):
+	# Editor of one key for several nodes, which can show a mixed value
+	edited = Signal(str, object)
+
+	def __init__(self, key: str, kind: str, options):
+		super(BulkKeyEditor, self).__init__()
+		self.key = key
+		self.kind = kind
+		layout = QHBoxLayout()
+		if kind == "check":
+			editor = QCheckBox(key)
+			editor.clicked.connect(lambda checked: (editor.setTristate(False), self.edited.emit(self.key, checked)))
+		elif kind == "spin":
+			editor = QSpinBox()
+			# The value below the range stands for mixed values
+			editor.setRange(options[0] - 1, options[1])
+			editor.setSpecialValueText("(mixed)")
+			editor.setKeyboardTracking(False)
+			editor.valueChanged.connect(lambda value: self.edited.emit(self.key, value) if value >= options[0] else None)
+		elif kind == "combo":
+			editor = QComboBox()
+			editor.addItems(options)
+			editor.currentIndexChanged.connect(lambda index: self.edited.emit(self.key, options[index]) if index >= 0 else None)
+		else:
+			editor = QLineEdit()
+			editor.editingFinished.connect(lambda: self.edited.emit(self.key, editor.text()) if editor.text() != "" and editor.isModified() else None)
+		if kind != "check":
+			editor.setFixedWidth(110)
+			layout.addWidget(QLabel(f"{key.replace('_', ' ')}:"))
+		layout.addWidget(editor)
+		self.setLayout(layout)
+		self.editor = editor
+		self.options = options
+
+	def bind(self, value):
+		editor = self.editor
+		editor.blockSignals(True)
+		if self.kind == "check":
+			editor.setTristate(value is MIXED)
+			editor.setCheckState(Qt.CheckState.PartiallyChecked if value is MIXED else Qt.CheckState.Checked if value else Qt.CheckState.Unchecked)
+		elif self.kind == "spin":
+			editor.setValue(editor.minimum() if value is MIXED or value is None else value)
+		elif self.kind == "combo":
+			editor.setCurrentIndex(self.options.index(value) if value in self.options else -1)
+			editor.setPlaceholderText("(mixed)")
+		else:
+			editor.setText("" if value is MIXED or value is None else str(value))
+			editor.setPlaceholderText("(mixed)")
+			editor.setModified(False)
+		editor.blockSignals(False)
+
+
 class CreationOptions(QWidget):
 	class NodeTypeOptionButton(QPushButton):
 		def __init__(self, text: str, parent: CreationOptions):
@@ -849,7 +1537,510 @@ class CreationOptions(QWidget):
 		self.scene = scene
 
 
+class MinimapWidget(QWidget):
+	# Low resolution image of the whole scene. Only the regions reported as changed are
+	# drawn again, and the viewport rectangle is painted over the cached image.
+	def __init__(self, view: ViewClass):
+		super(MinimapWidget, self).__init__()
+		self.view = view
+		self.scene: SceneClass = view.scene
+		self.image = QImage()
+		self.transform = QTransform()
+		self.dirty: list[QRectF] = []
+		self.fullRefresh = True
+		self.lastRefreshTime = 0.0
+		self.setMinimumSize(200, 150)
+		self.setCursor(Qt.CursorShape.OpenHandCursor)
+		self.refreshTimer = QTimer()
+		self.refreshTimer.setSingleShot(True)
+		self.refreshTimer.setInterval(50)
+		self.refreshTimer.timeout.connect(self.refresh)
+		self.scene.changed.connect(self.markDirty)
+		self.scene.sceneRectChanged.connect(self.invalidate)
+		self.scene.modelRegionChanged.connect(self.markRegion)
+		view.viewportMoved.connect(self.update)
+
+	def invalidate(self):
+		self.fullRefresh = True
+		self.refreshTimer.start()
+
+	def markRegion(self, rect: QRectF):
+		if rect.isNull():
+			self.invalidate()
+		else: self.markDirty([rect])
+
+	def markDirty(self, rects: list[QRectF]):
+		self.dirty.extend(rects)
+		if not self.refreshTimer.isActive():
+			self.refreshTimer.start()
+
+	def updateTransform(self):
+		sceneRect = self.scene.sceneRect()
+		scale = min(self.width() / sceneRect.width(), self.height() / sceneRect.height())
+		dx = (self.width() - sceneRect.width() * scale) / 2
+		dy = (self.height() - sceneRect.height() * scale) / 2
+		self.transform = QTransform(scale, 0, 0, scale, dx - sceneRect.left() * scale, dy - sceneRect.top() * scale)
+
+	def refresh(self):
+		start = time.perf_counter()
+		if self.fullRefresh or self.image.size() != self.size():
+			self.image = QImage(self.size(), QImage.Format.Format_RGB32)
+			self.updateTransform()
+			regions = [self.scene.sceneRect()]
+		elif len(self.dirty) > 16:
+			region = QRectF()
+			for r in self.dirty:
+				region = region.united(r)
+			regions = [region]
+		else: regions = self.dirty
+		self.fullRefresh = False
+		self.dirty = []
+
+		painter = QPainter(self.image)
+		painter.setTransform(self.transform)
+		for region in regions:
+			painter.setClipRect(region)
+			painter.fillRect(region, QColor(210, 210, 210))
+			self.paintElements(painter, region)
+		painter.end()
+		self.lastRefreshTime = time.perf_counter() - start
+		self.setToolTip(f"Last refresh: {self.lastRefreshTime*1000:.1f} ms")
+		self.update()
+
+	def paintElements(self, painter: QPainter, region: QRectF):
+		nodes, edges, groups, summaries = self.scene.overviewElements(region)
+		painter.setPen(QPen(QColor(60, 60, 60), 0))
+		painter.drawLines([QLineF(e.nodes[0].pos(), e.nodes[1].pos()) for e in edges])
+		painter.drawLines([s.line() for s in summaries])
+		byType: dict[str, list[QPointF]] = {}
+		for n in nodes:
+			byType.setdefault(n.type, []).append(n.pos())
+		for t, points in byType.items():
+			painter.setPen(QPen(Node.nodeColorTable[t], max(2*NODE_RAD, 3 / self.transform.m11())))
+			painter.drawPoints(points)
+		painter.setPen(QPen(QColor(160, 160, 160), max(3*NODE_RAD, 4 / self.transform.m11())))
+		painter.drawPoints([g.pos() for g in groups])
+
+	def paintEvent(self, event: QPaintEvent) -> None:
+		if self.image.size() != self.size():
+			self.invalidate()
+		painter = QPainter(self)
+		painter.drawImage(0, 0, self.image)
+		painter.setPen(QPen(QColor(200, 30, 30), 2))
+		painter.drawRect(self.transform.mapRect(self.view.visibleSceneRect()))
+		painter.end()
+
+	def mousePressEvent(self, event: QMouseEvent) -> None:
+		self.centerViewAt(event.position())
+
+	def mouseMoveEvent(self, event: QMouseEvent) -> None:
+		if event.buttons() & Qt.MouseButton.LeftButton:
+			self.centerViewAt(event.position())
+
+	def centerViewAt(self, pos: QPointF):
+		inverted, ok = self.transform.inverted()
+		if ok:
+			self.view.centerOn(inverted.map(pos))
+
+
+class SearchWidget(QWidget):
+	# Prefix search over the scene's search index; activating a result selects and centers the node
+	def __init__(self, view: ViewClass):
+		super(SearchWidget, self).__init__()
+		self.view = view
+		self.scene: SceneClass = view.scene
+		self.lineEdit = QLineEdit()
+		self.lineEdit.setPlaceholderText("Name, IP, MAC, type or disk")
+		self.lineEdit.setToolTip("Prefix search. Restrict it to one field with name:, type:, ip:, mac:, management_mac: or disk:")
+		self.lineEdit.setClearButtonEnabled(True)
+		self.lineEdit.textChanged.connect(self.search)
+		self.lineEdit.returnPressed.connect(self.focusFirst)
+		self.results = QListWidget()
+		self.results.itemActivated.connect(self.focusResult)
+		self.results.itemClicked.connect(self.focusResult)
+		self.status = QLabel()
+		layout = QVBoxLayout()
+		layout.addWidget(self.lineEdit)
+		layout.addWidget(self.results)
+		layout.addWidget(self.status)
+		self.setLayout(layout)
+
+	def search(self):
+		self.results.clear()
+		text = self.lineEdit.text()
+		limit = 200
+		start = time.perf_counter()
+		matches = self.scene.searchIndex.query(text, limit)
+		elapsed = time.perf_counter() - start
+		for name, field, value in matches:
+			item = QListWidgetItem(name if field == "name" else f"{name} ({field.replace('_', ' ')}: {value})")
+			item.setData(Qt.ItemDataRole.UserRole, name)
+			self.results.addItem(item)
+		if text.strip() == "":
+			self.status.setText("")
+		else: self.status.setText(f"{len(matches)}{'+' if len(matches) == limit else ''} results in {elapsed*1000:.2f} ms")
+
+	def focusFirst(self):
+		if self.results.count() > 0:
+			self.results.setCurrentRow(0)
+			self.focusResult(self.results.item(0))
+
+	def focusResult(self, item: QListWidgetItem):
+		self.scene.focusNode(item.data(Qt.ItemDataRole.UserRole))
+
+	def focusInput(self):
+		self.lineEdit.setFocus()
+		self.lineEdit.selectAll()
+
+
+class IssuesWidget(QWidget):
+	# Live list of the scene validator's issues, refreshed at most every 200 ms
+	maxShown = 500
+
+	def __init__(self, view: ViewClass):
+		super(IssuesWidget, self).__init__()
+		self.view = view
+		self.scene: SceneClass = view.scene
+		self.summary = QLabel()
+		self.list = QListWidget()
+		self.list.itemActivated.connect(self.focusIssue)
+		self.list.itemClicked.connect(self.focusIssue)
+		self.icons = {
+			validation.ERROR: self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxCritical),
+			validation.WARNING: self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning)
+		}
+		layout = QVBoxLayout()
+		layout.addWidget(self.summary)
+		layout.addWidget(self.list)
+		self.setLayout(layout)
+		self.refreshTimer = QTimer()
+		self.refreshTimer.setSingleShot(True)
+		self.refreshTimer.setInterval(200)
+		self.refreshTimer.timeout.connect(self.refresh)
+		self.scene.issuesChanged.connect(self.scheduleRefresh)
+		self.refresh()
+
+	def scheduleRefresh(self):
+		if not self.refreshTimer.isActive():
+			self.refreshTimer.start()
+
+	def refresh(self):
+		validator = self.scene.validator
+		self.list.clear()
+		for issue in itertools.islice(validator.allIssues(), self.maxShown):
+			item = QListWidgetItem(self.icons[issue.severity], issue.message)
+			item.setData(Qt.ItemDataRole.UserRole, issue.nodes[0])
+			self.list.addItem(item)
+		total = validator.errorCount + validator.warningCount
+		summary = f"{validator.errorCount} errors, {validator.warningCount} warnings"
+		if total > self.maxShown:
+			summary += f" (showing {self.maxShown})"
+		self.summary.setText(summary)
+
+	def focusIssue(self, item: QListWidgetItem):
+		self.scene.focusNode(item.data(Qt.ItemDataRole.UserRole))
+
+
+class ReachabilityWidget(QWidget):
+	# Connected parts of the topology, the hosts that cannot reach a target node and the shortest
+	# path between two selected nodes. Split components and new paths are computed on a worker thread.
+	maxShown = 500
+
+	def __init__(self, view: ViewClass):
+		super(ReachabilityWidget, self).__init__()
+		self.view = view
+		self.scene: SceneClass = view.scene
+		self.target: str | None = None
+		self.query: tuple[str, str] | None = None
+		self.workers: list[ReachabilityWorker] = []
+		self.summary = QLabel()
+		layout = QVBoxLayout()
+		layout.addWidget(self.summary)
+		typesRow = QHBoxLayout()
+		typesRow.addWidget(QLabel("Through:"))
+		self.typeBoxes: dict[str, QCheckBox] = {}
+		for type in Node.nodeColorTable:
+			box = QCheckBox(type)
+			box.setChecked(type in reachability.DEFAULT_TYPES)
+			box.toggled.connect(self.setTypes)
+			typesRow.addWidget(box)
+			self.typeBoxes[type] = box
+		layout.addLayout(typesRow)
+		targetButton = QPushButton("Check hosts against the selected node")
+		targetButton.clicked.connect(self.setTarget)
+		layout.addWidget(targetButton)
+		self.targetLabel = QLabel()
+		layout.addWidget(self.targetLabel)
+		self.list = QListWidget()
+		self.list.itemActivated.connect(self.focusHost)
+		self.list.itemClicked.connect(self.focusHost)
+		layout.addWidget(self.list)
+		pathButton = QPushButton("Path between the two selected nodes")
+		pathButton.clicked.connect(self.setQuery)
+		layout.addWidget(pathButton)
+		self.pathLabel = QLabel()
+		self.pathLabel.setWordWrap(True)
+		layout.addWidget(self.pathLabel)
+		self.setLayout(layout)
+		self.refreshTimer = QTimer()
+		self.refreshTimer.setSingleShot(True)
+		self.refreshTimer.setInterval(200)
+		self.refreshTimer.timeout.connect(self.refresh)
+		self.scene.reachabilityChanged.connect(self.scheduleRefresh)
+		self.refresh()
+
+	def scheduleRefresh(self):
+		if not self.refreshTimer.isActive():
+			self.refreshTimer.start()
+
+	def setTypes(self):
+		self.scene.setReachabilityTypes([type for type, box in self.typeBoxes.items() if box.isChecked()])
+
+	def setTarget(self):
+		node = self.scene.firstSelectedNode()
+		self.target = None if node is None else node.getName()
+		self.refresh()
+
+	def setQuery(self):
+		nodes = self.scene.selectedNodeModels()
+		self.query = (nodes[0].getName(), nodes[1].getName()) if len(nodes) >= 2 else None
+		self.refresh()
+
+	def refresh(self):
+		if len(self.workers) > 0:
+			# Refreshed again once the running job is applied
+			return
+		index = self.scene.reachability
+		job = index.job([] if self.query is None else [self.query])
+		if len(job.stale) == 0 and len(job.queries) == 0:
+			index.apply(job, ({}, {}))
+			self.showResults()
+			return
+		worker = ReachabilityWorker(job)
+		worker.resultReady.connect(self.applyResult)
+		worker.finished.connect(lambda: self.workers.remove(worker))
+		self.workers.append(worker)
+		self.summary.setText("Updating...")
+		worker.start()
+
+	def applyResult(self, job: reachability.Job, result):
+		if self.scene.reachability.apply(job, result):
+			self.showResults()
+		# Jobs made before the last change are dropped and made again
+		self.scheduleRefresh()
+
+	def showResults(self):
+		index = self.scene.reachability
+		self.summary.setText(f"{index.componentCount()} connected parts of {len(index.adjacency)} nodes")
+		self.list.clear()
+		if self.target is not None and not self.scene.hasNode(self.target):
+			self.target = None
+		if self.target is None:
+			self.targetLabel.setText("No target node")
+		elif self.target not in index.adjacency:
+			self.targetLabel.setText(f"{self.target} is not one of the types links go through")
+		else:
+			unreachable = [name for name, obj in self.scene.netgraph.nodes(data="obj") if obj.type == "Host" and name != self.target and not index.connected(name, self.target)]
+			self.targetLabel.setText(f"{len(unreachable)} hosts cannot reach {self.target}")
+			for name in unreachable[:self.maxShown]:
+				self.list.addItem(name)
+		path = None
+		if self.query is not None and all(self.scene.hasNode(n) for n in self.query):
+			path = index.path(*self.query)
+			if path is None:
+				self.pathLabel.setText(f"No path from {self.query[0]} to {self.query[1]}")
+			else: self.pathLabel.setText(f"{len(path) - 1} links: {' - '.join(path)}")
+		else:
+			self.query = None
+			self.pathLabel.setText("")
+		self.scene.highlightPath(path or [])
+
+	def focusHost(self, item: QListWidgetItem):
+		self.scene.focusNode(item.text())
+
+
+class PerformanceWidget(QWidget):
+	# Counters sampled while the panel is shown, with their change since the first sample. Memory
+	# is estimated from a sample of each kind of object. Counting items walks the whole scene, so
+	# samples are spaced out further when they get slow.
+	minInterval = 1000
+
+	def __init__(self, window: WindowClass):
+		super(PerformanceWidget, self).__init__()
+		self.window = window
+		self.view: ViewClass = window.view
+		self.tree = QTreeWidget()
+		self.tree.setColumnCount(3)
+		self.tree.setHeaderLabels(["Counter", "Value", "Change"])
+		self.rows: dict[tuple[str, str], QTreeWidgetItem] = {}
+		self.first: dict[tuple[str, str], float] = {}
+		self.lastSample = (time.perf_counter(), 0)
+		resetButton = QPushButton("Reset changes")
+		resetButton.clicked.connect(self.first.clear)
+		layout = QVBoxLayout()
+		layout.addWidget(self.tree)
+		layout.addWidget(resetButton)
+		self.setLayout(layout)
+		self.timer = QTimer()
+		self.timer.setInterval(self.minInterval)
+		self.timer.timeout.connect(self.sample)
+
+	def showEvent(self, event: QShowEvent) -> None:
+		super().showEvent(event)
+		self.sample()
+		self.timer.start()
+
+	def hideEvent(self, event: QHideEvent) -> None:
+		super().hideEvent(event)
+		self.timer.stop()
+
+	def counters(self) -> dict[str, list[tuple[str, float, str]]]:
+		# Group -> (counter, value, unit)
+		scene = self.view.scene
+		G = scene.netgraph
+		items = scene.items()
+		itemTypes: dict[str, int] = {}
+		for item in items:
+			name = type(item).__name__
+			itemTypes[name] = itemTypes.get(name, 0) + 1
+		now, frames = time.perf_counter(), self.view.frameCount
+		elapsed = now - self.lastSample[0]
+		fps = (frames - self.lastSample[1]) / elapsed if elapsed > 0 else 0.0
+		self.lastSample = (now, frames)
+		viewer = self.window.editMenu.elementViewer
+		memory = [
+			("Node info", counters.sampled_size((obj.nodeInfo for _, obj in G.nodes(data="obj")), G.number_of_nodes()), "bytes"),
+			("Graph adjacency and link info", counters.sampled_size((neighbours for _, neighbours in G.adjacency()), G.number_of_nodes()), "bytes"),
+			("Scene items, Python side", counters.sampled_size(iter(items), len(items), measure=lambda item: sys.getsizeof(item) + sys.getsizeof(getattr(item, "__dict__", None))), "bytes"),
+			("Reachability index", counters.sampled_size(iter(scene.reachability.adjacency.values()), len(scene.reachability.adjacency)), "bytes")
+		]
+		rss = counters.process_memory()
+		if rss is not None:
+			memory.append(("Process", rss, "bytes"))
+		return {
+			"Scene items": [(name, count, "count") for name, count in sorted(itemTypes.items())] + [("Total", len(items), "count")],
+			"Graph": [("Nodes", G.number_of_nodes(), "count"), ("Links", G.number_of_edges(), "count")],
+			"Memory": memory,
+			"Element viewer": [("Panels", len(viewer.panels), "count"), ("Widgets", len(viewer.findChildren(QWidget)), "count")],
+			"Painting": [("Last frame", self.view.frameTime * 1000, "ms"), ("Last repaint region", self.view.paintedPixels, "pixels"), ("Frames per second", fps, "rate")],
+			"Last operations": [(operation, seconds * 1000, "ms") for operation, seconds in sorted(counters.durations.items())]
+		}
+
+	def format(self, value: float, unit: str) -> str:
+		if unit == "bytes":
+			return counters.format_bytes(value)
+		if unit == "ms":
+			return f"{value:.1f} ms"
+		if unit == "rate":
+			return f"{value:.1f}"
+		return f"{value:,.0f}"
+
+	def sample(self):
+		start = time.perf_counter()
+		for group, values in self.counters().items():
+			parent = self.rows.get((group, ""))
+			if parent is None:
+				parent = QTreeWidgetItem(self.tree, [group])
+				parent.setExpanded(True)
+				self.rows[(group, "")] = parent
+			for name, value, unit in values:
+				key = (group, name)
+				row = self.rows.get(key)
+				if row is None:
+					row = QTreeWidgetItem(parent, [name])
+					self.rows[key] = row
+				row.setText(1, self.format(value, unit))
+				if unit in ("count", "bytes"):
+					change = value - self.first.setdefault(key, value)
+					row.setText(2, "" if change == 0 else ("+" if change > 0 else "-") + self.format(abs(change), unit))
+		self.tree.resizeColumnToContents(0)
+		self.timer.setInterval(max(self.minInterval, int((time.perf_counter() - start) * 20000)))
+
+
+class ReachabilityWorker(QThread):
+	resultReady = Signal(object, object)
+
+	def __init__(self, job: reachability.Job):
+		super(ReachabilityWorker, self).__init__()
+		self.job = job
+
+	def run(self):
+		self.resultReady.emit(self.job, reachability.solve(self.job))
+
+
+class LayoutWorker(QThread):
+	layoutReady = Signal(list, list)
+
+	def __init__(self, method: str, names: list[str], types: list[str], edges: list[tuple[int, int]], positions: list[tuple[float, float]], fixed: list[bool]):
+		super(LayoutWorker, self).__init__()
+		self.method = method
+		self.names = names
+		self.types = types
+		self.edges = edges
+		self.positions = positions
+		self.fixed = fixed
+
+	def run(self):
+		if self.method == "HIERARCHICAL":
+			positions = layout_engine.hierarchical_layout(self.types, self.edges)
+		else:
+			initial = self.positions if any(self.fixed) else None
+			positions = layout_engine.force_directed_layout(len(self.names), self.edges, initial, self.fixed)
+		self.layoutReady.emit(self.names, positions.tolist())
+
+
+class ImportWorker(QThread):
+	# Reads a NIEP topology with its VM and VNF files and places the nodes, which have no positions,
+	# in tiers by type: the hierarchical layout takes a fraction of the force-directed one on large labs
+	topologyReady = Signal(object, float)
+	failed = Signal(str)
+
+	def __init__(self, path: str):
+		super(ImportWorker, self).__init__()
+		self.path = path
+
+	def run(self):
+		start = time.perf_counter()
+		try:
+			topo = file_export.load_NIEP_topology(self.path)
+			names = [name for name, _, _ in validation.npgi_nodes(topo)]
+			types = [type for _, type, _ in validation.npgi_nodes(topo)]
+			index = {name: i for i, name in enumerate(names)}
+			mininet = topo["TOPO"]["MININET"]
+			links = [(c["IN/OUT"], c["OUT/IN"]) for c in topo["TOPO"]["CONNECTIONS"]]
+			links += [(ovs["ID"], ovs["CONTROLLER"]) for ovs in mininet["OVSWITCHES"] if ovs["CONTROLLER"] is not None]
+		except (OSError, ValueError, KeyError, TypeError) as e:
+			self.failed.emit(f"{self.path}: {e}")
+			return
+		edges = [(index[u], index[v]) for u, v in links if u in index and v in index]
+		if len(names) > 0:
+			with tracing.span("ImportWorker.layout", nodes=len(types)):
+				positions = layout_engine.hierarchical_layout(types, edges)
+			topo["POSITIONS"] = dict(zip(names, positions.tolist()))
+		self.topologyReady.emit(topo, (time.perf_counter() - start) * 1000)
+
+
+class SubnetWorker(QThread):
+	reportReady = Signal(object, object, object, object, float)
+
+	def __init__(self, owners: list[NodeModel], addresses: list[str], elementCount: int, links: list[int], linkEdges: dict[int, list[EdgeModel]]):
+		super(SubnetWorker, self).__init__()
+		self.owners = owners
+		self.addresses = addresses
+		self.elementCount = elementCount
+		self.links = links
+		self.linkEdges = linkEdges
+
+	def run(self):
+		start = time.perf_counter()
+		report = subnet_analysis.analyze_subnets(self.addresses, self.elementCount, self.links)
+		messages, linkMessages = subnet_analysis.interface_messages(report, self.addresses)
+		self.reportReady.emit(self.owners, self.linkEdges, messages, linkMessages, (time.perf_counter() - start) * 1000)
+
+
 class ViewClass(QGraphicsView):
+	viewportMoved = Signal()
+
 	def __init__(self, editMenu: EditMenu):
 		super(ViewClass, self).__init__()
 
@@ -858,6 +2049,10 @@ class ViewClass(QGraphicsView):
 		self.scene : SceneClass = SceneClass(editMenu)
 		self.setScene(self.scene)
 		self.setRenderHint(QPainter.Antialiasing)
+		# Last frame, for the performance panel
+		self.frameCount = 0
+		self.frameTime = 0.0
+		self.paintedPixels = 0
 	
 	def zoom(self, angleDelta: int, center: QPointF):
 		if (angleDelta < 0):
@@ -865,22 +2060,68 @@ class ViewClass(QGraphicsView):
 		else: factor = (1.0 + angleDelta*0.008)
 		self.centerOn(center)
 		self.scale(factor, factor)
+		self.scene.viewportChanged()
+		self.viewportMoved.emit()
+
+	def visibleSceneRect(self) -> QRectF:
+		return self.mapToScene(self.viewport().rect()).boundingRect()
+
+	def scrollContentsBy(self, dx: int, dy: int) -> None:
+		super().scrollContentsBy(dx, dy)
+		self.scene.viewportChanged()
+		self.viewportMoved.emit()
+
+	def resizeEvent(self, event: QResizeEvent) -> None:
+		super().resizeEvent(event)
+		self.scene.viewportChanged()
+		self.viewportMoved.emit()
+
+	def paintEvent(self, event: QPaintEvent) -> None:
+		start = time.perf_counter()
+		self.paintedPixels = sum(rect.width() * rect.height() for rect in event.region())
+		with tracing.span("ViewClass.paint", pixels=self.paintedPixels):
+			super().paintEvent(event)
+		self.frameTime = time.perf_counter() - start
+		self.frameCount += 1
 
 
 class SceneClass(QGraphicsScene):
+	# Emitted for changes that may not go through an item, a null rectangle meaning the whole scene
+	modelRegionChanged = Signal(QRectF)
+	issuesChanged = Signal()
+	reachabilityChanged = Signal()
+	selectionSettled = Signal() # selectionChanged coalesced to once per event loop iteration
+
 	def __init__(self, editMenu: EditMenu):
 		super(SceneClass, self).__init__()
 		self.setSceneRect(-500, -500, 1000, 1000)
 		self.grid = 40
 		self.toolMode = ToolMode.SELECT
-		self.netgraph = nx.Graph()
+		self._netgraph: nx.Graph | None = None
 		editMenu.setScene(self)
-		self.ipv4gen = createIPv4Generator()
-		self.macaddrgen = createMACAddrGenerator()
+		self.addresses = address_pool.AddressAllocator()
 		self.newNodeType = "Host"
+		self.virtualizer: SceneVirtualizer | None = None
+		self.generation = 0 # Incremented whenever the topology is replaced
+		self.groups: list[NodeGroup] = []
+		self.groupEdgesByNode: dict[NodeModel, list[SummaryEdge]] = {}
+		self.groupCount = 0
+		self.searchIndex = search_index.SearchIndex()
 
 		self.onclick = None
-		self.nodeNameGenerators = self.createNodeNameGenerators(["Host", "Switch", "Controller", "OVSwitch", "VM"])
+		self.names = name_allocator.NameAllocator()
+		self.validator = validation.TopologyValidator(self.issuesChanged.emit)
+		self.reachability = reachability.ReachabilityIndex(onChange=self.reachabilityChanged.emit)
+		self.highlighted: list[EdgeModel] = []
+		self.annotated: list[NodeModel | EdgeModel] = []
+		# Selected items in selection order, kept up to date by the items themselves
+		self.selection: dict[QGraphicsItem, None] = {}
+		self.selectedNodes: dict[Node, None] = {}
+		self.selectionTimer = QTimer()
+		self.selectionTimer.setSingleShot(True)
+		self.selectionTimer.setInterval(0)
+		self.selectionTimer.timeout.connect(self.selectionSettled)
+		self.selectionChanged.connect(self.selectionTimer.start)
 		self.tools = {
 			ToolMode.SELECT.value: (None, None),
 			ToolMode.NEW.value: (self.setToolNew, self.unsetToolNew),
@@ -889,6 +2130,18 @@ class SceneClass(QGraphicsScene):
 			ToolMode.DELETE.value: (self.setToolDelete, None)
 		}
 		
+	@property
+	def netgraph(self) -> nx.Graph:
+		# Created on first use, so that networkx is not needed to show an empty scene
+		if self._netgraph is None:
+			self._netgraph = nx.Graph()
+		return self._netgraph
+
+	@netgraph.setter
+	def netgraph(self, graph: nx.Graph):
+		self._netgraph = graph
+
+	@tracing.traced("SceneClass.drawBackground")
 	def drawBackground(self, painter, rect):
 		painter.fillRect(rect, QColor(210, 210, 210))
 		left = int(rect.left()) - int((rect.left()) % self.grid)
@@ -903,32 +2156,27 @@ class SceneClass(QGraphicsScene):
 		painter.setPen(QPen(QColor(150, 150, 150)))
 		painter.drawLines(lines)
 
+	@tracing.traced("SceneClass.mousePress")
 	def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
 		if event.button() == Qt.LeftButton:
 			if self.onclick != None:
 				self.onclick(event)
-		prevSel = self.selectedItems()
-		prevSelNodes = list(filter(lambda i: type(i) == Node, prevSel))
+		v = self.firstSelectedNode()
 		super(SceneClass, self).mousePressEvent(event) # This updates the selected elements
 
-		currSel = self.selectedItems()
-		currSelNodes = list(filter(lambda i: type(i) == Node, currSel))
-		if self.toolMode == ToolMode.DELETE and len(currSel) > 0:
-			self.remove(currSel[0])
-		if len(currSelNodes) > 0:
-			u = currSelNodes[0]
-			if len(prevSelNodes) > 0:
-				v = prevSelNodes[0]
-				if self.toolMode == ToolMode.CONNECT:
-					self.connectNodes(v, u, {"INTERFACES": [0, 0]})
+		if self.toolMode == ToolMode.DELETE:
+			self.removeElements(self.selectedElements())
+		u = self.firstSelectedNode()
+		if u is not None and v is not None and self.toolMode == ToolMode.CONNECT:
+			self.connectNodes(v, u, {"INTERFACES": [0, 0]})
 	
 	def validateConnection(self, u: Node, v: Node) -> bool:
 		if u is v or self.netgraph.has_edge(u.getName(), v.getName()):
 			return False
 		validConnectionsTable = {
 			"Host": {"Host", "Switch", "OVSwitch", "VM"},
-			"Switch": {"Host", "VM"},
-			"OVSwitch": {"Host", "VM", "Controller"},
+			"Switch": {"Host", "VM", "Switch", "OVSwitch"},
+			"OVSwitch": {"Host", "VM", "Controller", "Switch", "OVSwitch"},
 			"Controller": {"OVSwitch"},
 			"VM": {"Host", "Switch", "OVSwitch", "VM"}
 		}
@@ -940,16 +2188,25 @@ class SceneClass(QGraphicsScene):
 		return self.toolFunctions[self.toolMode.value]
 	
 	def getNewIPv4addr(self):
-		return next(self.ipv4gen)
+		return self.addresses.newIPv4()
 	
 	def getNewMACaddr(self):
-		return next(self.macaddrgen)
+		return self.addresses.newMAC()
 	
-	def addNode(self, id: str, position: QPointF, type: str, nodeInfo: dict = {}) -> Node:
-		node = Node(id, type, nodeInfo)
+	def addNode(self, id: str, position: QPointF, type: str, nodeInfo: dict = {}) -> Node | VirtualNode:
+		if self.virtualizer is not None:
+			node = VirtualNode(id, type, nodeInfo)
+		else: node = Node(id, type, nodeInfo)
 		self.netgraph.add_node(id, obj=node, info=nodeInfo)
 		node.setPos(position)
-		self.addItem(node)
+		if self.virtualizer is not None:
+			self.virtualizer.addNode(node)
+		else: self.addItem(node)
+		self.indexNode(node)
+		self.addresses.setNode(id, type, nodeInfo)
+		self.names.add(id)
+		self.validator.setNode(id, type, nodeInfo)
+		self.reachability.addNode(id, type)
 
 		return node
 	
@@ -960,43 +2217,121 @@ class SceneClass(QGraphicsScene):
 		if self.netgraph.has_node(newName):
 			return False
 		self.netgraph = nx.relabel_nodes(self.netgraph, {nodeName: newName})
-		self.getNode(newName)["obj"].setName(newName)
+		node = self.getNode(newName)["obj"]
+		node.setName(newName)
+		self.searchIndex.renameNode(nodeName, newName, search_index.node_terms(newName, node.type, node.nodeInfo))
+		self.addresses.renameNode(nodeName, newName)
+		self.names.rename(nodeName, newName)
+		self.validator.renameNode(nodeName, newName)
+		self.reachability.renameNode(nodeName, newName, node.type)
 
 		return True
+
+	def indexNode(self, node: NodeModel):
+		name = node.getName()
+		self.searchIndex.addNode(name, search_index.node_terms(name, node.type, node.nodeInfo))
+
+	def nodeInfoChanged(self, node: NodeModel):
+		# Called by the editors after they modify a node's nodeInfo
+		self.indexNode(node)
+		self.addresses.setNode(node.getName(), node.type, node.nodeInfo)
+		self.validator.setNode(node.getName(), node.type, node.nodeInfo)
+
+	def setNodesInfo(self, nodes: list[NodeModel], key: str, value):
+		# Sets one nodeInfo key on many nodes, then updates the indexes of each node once
+		for node in nodes:
+			node.nodeInfo[key] = value
+		for node in nodes:
+			self.nodeInfoChanged(node)
+
+	def edgeInfoChanged(self, edge: EdgeModel):
+		self.validator.setEdge(edge.nodes[0].getName(), edge.nodes[1].getName(), edge.edgeInfo)
 	
+	def defaultNodeInfo(self, type: str, interfaces: int = 1, ips: list[str] | None = None) -> dict:
+		# nodeInfo of a new node, with new addresses. Host interfaces take ips when given.
+		if type == "Host":
+			ips = [self.getNewIPv4addr() for _ in range(interfaces)] if ips is None else ips
+			return {"INTERFACES": [{"IP": ip, "MAC": self.getNewMACaddr()} for ip in ips]}
+		if type == "Controller":
+			return {"IP": self.getNewIPv4addr(), "PORT": "3000"}
+		if type == "OVSwitch":
+			return {"CONTROLLER": None}
+		if type == "VM":
+			return {
+				"VNF": False,
+				"MEMORY": 300,
+				"VCPU": 1,
+				"DISK": "click-on-osv",
+				"MANAGEMENT_MAC": self.getNewMACaddr(),
+				"INTERFACES": [{"ID": f"br{i}", "MAC": self.getNewMACaddr(), "LINK_MAC": ""} for i in range(interfaces)]
+			}
+		return {}
+
 	def addDefaultHostNode(self, position: QPointF) -> Node:
-		return self.addNode(self.getNodeName("Host"), position, "Host", {
-			"INTERFACES": [
-				{"IP": self.getNewIPv4addr(), "MAC": self.getNewMACaddr()},
-			]})
+		return self.addNode(self.getNodeName("Host"), position, "Host", self.defaultNodeInfo("Host"))
 	
 	def addDefaultSwitchNode(self, position: QPointF) -> Node:
-		return self.addNode(self.getNodeName("Switch"), position, "Switch", {})
+		return self.addNode(self.getNodeName("Switch"), position, "Switch", self.defaultNodeInfo("Switch"))
 	
 	def addDefaultControllerNode(self, position: QPointF) -> Node:
-		return self.addNode(self.getNodeName("Controller"), position, "Controller", {
-				"IP": self.getNewIPv4addr(),
-				"PORT": "3000"
-			})
+		return self.addNode(self.getNodeName("Controller"), position, "Controller", self.defaultNodeInfo("Controller"))
 	
 	def addDefaultOVSwitchNode(self, position: QPointF) -> Node:
-		return self.addNode(self.getNodeName("OVSwitch"), position, "OVSwitch", {"CONTROLLER": None})
+		return self.addNode(self.getNodeName("OVSwitch"), position, "OVSwitch", self.defaultNodeInfo("OVSwitch"))
 	
 	def addDefaultVMNode(self, position: QPointF) -> Node:
-		return self.addNode(self.getNodeName("VM"), position, "VM", {
-			"VNF": False,
-			"MEMORY": 300,
-			"VCPU": 1,
-			"DISK": "click-on-osv",
-			"MANAGEMENT_MAC": self.getNewMACaddr(),
-			"INTERFACES": [
-				{
-					"ID": "br0",
-					"MAC": self.getNewMACaddr(),
-					"LINK_MAC": ""
-				}
-			]
-		})
+		return self.addNode(self.getNodeName("VM"), position, "VM", self.defaultNodeInfo("VM"))
+
+	def insertBlueprint(self, blueprint: topology_generators.Blueprint, center: QPointF) -> list[NodeModel]:
+		# Adds a generated topology around center in one batch. Hosts and VMs get one interface per
+		# link, VMs being VNFs whose interfaces point to the interface at the other end of the link.
+		# The host interfaces of a link segment share one subnet.
+		# Without a virtualizer the scene index is rebuilt at the end instead of updated per item.
+		types, edges = blueprint.types, blueprint.edges.tolist()
+		counts, interfaces = topology_generators.link_interfaces(types, edges)
+		# Addresses are only reserved once the nodes are added, so a failure gives them back
+		checkpoint = self.addresses.checkpoint()
+		try:
+			ips = {n: [None] * counts[n] for n, type in enumerate(types) if type == "Host"}
+			for segment in topology_generators.host_segments(types, edges, counts, interfaces):
+				addresses = self.addresses.newIPv4Subnet(len(segment)) if len(segment) > 1 else [self.getNewIPv4addr()]
+				for (n, i), ip in zip(segment, addresses):
+					ips[n][i] = ip
+			infos = [self.defaultNodeInfo(type, count, ips.get(n)) for n, (type, count) in enumerate(zip(types, counts))]
+		except RuntimeError:
+			self.addresses.restore(checkpoint)
+			raise
+		for (u, v), ends in zip(edges, interfaces):
+			for (a, i), (b, j) in (((u, ends[0]), (v, ends[1])), ((v, ends[1]), (u, ends[0]))):
+				if types[a] == "VM" and j is not None:
+					infos[a]["INTERFACES"][i]["LINK_MAC"] = infos[b]["INTERFACES"][j]["MAC"]
+		for type, info in zip(types, infos):
+			if type == "VM":
+				info["VNF"] = True
+		x, y = center.x(), center.y()
+		positions = [(x + dx, y + dy) for dx, dy in blueprint.positions.tolist()]
+		return self.insertNodes(types, types, positions, infos, edges, interfaces)
+
+	def insertNodes(self, prefixes: list[str], types: list[str], positions: list[tuple[float, float]], infos: list[dict], edges: list[tuple], interfaces: list[list[int | None]]) -> list[NodeModel]:
+		# Adds nodes named after their prefix and the links between them in one batch. A link end is
+		# the index of a new node or the name of an existing one. Without a virtualizer the scene
+		# index is rebuilt at the end instead of updated per item.
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+		reuseNames = userSettings.value("Scene/ReuseNodeNames", type=bool)
+		nodes = [self.addNode(self.names.next(prefix, reuseNames), QPointF(x, y), type, info)
+			for prefix, type, (x, y), info in zip(prefixes, types, positions, infos)]
+		for (u, v), ends in zip(edges, interfaces):
+			ends = list(ends)
+			u, v = (nodes[n] if isinstance(n, int) else self.getNode(n)["obj"] for n in (u, v))
+			self.connectNodes(u, v, {"INTERFACES": ends})
+		self.searchIndex.flush()
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+			if len(nodes) > 0:
+				self.growSceneRect(self.nodesBoundingRect(nodes))
+		self.modelRegionChanged.emit(QRectF())
+		return nodes
 	
 	def setToolMode(self, toolMode):
 		unsetf = self.tools[self.toolMode.value][1]
@@ -1047,62 +2382,615 @@ class SceneClass(QGraphicsScene):
 					userSettings.setValue("Show/OVSSingleControllerWarn", not dontShowAgain.isChecked())
 				self.remove(u.getControllerConnection())
 			u.nodeInfo["CONTROLLER"] = v
-		edge = Edge(u, v, edgeInfo)
+		if self.virtualizer is not None:
+			edge = VirtualEdge(u, v, edgeInfo)
+		else: edge = Edge(u, v, edgeInfo)
 		self.netgraph.add_edge(u.getName(), v.getName(), obj=edge, info=edgeInfo)
 		u.addEdge(edge)
 		v.addEdge(edge)
-		self.addItem(edge)
+		self.validator.setEdge(u.getName(), v.getName(), edgeInfo)
+		self.reachability.addEdge(u.getName(), v.getName())
+		if u.type == "OVSwitch" and v.type == "Controller":
+			self.validator.setNode(u.getName(), u.type, u.nodeInfo)
+		if self.virtualizer is not None:
+			self.virtualizer.addEdge(edge)
+		elif u.group is None and v.group is None:
+			self.addItem(edge)
+		self.refreshGroupEdges({n.group for n in (u, v) if n.group is not None})
 
 		return edge
 	
-	def createNodeNameGenerators(self, nodeTypes: list[str]) -> dict:
-		generators: dict = {}
-		for nodeT in nodeTypes:
-			generators[nodeT] = createNodeNameGenerator(nodeT)
-		return generators
-	
 	def getNodeName(self, nodeType: str) -> str:
-		name = next(self.nodeNameGenerators[nodeType])
-		while (name in self.netgraph.nodes): # Prevents duplicates
-			name = next(self.nodeNameGenerators[nodeType])
-		return name
+		return self.names.next(nodeType, userSettings.value("Scene/ReuseNodeNames", type=bool))
 	
-	def remove(self, obj: Node | Edge | None):
+	def remove(self, obj: Node | Edge | GroupNode | None):
 		if obj is None:
 			return
-		if type(obj) == Node:
+		if isinstance(obj, NodeModel):
 			self.removeNode(obj)
+		elif isinstance(obj, GroupNode):
+			for member in list(obj.group.members):
+				self.removeNode(member)
 		else:
 			self.removeEdge(obj)
 	
-	def removeEdge(self, edge: Edge):
+	def removeEdge(self, edge: Edge | VirtualEdge):
 		self.netgraph.remove_edge(edge.nodes[0].getName(), edge.nodes[1].getName())
 		edge.nodes[0].removeEdge(edge)
 		edge.nodes[1].removeEdge(edge)
-		self.removeItem(edge)
-
-	def removeNode(self, node: Node):
+		self.validator.removeEdge(edge.nodes[0].getName(), edge.nodes[1].getName())
+		self.reachability.removeEdge(edge.nodes[0].getName(), edge.nodes[1].getName())
+		for n in edge.nodes:
+			if n.type == "OVSwitch": # Removing the controller link clears CONTROLLER
+				self.validator.setNode(n.getName(), n.type, n.nodeInfo)
+		if self.virtualizer is not None:
+			self.virtualizer.removeEdge(edge)
+		elif edge.scene() is self: # Edges of collapsed nodes are not in the scene
+			self.removeItem(edge)
+		self.refreshGroupEdges({n.group for n in edge.nodes if n.group is not None})
+
+	def removeNode(self, node: Node | VirtualNode):
 		for edge in list(node.edges):
 			self.removeEdge(edge)
 		self.netgraph.remove_node(node.getName())
-		self.removeItem(node)
+		self.searchIndex.removeNode(node.getName())
+		self.addresses.removeNode(node.getName())
+		self.names.remove(node.getName())
+		self.validator.removeNode(node.getName())
+		self.reachability.removeNode(node.getName())
+		if self.virtualizer is not None:
+			self.virtualizer.removeNode(node)
+		elif node.scene() is self:
+			self.removeItem(node)
+		if node.group is not None:
+			group = node.group
+			group.members.remove(node)
+			node.group = None
+			if len(group.members) == 0:
+				self.removeGroup(group)
+			else: group.item.updateText()
+		self.dropGroupEdges(node)
+
+	def removeElements(self, elements: list):
+		# Removes nodes (with their links), links and groups together. Every affected link is removed
+		# once, the surviving endpoints filter their edge lists once and groups are refreshed once.
+		# Without a virtualizer the scene index is rebuilt at the end instead of updated per item.
+		nodes: dict[NodeModel, None] = {}
+		edges: dict[EdgeModel, None] = {}
+		for element in elements:
+			if isinstance(element, NodeModel):
+				nodes[element] = None
+			elif isinstance(element, GroupNode):
+				nodes.update(dict.fromkeys(element.group.members))
+			elif isinstance(element, EdgeModel):
+				edges[element] = None
+		for node in nodes:
+			edges.update(dict.fromkeys(node.edges))
+		if len(nodes) == 0 and len(edges) == 0:
+			return
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
+		groups: set[NodeGroup] = set()
+		survivors: dict[NodeModel, None] = {}
+		for edge in edges:
+			self.validator.removeEdge(edge.nodes[0].getName(), edge.nodes[1].getName())
+			self.reachability.removeEdge(edge.nodes[0].getName(), edge.nodes[1].getName())
+			for n in edge.nodes:
+				if n not in nodes:
+					survivors[n] = None
+				if n.group is not None:
+					groups.add(n.group)
+			if self.virtualizer is not None:
+				self.virtualizer.removeEdge(edge)
+			elif edge.scene() is self:
+				self.removeItem(edge)
+		self.netgraph.remove_edges_from([(e.nodes[0].getName(), e.nodes[1].getName()) for e in edges])
+		for node in survivors:
+			if node.getControllerConnection() in edges:
+				node.nodeInfo["CONTROLLER"] = None
+			node.edges = [e for e in node.edges if e not in edges]
+			if node.type == "OVSwitch":
+				self.validator.setNode(node.getName(), node.type, node.nodeInfo)
+
+		names = [n.getName() for n in nodes]
+		self.netgraph.remove_nodes_from(names)
+		for node, name in zip(nodes, names):
+			self.searchIndex.removeNode(name)
+			self.addresses.removeNode(name)
+			self.validator.removeNode(name)
+			self.reachability.removeNode(name)
+			if self.virtualizer is not None:
+				self.virtualizer.removeNode(node)
+			elif node.scene() is self:
+				self.removeItem(node)
+			if node.group is not None:
+				groups.add(node.group)
+			groups.update(summary.ends[0] for summary in self.groupEdgesByNode.get(node, []))
+		self.names.removeMany(names)
+
+		for group in groups:
+			group.members = [m for m in group.members if m not in nodes]
+		for node in nodes:
+			node.group = None
+		for group in groups:
+			if len(group.members) == 0:
+				self.removeGroup(group)
+			else: group.item.updateText()
+		self.refreshGroupEdges({g for g in groups if len(g.members) > 0})
+		for node in nodes:
+			self.groupEdgesByNode.pop(node, None)
+
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+		self.modelRegionChanged.emit(QRectF())
 
 	def clear(self):
+		if self.virtualizer is not None:
+			self.virtualizer.clear()
 		super(SceneClass, self).clear()
-		self.netgraph = nx.Graph()
+		self._netgraph = None
+		self.groups = []
+		self.groupCount = 0
+		self.groupEdgesByNode = {}
+		self.searchIndex.clear()
+		self.addresses.clear()
+		self.names.clear()
+		self.validator.clear()
+		self.reachability.clear()
+		self.annotated = []
+		self.highlighted = []
+		self.selection.clear()
+		self.selectedNodes.clear()
+		self.generation += 1
+		self.modelRegionChanged.emit(QRectF())
+
+	# Grouping: collapsed members stay in netgraph, so exports are unaffected, but have no items in the scene
+
+	def collapseSelection(self) -> NodeGroup | None:
+		members = []
+		groups = []
+		for element in self.selectedElements():
+			if isinstance(element, NodeModel):
+				members.append(element)
+			elif isinstance(element, GroupNode):
+				groups.append(element.group)
+				members.extend(element.group.members)
+		if len(members) < 2:
+			return None
+		for group in groups: # Selected groups are merged into the new one
+			self.removeGroup(group)
+		return self.collapseNodes(members)
+
+	def collapseNodes(self, members: list[Node | VirtualNode]) -> NodeGroup:
+		self.groupCount += 1
+		group = NodeGroup(f"Group{self.groupCount}", self.groupCount, members)
+		for member in members:
+			member.group = group
+		self.hideNodes(members)
+		x = sum(m.pos().x() for m in members) / len(members)
+		y = sum(m.pos().y() for m in members) / len(members)
+		group.item.setCenter(QPointF(x, y))
+		self.addItem(group.item)
+		self.groups.append(group)
+		self.refreshGroupEdges({group} | self.adjacentGroups(group))
+		self.modelRegionChanged.emit(self.nodesBoundingRect(members))
+		return group
+
+	def expandSelection(self):
+		for element in self.selectedElements():
+			if isinstance(element, GroupNode):
+				self.expandGroup(element.group)
+
+	def expandGroup(self, group: NodeGroup):
+		adjacent = self.adjacentGroups(group)
+		members = list(group.members)
+		self.removeGroup(group)
+		self.showNodes(members)
+		self.refreshGroupEdges(adjacent)
+		self.modelRegionChanged.emit(self.nodesBoundingRect(members))
+
+	def groupState(self) -> tuple[int, list[tuple[int, list[str]]]]:
+		# Collapsed groups by order and member names, to collapse them again once the topology is rebuilt
+		return self.groupCount, [(group.order, [m.getName() for m in group.members]) for group in sorted(self.groups, key=lambda g: g.order)]
+
+	def restoreGroups(self, state: tuple[int, list[tuple[int, list[str]]]]):
+		count, groups = state
+		for order, names in groups:
+			members = [self.getNode(name)["obj"] for name in names if self.hasNode(name)]
+			if len(members) >= 2:
+				# Keeps the name and the order, which decides the group drawing links between groups
+				self.groupCount = order - 1
+				self.collapseNodes(members)
+		self.groupCount = count
+
+	def selectionTemplate(self) -> topology_generators.Template | None:
+		# Selected nodes with the links between them. OVSwitch links to a controller outside the
+		# selection are kept, so copies are managed by the same controller.
+		nodes = self.selectedNodeModels()
+		if len(nodes) == 0:
+			return None
+		index = {node: i for i, node in enumerate(nodes)}
+		edges, interfaces, external = [], [], []
+		for node in nodes:
+			for edge in node.edges:
+				other = edge.getOtherNode(node)
+				if other in index:
+					if index[node] < index[other]:
+						edges.append((index[edge.nodes[0]], index[edge.nodes[1]]))
+						interfaces.append(list(edge.edgeInfo.get("INTERFACES", [None, None])))
+				elif node.type == "OVSwitch" and other.type == "Controller":
+					external.append((index[node], other.getName()))
+		prefixes = []
+		for node in nodes:
+			parts = name_allocator.split_name(node.getName())
+			prefixes.append(node.getName() if parts is None else parts[0])
+		positions = [(n.pos().x(), n.pos().y()) for n in nodes]
+		return topology_generators.capture_template(prefixes, [n.type for n in nodes], positions, [n.nodeInfo for n in nodes], edges, interfaces, external)
+
+	def stampTemplate(self, template: topology_generators.Template, count: int) -> list[NodeModel]:
+		# count copies of a template next to it, with new names and addresses
+		checkpoint = self.addresses.checkpoint()
+		try:
+			stamped = topology_generators.stamp(template, count, self.getNewIPv4addr, self.getNewMACaddr)
+		except RuntimeError:
+			self.addresses.restore(checkpoint)
+			raise
+		prefixes, types, positions, infos, edges, interfaces = stamped
+		return self.insertNodes(prefixes, types, positions.tolist(), infos, edges, interfaces)
+
+	def nodesBoundingRect(self, nodes: list[NodeModel]) -> QRectF:
+		xs = [n.pos().x() for n in nodes]
+		ys = [n.pos().y() for n in nodes]
+		return QRectF(min(xs) - NODE_RAD, min(ys) - NODE_RAD, max(xs) - min(xs) + 2*NODE_RAD, max(ys) - min(ys) + 2*NODE_RAD)
+
+	def removeGroup(self, group: NodeGroup):
+		for member in group.members:
+			member.group = None
+		self.setGroupEdges(group, [])
+		if group.item.scene() is self:
+			self.removeItem(group.item)
+		self.groups.remove(group)
+
+	def adjacentGroups(self, group: NodeGroup) -> set[NodeGroup]:
+		groups = set()
+		for member in group.members:
+			for edge in member.edges:
+				other = edge.getOtherNode(member).group
+				if other is not None and other is not group:
+					groups.add(other)
+		return groups
+
+	def hideNodes(self, nodes: list[Node | VirtualNode]):
+		if self.virtualizer is not None:
+			self.virtualizer.scheduleRefresh()
+			return
+		for node in nodes:
+			for edge in node.edges:
+				if edge.scene() is self:
+					self.removeItem(edge)
+			if node.scene() is self:
+				self.removeItem(node)
+
+	def showNodes(self, nodes: list[Node | VirtualNode]):
+		if self.virtualizer is not None:
+			self.virtualizer.scheduleRefresh()
+			return
+		for node in nodes:
+			if node.scene() is None:
+				self.addItem(node)
+		for node in nodes:
+			for edge in node.edges:
+				if edge.scene() is None and edge.getOtherNode(node).group is None:
+					edge.updateLine()
+					self.addItem(edge)
+
+	def refreshGroupEdges(self, groups: set[NodeGroup]):
+		# A link between two groups is drawn by the one created first
+		for group in groups:
+			counts: dict = {}
+			for member in group.members:
+				for edge in member.edges:
+					other = edge.getOtherNode(member)
+					if other.group is group:
+						continue
+					target = other if other.group is None else other.group
+					if other.group is not None and other.group.order < group.order:
+						continue
+					counts[target] = counts.get(target, 0) + 1
+			self.setGroupEdges(group, [SummaryEdge(group, t, c) for t, c in counts.items()])
+
+	def setGroupEdges(self, group: NodeGroup, summaryEdges: list[SummaryEdge]):
+		for summary in group.summaryEdges:
+			self.removeItem(summary)
+			for end in summary.ends:
+				self.groupEdgesByNode.get(end, []).remove(summary)
+		group.summaryEdges = summaryEdges
+		for summary in summaryEdges:
+			self.addItem(summary)
+			for end in summary.ends:
+				self.groupEdgesByNode.setdefault(end, []).append(summary)
+
+	def updateGroupEdges(self, obj: NodeModel | NodeGroup):
+		for summary in self.groupEdgesByNode.get(obj, []):
+			summary.updateLine()
+
+	def dropGroupEdges(self, obj: NodeModel):
+		if len(self.groupEdgesByNode.get(obj, [])) > 0:
+			self.refreshGroupEdges({s.ends[0] for s in self.groupEdgesByNode[obj]})
+		self.groupEdgesByNode.pop(obj, None)
 
 	def hasNode(self, nodeName: str):
 		return self.netgraph.has_node(nodeName)
 
+	def layoutInput(self, nodeNames: list[str] | None = None):
+		# Returns the node names, their types, the edges as name indices, the current positions
+		# and which nodes must keep their position (all but nodeNames, when given)
+		names = list(self.netgraph.nodes)
+		index = {n: i for i, n in enumerate(names)}
+		objs = [self.netgraph.nodes[n]["obj"] for n in names]
+		types = [obj.type for obj in objs]
+		edges = [(index[u], index[v]) for u, v in self.netgraph.edges]
+		positions = [(p.x(), p.y()) for p in (obj.pos() for obj in objs)]
+		if nodeNames is None:
+			fixed = [False] * len(names)
+		else:
+			free = set(nodeNames)
+			fixed = [n not in free for n in names]
+		return names, types, edges, positions, fixed
+
+	def subnetInput(self):
+		# Returns the owner and address of every interface (and controller), the number of link
+		# elements, the links as element pairs and the edges attached to every interface.
+		# Elements are the interfaces followed by the switches, which join their links into one segment.
+		owners: list[NodeModel] = []
+		addresses: list[str] = []
+		firstInterface: dict[NodeModel, int] = dict()
+		bridges: list[NodeModel] = []
+		for _, obj in self.netgraph.nodes(data="obj"):
+			firstInterface[obj] = len(addresses)
+			for iface in obj.nodeInfo.get("INTERFACES", []):
+				owners.append(obj)
+				addresses.append(iface.get("IP"))
+			if obj.type == "Controller":
+				owners.append(obj)
+				addresses.append(str(obj.nodeInfo.get("IP")))
+			elif obj.type in ("Switch", "OVSwitch"):
+				bridges.append(obj)
+		bridgeElement = {obj: len(addresses) + i for i, obj in enumerate(bridges)}
+		links: list[int] = []
+		linkEdges: dict[int, list[EdgeModel]] = dict()
+		for _, _, edge in self.netgraph.edges(data="obj"):
+			ends = []
+			for i, node in enumerate(edge.nodes):
+				interfaces = node.nodeInfo.get("INTERFACES")
+				index = edge.edgeInfo.get("INTERFACES", [None, None])[i]
+				if interfaces is not None and isinstance(index, int) and 0 <= index < len(interfaces):
+					ends.append(firstInterface[node] + index)
+					linkEdges.setdefault(ends[-1], []).append(edge)
+				elif node in bridgeElement:
+					ends.append(bridgeElement[node])
+			if len(ends) == 2:
+				links.extend(ends)
+		return owners, addresses, len(addresses) + len(bridges), links, linkEdges
+
+	def setAnnotations(self, annotations: dict[NodeModel | EdgeModel, str]):
+		# Replaces the messages shown on nodes and edges by an analysis
+		for obj in self.annotated:
+			self.annotate(obj, "")
+		self.annotated = list(annotations)
+		for obj, text in annotations.items():
+			self.annotate(obj, text)
+
+	def annotate(self, obj: NodeModel | EdgeModel, text: str):
+		obj.annotation = text
+		item = self.itemOf(obj)
+		if item is not None:
+			item.setToolTip(text)
+			item.update()
+
+	def highlightPath(self, path: list[str]):
+		# Highlights the links along a path instead of the previous ones: the flags are changed
+		# first and the affected region is repainted once
+		edges = [self.netgraph.edges[u, v]["obj"] for u, v in zip(path, path[1:]) if self.netgraph.has_edge(u, v)]
+		changed = set(self.highlighted).symmetric_difference(edges)
+		for edge in self.highlighted:
+			edge.highlighted = False
+		for edge in edges:
+			edge.highlighted = True
+		self.highlighted = edges
+		region = QRectF()
+		for edge in changed:
+			item = self.itemOf(edge)
+			if item is not None and item.scene() is self:
+				region = region.united(item.sceneBoundingRect())
+		if not region.isNull():
+			self.update(region)
+
+	def setReachabilityTypes(self, types: list[str]):
+		nodes = [(name, obj.type) for name, obj in self.netgraph.nodes(data="obj")]
+		self.reachability.setTypes(types, nodes, self.netgraph.edges())
+
+	def applyLayout(self, names: list[str], positions: list[tuple[float, float]]):
+		# All nodes are moved before any edge is redrawn, without updating the item index for each move
+		moved = []
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+		for name, (x, y) in zip(names, positions):
+			if not self.hasNode(name):
+				continue
+			obj = self.getNode(name)["obj"]
+			if obj.pos() != QPointF(x, y):
+				obj.setPos(QPointF(x, y))
+				moved.append(obj)
+		for edge in {e for n in moved for e in n.edges}:
+			edge.updateLine()
+		for group in self.groups:
+			group.recenter()
+		for obj in moved:
+			self.updateGroupEdges(obj)
+		if self.virtualizer is None:
+			self.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+			self.growSceneRect(self.itemsBoundingRect())
+		self.modelRegionChanged.emit(QRectF())
+
+	def overviewElements(self, rect: QRectF):
+		# Nodes, edges, groups and group links to draw for rect, including records without items
+		items = self.items(rect, Qt.ItemSelectionMode.IntersectsItemBoundingRect)
+		groups = [i for i in items if isinstance(i, GroupNode)]
+		summaries = [i for i in items if isinstance(i, SummaryEdge)]
+		if self.virtualizer is None:
+			nodes = [i for i in items if isinstance(i, Node)]
+			edges = [i for i in items if isinstance(i, Edge)]
+		else:
+			r = rect.adjusted(-NODE_RAD, -NODE_RAD, NODE_RAD, NODE_RAD)
+			nodes = [n for n in self.virtualizer.index.query(r.left(), r.top(), r.right(), r.bottom()) if n.group is None]
+			edges = {e for n in nodes for e in n.edges if e.getOtherNode(n).group is None}
+		return nodes, edges, groups, summaries
 
-class Node(QGraphicsEllipseItem):
-	nodeColorTable = {
-		"Host": QColor(35, 158, 207),
-		"Switch": QColor(228, 240, 122),
-		"Controller": QColor(56, 207, 96),
-		"OVSwitch": QColor(172, 184, 68),
-		"VM": QColor(40, 55, 168)
-	}
+	def growSceneRect(self, rect: QRectF):
+		if not self.sceneRect().contains(rect):
+			m = 4*NODE_RAD
+			self.setSceneRect(self.sceneRect().united(rect.adjusted(-m, -m, m, m)))
+
+	def isVirtualized(self) -> bool:
+		return self.virtualizer is not None
+
+	def setVirtualized(self, enabled: bool):
+		if enabled == self.isVirtualized():
+			return
+		self.clear()
+		self.virtualizer = SceneVirtualizer(self) if enabled else None
+
+	def viewportChanged(self):
+		if self.virtualizer is not None:
+			self.virtualizer.scheduleRefresh()
+
+	def modelOf(self, item: QGraphicsItem) -> Node | Edge | VirtualNode | VirtualEdge:
+		# Items materialized by the virtualizer stand in for the records held by the graph
+		record = getattr(item, "record", None)
+		return item if record is None else record
+
+	def itemOf(self, obj) -> QGraphicsItem | None:
+		if isinstance(obj, QGraphicsItem):
+			return obj
+		return obj.item
+
+	def selectedElements(self) -> list:
+		return [self.modelOf(i) for i in self.selection]
+
+	def currentElement(self):
+		# The first selected element still selected
+		return self.modelOf(next(iter(self.selection))) if len(self.selection) > 0 else None
+
+	def selectedNodeModels(self) -> list[Node | VirtualNode]:
+		return [self.modelOf(i) for i in self.selectedNodes]
+
+	def firstSelectedNode(self) -> Node | VirtualNode | None:
+		return self.modelOf(next(iter(self.selectedNodes))) if len(self.selectedNodes) > 0 else None
+
+	def itemSelectionChanged(self, item: QGraphicsItem, selected: bool):
+		# Called by the items when they are selected or deselected in this scene
+		if selected:
+			self.selection[item] = None
+			if isinstance(item, Node):
+				self.selectedNodes[item] = None
+		else:
+			self.selection.pop(item, None)
+			self.selectedNodes.pop(item, None)
+
+	def addItem(self, item: QGraphicsItem):
+		super(SceneClass, self).addItem(item)
+		if item.isSelected(): # Removed items keep their selection state and are selected again when added
+			self.itemSelectionChanged(item, True)
+
+	def removeItem(self, item: QGraphicsItem):
+		self.itemSelectionChanged(item, False)
+		super(SceneClass, self).removeItem(item)
+
+	def focusNode(self, nodeName: str):
+		# Selects a node, or the group hiding it, and centers the views on it
+		if not self.hasNode(nodeName):
+			return
+		obj = self.getNode(nodeName)["obj"]
+		pos = obj.pos() if obj.group is None else obj.group.pos()
+		self.clearSelection()
+		self.growSceneRect(QRectF(pos.x() - NODE_RAD, pos.y() - NODE_RAD, 2*NODE_RAD, 2*NODE_RAD))
+		for view in self.views():
+			view.centerOn(pos)
+		if self.virtualizer is not None:
+			self.virtualizer.refresh() # Materializes the node before selecting it
+		item = self.itemOf(obj) if obj.group is None else obj.group.item
+		if item is not None:
+			item.setSelected(True)
+
+
+class NodeModel:
+	# Topology behaviour shared by Node items and the VirtualNode records of virtualized scenes.
+	# Implementers provide getName(), type, nodeInfo and edges.
+	annotation = "" # Problems found by the last subnet analysis
+	def addEdge(self, edge: Edge | VirtualEdge) -> None:
+		self.edges.append(edge)
+
+	def removeEdge(self, edge: Edge | VirtualEdge):
+		if edge is self.getControllerConnection():
+			self.nodeInfo["CONTROLLER"] = None
+		self.edges.remove(edge)
+	
+	def hasInterface(self):
+		return self.type in ["Host", "VM"]
+	
+	def getControllerConnection(self) -> Edge | VirtualEdge | None:
+		if self.type != "OVSwitch":
+			return None
+		for e in self.edges:
+			other = e.getOtherNode(self)
+			if other.type == "Controller":
+				return e
+		return None
+	
+	def removeInterface(self, ifaceidx):
+		# Update the interfaces used by the connections of the node
+		for e in self.edges:
+			eifaceidx = e.getNodeInterfaceIndex(self)
+			if eifaceidx is not None and eifaceidx >= ifaceidx:
+				e.updateNodeInterface(self, eifaceidx - 1)
+		self.nodeInfo["INTERFACES"].pop(ifaceidx) # Remove the interface from the nodeinfo dict
+
+
+class EdgeModel:
+	# Topology behaviour shared by Edge items and the VirtualEdge records of virtualized scenes.
+	# Implementers provide nodes and edgeInfo.
+	annotation = ""
+	highlighted = False # Part of the path shown by the reachability panel
+	def getNodeInterface(self, i: int):
+		return self.nodes[i].nodeInfo["INTERFACES"]
+
+	def getNodeIndex(self, node: NodeModel):
+		if node is self.nodes[0]:
+			return 0
+		elif node is self.nodes[1]:
+			return 1
+		else:
+			return -1
+	
+	def getOtherNode(self, node: NodeModel):
+		if node is self.nodes[0]:
+			return self.nodes[1]
+		if node is self.nodes[1]:
+			return self.nodes[0]
+		return None
+
+	def updateNodeInterface(self, node: NodeModel, value: int):
+		ni = self.getNodeIndex(node)
+		self.edgeInfo["INTERFACES"][ni] = value
+	
+	def getNodeInterfaceIndex(self, node: NodeModel):
+		return self.edgeInfo["INTERFACES"][self.getNodeIndex(node)]
+
+
+class Node(QGraphicsEllipseItem, NodeModel):
+	nodeColorTable = {type: QColor(*rgb) for type, rgb in theme.NODE_COLORS.items()}
 	def __init__(self, id: str, type: str, nodeInfo: dict = {}):
 		# Using -NODE_RAD for the x and y of the bounding rectangle aligns the rectangle at the center of the node
 		super(Node, self).__init__(-NODE_RAD, -NODE_RAD, 2*NODE_RAD, 2*NODE_RAD)
@@ -1112,6 +3000,8 @@ class Node(QGraphicsEllipseItem):
 		self.setName(id)
 		self.nodeInfo = nodeInfo
 		self.type = type
+		self.record: VirtualNode | None = None # Set while the item displays a record of a virtualized scene
+		self.group: NodeGroup | None = None
 		
 		self.edges: list[Edge] = []
 		
@@ -1124,6 +3014,7 @@ class Node(QGraphicsEllipseItem):
 		return self.text.toPlainText()
 	
 	def setName(self, newName: str):
+		self.text.setTextWidth(-1)
 		self.text.setPlainText(newName)
 		self.text.adjustSize()
 		# Centers it within the ellipse
@@ -1132,17 +3023,33 @@ class Node(QGraphicsEllipseItem):
 
 		# Set max text width to 95% of node diameter
 		self.text.setTextWidth(min(0.95*2*NODE_RAD, self.text.boundingRect().width())) 
-	
-	def addEdge(self, edge: Edge) -> None:
-		self.edges.append(edge)
+
+	def bind(self, record: VirtualNode | None):
+		self.record = None # Prevents the position change below from moving the previous record
+		if record is None:
+			return
+		self.nodeInfo = record.nodeInfo
+		self.type = record.type
+		self.setName(record.getName())
+		self.setBrush(self.nodeColorTable[record.type])
+		self.setPos(record.pos())
+		self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+		self.setToolTip(record.annotation)
+		self.record = record
 
 	def paint(self, painter, option, widget):
 		option.state &= ~QStyle.State_Selected
 		super(Node, self).paint(painter, option, widget)
+		if (self.record or self).annotation:
+			painter.setPen(QPen(ANNOTATION_COLOR, 4, Qt.PenStyle.DotLine))
+			painter.setBrush(Qt.BrushStyle.NoBrush)
+			painter.drawEllipse(self.rect().adjusted(2, 2, -2, -2))
 	
 	def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent) -> None:
 		for edge in self.edges:
 			edge.updateLine()
+		if self.record is None:
+			self.scene().updateGroupEdges(self)
 		return super().mouseMoveEvent(event)
 
 	def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
@@ -1154,89 +3061,312 @@ class Node(QGraphicsEllipseItem):
 				p = QPen(QColor(255,255,255), 3)
 			else: p = QPen(QColor(0, 0, 0), 1)
 			self.setPen(p)
+		elif change == QGraphicsItem.ItemSelectedHasChanged and self.scene() is not None:
+			self.scene().itemSelectionChanged(self, self.isSelected())
+		elif change == QGraphicsItem.ItemPositionHasChanged and self.record is not None:
+			self.record.setPos(value)
 		return super().itemChange(change, value)
 
-	def removeEdge(self, edge: Edge):
-		if edge is self.getControllerConnection():
-			self.nodeInfo["CONTROLLER"] = None
-		self.edges.remove(edge)
-	
-	def hasInterface(self):
-		return self.type in ["Host", "VM"]
-	
-	def getControllerConnection(self) -> Edge | None:
-		if self.type != "OVSwitch":
-			return None
-		for e in self.edges:
-			other = e.getOtherNode(self)
-			if other.type == "Controller":
-				return e
-		return None
-	
-	def removeInterface(self, ifaceidx):
-		# Update the interfaces used by the connections of the node
-		for e in self.edges:
-			eifaceidx = e.getNodeInterfaceIndex(self)
-			if e.edgeInfo["INTERFACES"][eifaceidx] >= ifaceidx:
-				e.edgeInfo["INTERFACES"][eifaceidx] -= 1
-		self.nodeInfo["INTERFACES"].pop(ifaceidx) # Remove the interface from the nodeinfo dict
-
-
 	
-class Edge(QGraphicsLineItem):
-	def __init__(self, u: Node, v: Node, edgeInfo: dict = {}):
+class Edge(QGraphicsLineItem, EdgeModel):
+	linePen = QPen(QColor(0, 0, 0), 3)
+	selectedLinePen = QPen(QColor(255, 255, 255), 6)
+	highlightPen = QPen(HIGHLIGHT_COLOR, 5)
+	def __init__(self, u: Node | VirtualNode, v: Node | VirtualNode, edgeInfo: dict = {}):
 		super(Edge, self).__init__(QLineF(u.pos(), v.pos()))
 		self.nodes = (u, v)
-		pen = QPen()
-		pen.setWidth(3)
-		self.setPen(pen)
+		# The item's pen only sets its geometry, which covers the selected line so that selecting
+		# an edge does not move it in the scene index. The line is painted with linePen.
+		self.setPen(self.selectedLinePen)
 		self.setFlag(QGraphicsItem.ItemIsSelectable)
 		self.edgeInfo = edgeInfo
+		self.record: VirtualEdge | None = None # Set while the item displays a record of a virtualized scene
 
 		self.setZValue(0.5)
 	
 	def updateLine(self):
 		self.setLine(QLineF(self.nodes[0].pos(), self.nodes[1].pos()))
 
+	def bind(self, record: VirtualEdge | None):
+		self.record = record
+		if record is None:
+			return
+		self.nodes = record.nodes
+		self.edgeInfo = record.edgeInfo
+		self.setToolTip(record.annotation)
+		self.updateLine()
+
 	def paint(self, painter, option, widget):
-		option.state &= ~QStyle.State_Selected
-		super(Edge, self).paint(painter, option, widget)
+		painter.setPen(self.selectedLinePen if self.isSelected() else self.linePen)
+		painter.drawLine(self.line())
+		if (self.record or self).highlighted:
+			painter.setPen(self.highlightPen)
+			painter.drawLine(self.line())
+		if (self.record or self).annotation:
+			painter.setPen(QPen(ANNOTATION_COLOR, 2, Qt.PenStyle.DashLine))
+			painter.drawLine(self.line())
 	
+	def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
+		if change == QGraphicsItem.ItemSelectedHasChanged and self.scene() is not None:
+			self.scene().itemSelectionChanged(self, self.isSelected())
+		return super().itemChange(change, value)
+
+
+class NodeGroup:
+	def __init__(self, name: str, order: int, members: list[Node | VirtualNode]):
+		self.name = name
+		self.order = order
+		self.members = list(members)
+		self.summaryEdges: list[SummaryEdge] = []
+		self.item = GroupNode(self)
+
+	def pos(self) -> QPointF:
+		return self.item.pos()
+
+	def recenter(self):
+		x = sum(m.pos().x() for m in self.members) / len(self.members)
+		y = sum(m.pos().y() for m in self.members) / len(self.members)
+		self.item.setCenter(QPointF(x, y))
+
+
+class GroupNode(QGraphicsEllipseItem):
+	def __init__(self, group: NodeGroup):
+		super(GroupNode, self).__init__(-1.5*NODE_RAD, -1.5*NODE_RAD, 3*NODE_RAD, 3*NODE_RAD)
+		self.group = group
+		self.movingMembers = True
+		self.text = QGraphicsTextItem(parent=self)
+		self.updateText()
+		self.setFlag(QGraphicsItem.ItemIsMovable)
+		self.setFlag(QGraphicsItem.ItemIsSelectable)
+		self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
+		self.setZValue(1)
+		self.setBrush(QColor(160, 160, 160))
+		self.setPen(QPen(QColor(0, 0, 0), 1, Qt.PenStyle.DashLine))
+
+	def updateText(self):
+		self.text.setPlainText(f"{self.group.name}\n({len(self.group.members)} nodes)")
+		self.text.setX(-self.text.boundingRect().width()/2)
+		self.text.setY(-self.text.boundingRect().height()/2)
+
+	def setCenter(self, pos: QPointF):
+		# Moves the group item without moving its members
+		self.movingMembers = False
+		self.setPos(pos)
+		self.movingMembers = True
+
+	def paint(self, painter, option, widget):
+		option.state &= ~QStyle.State_Selected
+		super(GroupNode, self).paint(painter, option, widget)
+
+	def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent) -> None:
+		self.scene().expandGroup(self.group)
+
 	def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
 		if change == QGraphicsItem.ItemSelectedChange:
-			# Selection is false when the item change to select the item is ocurring.
-			# Therefore, it is needed to invert the following condition to highlight 
-			# the selected items.
 			if not self.isSelected():
-				p = QPen(QColor(255,255,255), 6)
-			else: p = QPen(QColor(0, 0, 0), 3)
+				p = QPen(QColor(255,255,255), 3, Qt.PenStyle.DashLine)
+			else: p = QPen(QColor(0, 0, 0), 1, Qt.PenStyle.DashLine)
 			self.setPen(p)
+		elif change == QGraphicsItem.ItemSelectedHasChanged and self.scene() is not None:
+			self.scene().itemSelectionChanged(self, self.isSelected())
+		elif change == QGraphicsItem.ItemPositionChange and self.movingMembers:
+			delta = value - self.pos()
+			for member in self.group.members:
+				member.setPos(member.pos() + delta)
+		elif change == QGraphicsItem.ItemPositionHasChanged and self.scene() is not None:
+			self.scene().updateGroupEdges(self.group)
 		return super().itemChange(change, value)
 
-	def getNodeInterface(self, i: int):
-		return self.nodes[i].nodeInfo["INTERFACES"]
 
-	def getNodeIndex(self, node: Node):
-		if node is self.nodes[0]:
-			return 0
-		elif node is self.nodes[1]:
-			return 1
-		else:
-			return -1
-	
-	def getOtherNode(self, node: Node):
-		if node is self.nodes[0]:
-			return self.nodes[1]
-		if node is self.nodes[1]:
-			return self.nodes[0]
-		return None
+class SummaryEdge(QGraphicsLineItem):
+	# Stands for every link between a collapsed group and another node or group
+	def __init__(self, group: NodeGroup, target: NodeModel | NodeGroup, count: int):
+		super(SummaryEdge, self).__init__()
+		self.ends = (group, target)
+		pen = QPen(QColor(80, 80, 80))
+		pen.setWidth(min(3 + count, 12))
+		self.setPen(pen)
+		self.setZValue(0.5)
+		self.setToolTip(f"{count} link{'s' if count > 1 else ''}")
+		self.updateLine()
+
+	def updateLine(self):
+		self.setLine(QLineF(self.ends[0].pos(), self.ends[1].pos()))
+
+
+class VirtualNode(NodeModel):
+	def __init__(self, id: str, type: str, nodeInfo: dict = {}):
+		self.name = id
+		self.type = type
+		self.nodeInfo = nodeInfo
+		self.edges: list[VirtualEdge] = []
+		self.position = QPointF()
+		self.item: Node | None = None
+		self.virtualizer: SceneVirtualizer | None = None
+		self.group: NodeGroup | None = None
+
+	def getName(self) -> str:
+		return self.name
+
+	def setName(self, newName: str):
+		self.name = newName
+		if self.item is not None:
+			self.item.setName(newName)
+
+	def pos(self) -> QPointF:
+		return self.position
+
+	def setPos(self, position: QPointF):
+		self.position = QPointF(position)
+		if self.item is not None and self.item.pos() != self.position:
+			self.item.setPos(self.position)
+		if self.virtualizer is not None:
+			self.virtualizer.nodeMoved(self)
+
+
+class VirtualEdge(EdgeModel):
+	def __init__(self, u: VirtualNode, v: VirtualNode, edgeInfo: dict = {}):
+		self.nodes = (u, v)
+		self.edgeInfo = edgeInfo
+		self.item: Edge | None = None
+
+	def updateLine(self):
+		if self.item is not None:
+			self.item.updateLine()
+
+
+class SceneVirtualizer:
+	# Keeps QGraphicsItems only for the records around the visible region of the views.
+	# Items leaving that region are removed from the scene and kept in a pool for reuse.
+	def __init__(self, scene: SceneClass):
+		self.scene = scene
+		self.index = spatial_index.GridIndex(8*NODE_RAD)
+		self.nodeItems: dict[VirtualNode, Node] = {}
+		self.edgeItems: dict[VirtualEdge, Edge] = {}
+		self.nodePool: list[Node] = []
+		self.edgePool: list[Edge] = []
+		self.bounds = QRectF()
+		self.lastVisibleRect = QRectF()
+		self.refreshTimer = QTimer()
+		self.refreshTimer.setSingleShot(True)
+		self.refreshTimer.setInterval(0)
+		self.refreshTimer.timeout.connect(self.refresh)
+
+	def addNode(self, record: VirtualNode):
+		record.virtualizer = self
+		self.nodeMoved(record)
+
+	def removeNode(self, record: VirtualNode):
+		self.index.remove(record)
+		self.releaseNode(record)
+		record.virtualizer = None
+
+	def addEdge(self, edge: VirtualEdge):
+		if edge.nodes[0].group is not None or edge.nodes[1].group is not None:
+			return
+		if edge.nodes[0] in self.nodeItems or edge.nodes[1] in self.nodeItems:
+			self.materializeEdge(edge)
+
+	def removeEdge(self, edge: VirtualEdge):
+		self.releaseEdge(edge)
+
+	def nodeMoved(self, record: VirtualNode):
+		pos = record.pos()
+		self.index.move(record, pos.x(), pos.y())
+		if not self.bounds.contains(pos):
+			self.bounds = self.bounds.united(QRectF(pos.x() - NODE_RAD, pos.y() - NODE_RAD, 2*NODE_RAD, 2*NODE_RAD))
+			self.scheduleRefresh()
+		for edge in record.edges:
+			edge.updateLine()
+		self.scene.updateGroupEdges(record)
+		if record.item is None and self.lastVisibleRect.contains(pos):
+			self.scheduleRefresh()
+
+	def visibleRect(self) -> QRectF:
+		rect = QRectF()
+		for view in self.scene.views():
+			rect = rect.united(view.visibleSceneRect())
+		dx, dy = rect.width()*VIRTUALIZATION_MARGIN, rect.height()*VIRTUALIZATION_MARGIN
+		return rect.adjusted(-dx - NODE_RAD, -dy - NODE_RAD, dx + NODE_RAD, dy + NODE_RAD)
+
+	def scheduleRefresh(self):
+		# Coalesces scrolls, zooms and edits into one update per event loop iteration
+		self.refreshTimer.start()
+
+	def refresh(self):
+		self.scene.growSceneRect(self.bounds)
+		rect = self.visibleRect()
+		self.lastVisibleRect = rect
+		visibleNodes = set(self.index.query(rect.left(), rect.top(), rect.right(), rect.bottom()))
+		# Selected items are kept so that the selection survives scrolling
+		visibleNodes.update(n for n, item in self.nodeItems.items() if item.isSelected())
+		# Members of collapsed groups are never materialized
+		visibleNodes = {n for n in visibleNodes if n.group is None}
+		visibleEdges = set()
+		for record in visibleNodes:
+			visibleEdges.update(e for e in record.edges if e.getOtherNode(record).group is None)
+
+		for edge in [e for e, item in self.edgeItems.items() if e not in visibleEdges and not item.isSelected()]:
+			self.releaseEdge(edge)
+		for record in [n for n in self.nodeItems.keys() if n not in visibleNodes]:
+			self.releaseNode(record)
+		for record in visibleNodes:
+			if record.item is None:
+				self.materializeNode(record)
+		for edge in visibleEdges:
+			if edge.item is None:
+				self.materializeEdge(edge)
+
+	def materializeNode(self, record: VirtualNode):
+		if len(self.nodePool) > 0:
+			item = self.nodePool.pop()
+		else: item = Node(record.getName(), record.type, record.nodeInfo)
+		item.bind(record)
+		record.item = item
+		self.nodeItems[record] = item
+		self.scene.addItem(item)
+
+	def releaseNode(self, record: VirtualNode):
+		item = self.nodeItems.pop(record, None)
+		if item is None:
+			return
+		self.scene.removeItem(item)
+		item.setSelected(False) # Removed items keep their selection state, which would carry over when reused
+		item.bind(None)
+		record.item = None
+		self.nodePool.append(item)
+
+	def materializeEdge(self, edge: VirtualEdge):
+		if len(self.edgePool) > 0:
+			item = self.edgePool.pop()
+		else: item = Edge(edge.nodes[0], edge.nodes[1], edge.edgeInfo)
+		item.bind(edge)
+		edge.item = item
+		self.edgeItems[edge] = item
+		self.scene.addItem(item)
+
+	def releaseEdge(self, edge: VirtualEdge):
+		item = self.edgeItems.pop(edge, None)
+		if item is None:
+			return
+		self.scene.removeItem(item)
+		item.setSelected(False)
+		item.bind(None)
+		edge.item = None
+		self.edgePool.append(item)
+
+	def clear(self):
+		# Materialized items are deleted along with the scene contents
+		for record in self.nodeItems.keys():
+			record.item = None
+		for edge in self.edgeItems.keys():
+			edge.item = None
+		self.nodeItems.clear()
+		self.edgeItems.clear()
+		self.index.clear()
+		self.bounds = QRectF()
+		self.lastVisibleRect = QRectF()
 
-	def updateNodeInterface(self, node: Node, value: int):
-		ni = self.getNodeIndex(node)
-		self.edgeInfo["INTERFACES"][ni] = value
-	
-	def getNodeInterfaceIndex(self, node: Node):
-		return self.edgeInfo["INTERFACES"][self.getNodeIndex(node)]
 
 if __name__ == "__main__":
 	app = QApplication()
@@ -1246,8 +3376,13 @@ if __name__ == "__main__":
 
 	userSettings = QSettings("NIEP", "NIEPx")
 	initializeUserSettings()
+	tracing.start_from_environment()
 	window = WindowClass()
 	window.show()
+	# The modules deferred at startup are imported once the window is up
+	QTimer.singleShot(0, lambda: lazy_modules.preload(["networkx", "file_export", "layout_engine", "subnet_analysis", "topology_generators"]))
 
 	app.exec()
 	userSettings.sync()
+	if tracing.recording:
+		tracing.stop()
@@ -0,0 +1,156 @@
+import os
+import sys
+import gc
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+
+# Times saving, loading, exporting, renaming and repainting synthetic topologies of increasing
+# size on Qt's offscreen platform, and writes every measurement to a JSON file so that runs of
+# different commits can be compared:
+#   python benchmarks/bench_hot_paths.py --sizes 100,1000,10000 -o results.json
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6 import __version__ as pysideVersion
+from PySide6.QtCore import QSettings
+from PySide6.QtWidgets import QApplication
+import networkx as nx
+import file_export
+import synthetic
+
+def git_commit() -> str | None:
+	try:
+		return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, capture_output=True, text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def measure(fn, repeat: int) -> list[float]:
+	times = []
+	for _ in range(repeat):
+		gc.collect()
+		start = time.perf_counter()
+		fn()
+		times.append(time.perf_counter() - start)
+	return times
+
+class Suite:
+	def __init__(self, app, workdir: str, repeat: int):
+		self.app = app
+		self.workdir = workdir
+		self.repeat = repeat
+		self.window = app.WindowClass()
+		self.window.resize(1280, 800)
+		self.window.show()
+		self.results = []
+
+	def record(self, benchmark: str, nodes: int, edges: int, times: list[float], operations: int = 1):
+		perOperation = sorted(t / operations for t in times)
+		self.results.append({
+			"benchmark": benchmark,
+			"nodes": nodes,
+			"edges": edges,
+			"operations": operations,
+			"seconds": perOperation,
+			"min": perOperation[0],
+			"median": perOperation[len(perOperation) // 2]
+		})
+		print(f"{benchmark:>20} {nodes:>7} nodes: median {perOperation[len(perOperation) // 2] * 1000:10.2f} ms", flush=True)
+
+	def settle(self):
+		for _ in range(3):
+			QApplication.processEvents()
+
+	def run(self, nodes: int, degree: float, interfaces: int, seed: int):
+		npgi = synthetic.synthetic_nodes(nodes, degree, interfaces, seed)
+		edges = len(npgi["TOPO"]["CONNECTIONS"]) + sum(ovs["CONTROLLER"] is not None for ovs in npgi["TOPO"]["MININET"]["OVSWITCHES"])
+		source = os.path.join(self.workdir, f"synthetic{nodes}.npgi")
+		with open(source, "w") as fp:
+			json.dump(npgi, fp, indent=4)
+
+		# loadTopology without its file dialog, split into reading the file and filling the scene
+		readTimes, openTimes = [], []
+		for _ in range(self.repeat):
+			gc.collect()
+			start = time.perf_counter()
+			topo = file_export.load_NPGI_file(source)
+			read = time.perf_counter()
+			self.window.openTopologyDict(topo)
+			readTimes.append(read - start)
+			openTimes.append(time.perf_counter() - read)
+			self.settle()
+		self.record("load_NPGI_file", nodes, edges, readTimes)
+		self.record("openTopologyDict", nodes, edges, openTimes)
+		self.record("loadTopology", nodes, edges, [r + o for r, o in zip(readTimes, openTimes)])
+
+		scene = self.window.mainWidget.view.scene
+		G: nx.Graph = scene.netgraph
+		self.record("generate_topo_dict", nodes, edges, measure(lambda: file_export.generate_topo_dict(G, "Topology"), self.repeat))
+		target = os.path.join(self.workdir, "saved.npgi")
+		self.record("generate_NPGI_file", nodes, edges, measure(lambda: file_export.generate_NPGI_file(G, target), self.repeat))
+		exports = iter(range(self.repeat))
+		def exportDir():
+			file_export.export_directory(G, os.path.join(self.workdir, f"export{nodes}-{next(exports)}"), "Synthetic")
+		self.record("exportDir", nodes, edges, measure(exportDir, self.repeat))
+
+		# Every host is renamed and renamed back, at most 200 of them
+		renamed = npgi["TOPO"]["MININET"]["HOSTS"][:200]
+		def renameAll():
+			for host in renamed:
+				scene.renameNode(host["ID"], f"{host['ID']}x")
+			for host in renamed:
+				scene.renameNode(f"{host['ID']}x", host["ID"])
+		self.record("renameNode", nodes, edges, measure(renameAll, self.repeat), 2 * len(renamed))
+
+		view = self.window.mainWidget.view
+		self.settle()
+		view.fitInView(scene.itemsBoundingRect())
+		self.settle()
+		self.record("repaint_fit", nodes, edges, measure(lambda: view.viewport().grab(), self.repeat))
+		view.resetTransform()
+		view.centerOn(scene.itemsBoundingRect().center())
+		self.settle()
+		self.record("repaint_1to1", nodes, edges, measure(lambda: view.viewport().grab(), self.repeat))
+		scene.clear()
+		self.settle()
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Times the hot paths of the editor on synthetic topologies")
+	parser.add_argument("--sizes", default="100,1000,10000,100000", help="comma separated node counts")
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--degree", type=float, default=2.0, help="mean links between switches per switch")
+	parser.add_argument("--interfaces", type=int, default=1, help="interfaces of every host and VM")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("-o", "--output", default="benchmark-results.json")
+	args = parser.parse_args()
+	sizes = sorted(int(size) for size in args.sizes.split(","))
+
+	qapp = QApplication.instance() or QApplication([])
+	workdir = tempfile.mkdtemp(prefix="niep-bench-")
+	import app
+	app.userSettings = QSettings(os.path.join(workdir, "settings.ini"), QSettings.Format.IniFormat)
+	app.initializeUserSettings()
+	try:
+		suite = Suite(app, workdir, args.repeat)
+		for size in sizes:
+			suite.run(size, args.degree, args.interfaces, args.seed)
+	finally:
+		shutil.rmtree(workdir, ignore_errors=True)
+	report = {
+		"commit": git_commit(),
+		"python": platform.python_version(),
+		"pyside": pysideVersion,
+		"platform": platform.platform(),
+		"parameters": {"sizes": sizes, "repeat": args.repeat, "degree": args.degree, "interfaces": args.interfaces, "seed": args.seed},
+		"results": suite.results
+	}
+	with open(args.output, "w") as fp:
+		json.dump(report, fp, indent=4)
+	print(f"Results written to {args.output}")
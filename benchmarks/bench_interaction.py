@@ -0,0 +1,225 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+# Drives the editor with synthesized mouse and key events on Qt's offscreen platform and
+# reports latency percentiles per kind of interaction. A sample runs from the first event
+# sent to the end of the repaint it causes. Results can be stored as a baseline that later
+# runs are compared with, the exit code being 1 when an interaction got slower:
+#   python benchmarks/bench_interaction.py --nodes 2000 --save-baseline baseline.json
+#   python benchmarks/bench_interaction.py --nodes 2000 --baseline baseline.json
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QSettings, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+import synthetic
+
+PERCENTILES = (50, 95, 99)
+
+def percentile(samples: list[float], q: float) -> float:
+	# Nearest rank
+	ordered = sorted(samples)
+	return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))]
+
+def summary(samples: list[float]) -> dict:
+	return {"samples": len(samples), **{f"p{q}": percentile(samples, q) for q in PERCENTILES}}
+
+class Harness:
+	def __init__(self, app, nodes: int, seed: int, zoom: float):
+		self.app = app
+		self.rnd = random.Random(seed)
+		self.window = app.WindowClass()
+		self.window.resize(1280, 800)
+		self.window.show()
+		self.window.openTopologyDict(synthetic.synthetic_nodes(nodes, seed=seed))
+		self.view = self.window.mainWidget.view
+		self.scene = self.view.scene
+		self.viewer = self.window.editMenu.elementViewer
+		self.view.resetTransform()
+		self.view.scale(zoom, zoom)
+		self.view.centerOn(self.scene.itemsBoundingRect().center())
+		self.settle()
+		self.latencies: dict[str, list[float]] = {}
+
+	def settle(self):
+		# Runs posted events, zero interval timers and pending repaints
+		for _ in range(3):
+			QApplication.processEvents()
+
+	def sample(self, name: str, interact):
+		self.settle()
+		start = time.perf_counter()
+		interact()
+		self.settle()
+		self.view.viewport().repaint()
+		self.latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+	def mouse(self, type: QEvent.Type, pos: QPoint, button=Qt.MouseButton.LeftButton):
+		viewport = self.view.viewport()
+		buttons = Qt.MouseButton.NoButton if type == QEvent.Type.MouseButtonRelease else Qt.MouseButton.LeftButton
+		event = QMouseEvent(type, QPointF(pos), QPointF(viewport.mapToGlobal(pos)), button, buttons, Qt.KeyboardModifier.NoModifier)
+		QApplication.sendEvent(viewport, event)
+
+	def click(self, pos: QPoint):
+		self.mouse(QEvent.Type.MouseButtonPress, pos)
+		self.mouse(QEvent.Type.MouseButtonRelease, pos)
+
+	def drag(self, start: QPoint, end: QPoint, steps: int = 8):
+		self.mouse(QEvent.Type.MouseButtonPress, start)
+		for i in range(1, steps + 1):
+			self.mouse(QEvent.Type.MouseMove, start + (end - start) * (i / steps), Qt.MouseButton.NoButton)
+		self.mouse(QEvent.Type.MouseButtonRelease, end)
+
+	def visibleNodes(self, types: set[str]) -> list:
+		# Materialized nodes whose centre is well inside the viewport
+		area = self.view.viewport().rect().adjusted(60, 60, -60, -60)
+		nodes = []
+		for item in self.scene.items(self.view.mapToScene(area).boundingRect()):
+			if isinstance(item, self.app.Node) and item.type in types and area.contains(self.view.mapFromScene(item.pos())):
+				nodes.append(item)
+		return nodes
+
+	def pick(self, types: set[str]):
+		nodes = self.visibleNodes(types)
+		if len(nodes) == 0:
+			# Moves to another part of the topology, outside of the measured time
+			names = [name for name, obj in self.scene.netgraph.nodes(data="obj") if obj.type in types]
+			if len(names) == 0:
+				raise RuntimeError(f"No {'/'.join(sorted(types))} node left")
+			self.view.centerOn(self.scene.getNode(self.rnd.choice(names))["obj"].pos())
+			self.settle()
+			nodes = self.visibleNodes(types)
+		return self.rnd.choice(nodes)
+
+	def unlinkedPair(self):
+		# Two switches without a link between them that fit in the viewport, which is centred on them
+		# outside of the measured time
+		graph = self.scene.netgraph
+		switches = [obj for _, obj in graph.nodes(data="obj") if obj.type in ("Switch", "OVSwitch")]
+		area = self.view.mapToScene(self.view.viewport().rect().adjusted(60, 60, -60, -60)).boundingRect()
+		for _ in range(20):
+			u = self.rnd.choice(switches)
+			others = [v for v in switches if v is not u and not graph.has_edge(u.getName(), v.getName())]
+			if len(others) == 0:
+				continue
+			v = min(others, key=lambda v: (v.pos() - u.pos()).manhattanLength())
+			if abs(v.pos().x() - u.pos().x()) < area.width() and abs(v.pos().y() - u.pos().y()) < area.height():
+				self.view.centerOn((u.pos() + v.pos()) / 2)
+				self.settle()
+				return u, v
+		raise RuntimeError("No unlinked pair of switches fits in the viewport, try a lower zoom")
+
+	def emptyPoint(self) -> QPoint:
+		# A point of the viewport without items under it, where a press starts a rubber band
+		rect = self.view.viewport().rect()
+		for y in range(10, rect.height() // 2, 10):
+			for x in range(10, rect.width() // 2, 10):
+				if len(self.scene.items(self.view.mapToScene(QRect(x - 10, y - 10, 20, 20)))) == 0:
+					return QPoint(x, y)
+		raise RuntimeError("No empty area in the viewport, try a higher zoom")
+
+	def at(self, node) -> QPoint:
+		return self.view.mapFromScene(node.pos())
+
+	def selectNode(self, node):
+		self.scene.clearSelection()
+		node.setSelected(True)
+		self.settle()
+
+	def run(self, samples: int):
+		self.window.setToolMode(self.app.ToolMode.SELECT)
+		for _ in range(samples):
+			node = self.pick({"Host", "Switch", "VM", "OVSwitch"})
+			self.sample("select", lambda: self.click(self.at(node)))
+		corner = self.emptyPoint()
+		for _ in range(samples):
+			end = corner + QPoint(self.rnd.randint(150, 400), self.rnd.randint(100, 400))
+			self.sample("rubberband", lambda: self.drag(corner, end))
+		for _ in range(samples):
+			node = self.pick({"Host", "Switch", "VM", "OVSwitch"})
+			start = self.at(node)
+			self.sample("drag", lambda: self.drag(start, start + QPoint(self.rnd.randint(-40, 40), self.rnd.randint(-40, 40))))
+
+		for _ in range(samples):
+			vm = self.pick({"VM"})
+			self.selectNode(vm)
+			memory = next(editor for editor, _ in self.viewer.panel.editors if getattr(editor, "modKey", None) == "MEMORY")
+			self.sample("edit", lambda: QTest.keyClick(memory.keyEdit, Qt.Key.Key_Up))
+		for i in range(samples):
+			host = self.pick({"Host"})
+			self.selectNode(host)
+			nameEdit = self.viewer.panel.nameEdit.nameEdit
+			def rename():
+				nameEdit.setText(f"Renamed{i}")
+				QTest.keyClick(nameEdit, Qt.Key.Key_Return)
+			self.sample("rename", rename)
+
+		self.window.setToolMode(self.app.ToolMode.CONNECT)
+		for _ in range(samples):
+			u, v = self.unlinkedPair()
+			self.scene.clearSelection()
+			self.sample("connect", lambda: (self.click(self.at(u)), self.click(self.at(v))))
+		self.window.setToolMode(self.app.ToolMode.DELETE)
+		for _ in range(samples):
+			host = self.pick({"Host", "VM"})
+			self.sample("delete", lambda: self.click(self.at(host)))
+		self.window.setToolMode(self.app.ToolMode.SELECT)
+		return {name: summary(latencies) for name, latencies in self.latencies.items()}
+
+def regressions(current: dict, baseline: dict, tolerance: float, floor: float) -> list[str]:
+	# Percentiles slower than the baseline by more than the tolerance and the floor in seconds
+	messages = []
+	for name, stats in current.items():
+		base = baseline.get(name)
+		if base is None:
+			continue
+		for q in PERCENTILES:
+			key = f"p{q}"
+			if stats[key] > base[key] * (1 + tolerance) and stats[key] - base[key] > floor:
+				messages.append(f"{name} {key}: {base[key] * 1000:.1f} ms -> {stats[key] * 1000:.1f} ms")
+	return messages
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Measures interaction latency of the editor")
+	parser.add_argument("--nodes", type=int, default=2000)
+	parser.add_argument("--samples", type=int, default=50, help="samples per interaction")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--zoom", type=float, default=0.4, help="scale of the view, which sets how many nodes are on screen")
+	parser.add_argument("-o", "--output", help="JSON file of the results")
+	parser.add_argument("--save-baseline", help="stores the results as a baseline")
+	parser.add_argument("--baseline", help="baseline to compare with")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+	parser.add_argument("--floor", type=float, default=2.0, help="slowdowns below this many ms are ignored")
+	args = parser.parse_args()
+
+	qapp = QApplication.instance() or QApplication([])
+	import app
+	app.userSettings = QSettings(os.path.join(tempfile.mkdtemp(prefix="niep-latency-"), "settings.ini"), QSettings.Format.IniFormat)
+	app.initializeUserSettings()
+	results = Harness(app, args.nodes, args.seed, args.zoom).run(args.samples)
+	print(f"{'interaction':>12} {'p50':>9} {'p95':>9} {'p99':>9}")
+	for name, stats in results.items():
+		print(f"{name:>12}" + "".join(f" {stats[f'p{q}'] * 1000:7.1f}ms" for q in PERCENTILES))
+	report = {"parameters": {"nodes": args.nodes, "samples": args.samples, "seed": args.seed, "zoom": args.zoom}, "interactions": results}
+	for path in (args.output, args.save_baseline):
+		if path:
+			with open(path, "w") as fp:
+				json.dump(report, fp, indent=4)
+	if args.baseline:
+		with open(args.baseline, "r") as fp:
+			baseline = json.load(fp)
+		if baseline["parameters"] != report["parameters"]:
+			print(f"Baseline was measured with {baseline['parameters']}", file=sys.stderr)
+		slower = regressions(results, baseline["interactions"], args.tolerance, args.floor / 1000)
+		for message in slower:
+			print(f"Regression: {message}", file=sys.stderr)
+		sys.exit(1 if len(slower) > 0 else 0)
@@ -0,0 +1,82 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# Starts the editor in fresh interpreters on Qt's offscreen platform and times the imports,
+# the window construction and its first paint. The exit code is 1 when the median time to the
+# first paint exceeds the budget, or when a deferred module was imported before it:
+#   python benchmarks/bench_startup.py --runs 5 --budget 1500
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFERRED = ("networkx", "numpy", "requests")
+
+def child():
+	# Runs in the measured interpreter, reporting times from the start of this function
+	start = time.perf_counter()
+	os.environ["QT_QPA_PLATFORM"] = "offscreen"
+	sys.path.insert(0, REPO)
+	from PySide6.QtCore import QSettings
+	from PySide6.QtWidgets import QApplication
+	qapp = QApplication([])
+	qtReady = time.perf_counter()
+	import app
+	imported = time.perf_counter()
+	app.userSettings = QSettings(os.path.join(os.environ.get("TMPDIR", "/tmp"), "niep-startup.ini"), QSettings.Format.IniFormat)
+	app.initializeUserSettings()
+	window = app.WindowClass()
+	built = time.perf_counter()
+	window.show()
+	qapp.processEvents()
+	shown = time.perf_counter()
+	print(json.dumps({
+		"qt": qtReady - start,
+		"import": imported - qtReady,
+		"window": built - imported,
+		"show": shown - built,
+		"total": shown - start,
+		"loaded": [name for name in DEFERRED if name in sys.modules]
+	}))
+
+def measure(runs: int) -> list[dict]:
+	samples = []
+	for _ in range(runs):
+		launched = time.perf_counter()
+		output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"], capture_output=True, text=True, check=True).stdout
+		sample = json.loads(output.strip().splitlines()[-1])
+		# Includes starting the interpreter
+		sample["process"] = time.perf_counter() - launched
+		samples.append(sample)
+	return samples
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Times the startup of the editor")
+	parser.add_argument("--runs", type=int, default=5)
+	parser.add_argument("--budget", type=float, default=1500, help="budget of the median time from launch to the first paint, in ms")
+	parser.add_argument("-o", "--output", help="JSON file of the results")
+	parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+	args = parser.parse_args()
+	if args.child:
+		child()
+		sys.exit(0)
+
+	samples = measure(args.runs)
+	phases = ("qt", "import", "window", "show", "total", "process")
+	medians = {phase: statistics.median(sample[phase] for sample in samples) for phase in phases}
+	for phase in phases:
+		print(f"{phase:>8} {medians[phase] * 1000:8.1f} ms")
+	loaded = sorted({name for sample in samples for name in sample["loaded"]})
+	failures = []
+	if medians["process"] * 1000 > args.budget:
+		failures.append(f"first paint after {medians['process'] * 1000:.0f} ms, over the {args.budget:.0f} ms budget")
+	if len(loaded) > 0:
+		failures.append(f"{', '.join(loaded)} imported before the first paint")
+	if args.output:
+		with open(args.output, "w") as fp:
+			json.dump({"budget": args.budget, "medians": medians, "samples": samples}, fp, indent=4)
+	for failure in failures:
+		print(f"Startup: {failure}", file=sys.stderr)
+	sys.exit(1 if len(failures) > 0 else 0)
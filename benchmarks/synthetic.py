@@ -0,0 +1,101 @@
+import math
+import random
+
+# Seeded synthetic topologies in the NPGI format. Switches and OVSwitches form the fabric,
+# laid out on a grid: each is linked to the previous one of its row, or the one above it,
+# which keeps the fabric connected, and extra links to nearby switches bring the mean number
+# of fabric links per switch up to degree. Hosts and VMs are placed around the switch of their
+# first interface, other interfaces going to switches next to it, and OVSwitches are spread
+# over the controllers.
+
+SPACING = 150
+MIX = {"HOSTS": 0.7, "SWITCHES": 0.1, "VMS": 0.15, "OVSWITCHES": 0.04, "CONTROLLERS": 0.01}
+
+def node_mix(nodes: int) -> dict[str, int]:
+	# Node counts per kind adding up to nodes, with at least one switch
+	counts = {kind: int(nodes * share) for kind, share in MIX.items()}
+	counts["SWITCHES"] = max(counts["SWITCHES"], 1)
+	counts["HOSTS"] += max(nodes - sum(counts.values()), 0)
+	return counts
+
+def mac_address(i: int) -> str:
+	return ":".join(f"{b:02x}" for b in (2, 0, (i >> 24) & 255, (i >> 16) & 255, (i >> 8) & 255, i & 255))
+
+def ip_address(i: int) -> str:
+	return f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}/8"
+
+def synthetic_topology(hosts: int, switches: int, vms: int = 0, ovswitches: int = 0, controllers: int = 0,
+		degree: float = 2.0, interfaces: int = 1, seed: int = 0) -> dict:
+	rnd = random.Random(seed)
+	addresses = iter(range(1, 1 << 32))
+	hostNames = [f"Host{i}" for i in range(1, hosts + 1)]
+	switchNames = [f"Switch{i}" for i in range(1, switches + 1)]
+	vmNames = [f"VM{i}" for i in range(1, vms + 1)]
+	ovsNames = [f"OVSwitch{i}" for i in range(1, ovswitches + 1)]
+	controllerNames = [f"Controller{i}" for i in range(1, controllers + 1)]
+	fabric = switchNames + ovsNames
+	if len(fabric) == 0 and hosts + vms > 0:
+		raise ValueError("Hosts and VMs need at least one switch")
+
+	columns = max(math.ceil(math.sqrt(len(fabric))), 1)
+	endpoints = (hosts + vms) * interfaces / max(len(fabric), 1)
+	radius = SPACING * (1 + math.sqrt(endpoints) / 2)
+	cell = 2 * radius + SPACING
+	positions = {name: [i % columns * cell, i // columns * cell] for i, name in enumerate(fabric)}
+	def nearby(i: int, reach: int) -> list[int]:
+		row, column = divmod(i, columns)
+		cells = [(r, c) for r in range(row - reach, row + reach + 1) for c in range(column - reach, column + reach + 1)]
+		return [r * columns + c for r, c in cells if 0 <= c < columns and 0 <= r * columns + c < len(fabric) and r * columns + c != i]
+
+	connections = []
+	links = set()
+	for i in range(1, len(fabric)):
+		links.add((fabric[i - 1 if i % columns > 0 else i - columns], fabric[i]))
+	extra = int(len(fabric) * degree / 2) - len(links)
+	# Bounded attempts, since small fabrics may not have that many distinct pairs
+	for _ in range(4 * max(extra, 0)):
+		if extra <= 0:
+			break
+		i = rnd.randrange(len(fabric))
+		u, v = fabric[i], fabric[rnd.choice(nearby(i, 2) or [i])]
+		if u != v and (u, v) not in links and (v, u) not in links:
+			links.add((u, v))
+			extra -= 1
+	connections.extend({"IN/OUT": u, "OUT/IN": v} for u, v in sorted(links))
+
+	def place(name: str, ifaces: list[dict]):
+		i = rnd.randrange(len(fabric))
+		angle, distance = rnd.uniform(0, 2 * math.pi), rnd.uniform(SPACING, radius)
+		x, y = positions[fabric[i]]
+		positions[name] = [x + distance * math.cos(angle), y + distance * math.sin(angle)]
+		switches = [i] + [rnd.choice(nearby(i, 1) or [i]) for _ in ifaces[1:]]
+		connections.extend({"IN/OUT": name, "IN/OUTIFACE": iface["MAC"], "OUT/IN": fabric[j]} for iface, j in zip(ifaces, switches))
+
+	hostList = []
+	for name in hostNames:
+		ifaces = [{"IP": ip_address(next(addresses)), "MAC": mac_address(next(addresses))} for _ in range(interfaces)]
+		hostList.append({"ID": name, "INTERFACES": ifaces})
+		place(name, ifaces)
+	vmList = []
+	for name in vmNames:
+		ifaces = [{"ID": f"br{i}", "MAC": mac_address(next(addresses))} for i in range(interfaces)]
+		vmList.append({"ID": name, "MEMORY": 300, "VCPU": 1, "DISK": "click-on-osv", "MANAGEMENT_MAC": mac_address(next(addresses)), "INTERFACES": ifaces})
+		place(name, ifaces)
+	controllerList = [{"ID": name, "IP": ip_address(next(addresses)).split("/")[0], "PORT": "3000"} for name in controllerNames]
+	ovsList = [{"ID": name, "CONTROLLER": controllerNames[i % controllers] if controllers > 0 else None} for i, name in enumerate(ovsNames)]
+
+	for i, name in enumerate(controllerNames):
+		positions[name] = [i * SPACING, -cell]
+	topo = {
+		"ID": "Synthetic",
+		"VMS": [f"./VMS/{name}.json" for name in vmNames],
+		"VNFS": [],
+		"SFCS": [],
+		"MININET": {"HOSTS": hostList, "SWITCHES": switchNames, "CONTROLLERS": controllerList, "OVSWITCHES": ovsList},
+		"CONNECTIONS": connections
+	}
+	return {"VERSION": "1.0", "TOPO": topo, "VMS": vmList, "POSITIONS": positions}
+
+def synthetic_nodes(nodes: int, degree: float = 2.0, interfaces: int = 1, seed: int = 0) -> dict:
+	counts = node_mix(nodes)
+	return synthetic_topology(counts["HOSTS"], counts["SWITCHES"], counts["VMS"], counts["OVSWITCHES"], counts["CONTROLLERS"], degree, interfaces, seed)
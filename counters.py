@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import itertools
+
+# Cheap measurements for the performance panel: how long the last load, save and export took,
+# and memory estimates made from a sample of the objects of a subsystem scaled to their count.
+
+durations: dict[str, float] = {} # Operation -> seconds taken the last time
+
+class timed:
+	def __init__(self, operation: str):
+		self.operation = operation
+
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+
+	def __exit__(self, *exc):
+		durations[self.operation] = time.perf_counter() - self.start
+		return False
+
+def deep_size(obj, seen: set | None = None) -> int:
+	# Bytes of an object and the dicts, lists, tuples, sets and strings it holds. Other objects,
+	# such as Qt items referred to by node info, are counted by their own size only.
+	seen = set() if seen is None else seen
+	if id(obj) in seen:
+		return 0
+	seen.add(id(obj))
+	size = sys.getsizeof(obj)
+	if isinstance(obj, dict):
+		size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+	elif isinstance(obj, (list, tuple, set, frozenset)):
+		size += sum(deep_size(v, seen) for v in obj)
+	return size
+
+def sampled_size(objects, count: int, sample: int = 200, measure=deep_size) -> int:
+	# Estimated size of count objects from evenly spread samples of them
+	if count == 0:
+		return 0
+	step = max(count // sample, 1)
+	picked = list(itertools.islice(objects, 0, None, step))
+	if len(picked) == 0:
+		return 0
+	return sum(measure(obj) for obj in picked) * count // len(picked)
+
+def process_memory() -> int | None:
+	# Resident set size, or the peak one where /proc is not available
+	try:
+		with open("/proc/self/statm", "r") as fp:
+			return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, AttributeError):
+		pass
+	try:
+		import resource
+		peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		return peak if sys.platform == "darwin" else peak * 1024
+	except ImportError:
+		return None
+
+def format_bytes(size: int) -> str:
+	for unit in ("B", "KB", "MB"):
+		if abs(size) < 1024:
+			return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+		size /= 1024
+	return f"{size:.1f} GB"
@@ -1,6 +1,13 @@
+from __future__ import annotations
 import json
-import networkx as nx
+import os
+import shutil
 import copy
+import tracing
+from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+if TYPE_CHECKING:
+	import networkx as nx # Only annotations refer to it
 
 def add_default_extension(filepath: str, extension: str):
 	if len(filepath.split("/")[-1].split(".")) == 1:
@@ -32,6 +39,7 @@ def get_VNFs(G: nx.Graph):
 		vnfs.append(f"./VNFS/{node}.json")
 	return vnfs'''
 
+@tracing.traced()
 def get_VMs_and_VNFs(G: nx.Graph):
 	vms = []
 	vnfs = []
@@ -78,6 +86,7 @@ def get_OVswitches(G: nx.Graph):
 		ovswitches.append(ovs)
 	return ovswitches
 
+@tracing.traced()
 def get_mininet(G: nx.Graph):
 	mini = dict()
 	mini["HOSTS"] = get_hosts(G)
@@ -86,6 +95,7 @@ def get_mininet(G: nx.Graph):
 	mini["OVSWITCHES"] = get_OVswitches(G)
 	return mini
 
+@tracing.traced()
 def get_connections(G: nx.Graph):
 	connections = []
 	for e in G.edges:
@@ -111,6 +121,7 @@ def get_connections(G: nx.Graph):
 		connections.append(connection)
 	return connections
 
+@tracing.traced()
 def generate_topo_dict(G: nx.Graph, filepath: str):
 	topo = dict()
 	# Only to guarantee a valid topology, resulting file should never get this ID unless the user wants to
@@ -129,6 +140,7 @@ def generate_topo_file(G: nx.Graph, filepath: str):
 
 # Node position JSON generator
 
+@tracing.traced()
 def generate_position_dict(G: nx.Graph):
 	positions = dict()
 	for n in G.nodes:
@@ -146,6 +158,7 @@ def generate_position_file(G: nx.Graph, filepath: str):
 
 # JSON Definitions
 
+@tracing.traced()
 def generate_VM_definitions(G: nx.Graph):
 	vms = []
 	for node in G.nodes:
@@ -164,6 +177,7 @@ def generate_VM_definitions(G: nx.Graph):
 		vms.append(vm)
 	return vms
 
+@tracing.traced()
 def generate_VNF_definitions(topo: dict):
 	vnfs = []
 	for vnf in topo["VNFS"]:
@@ -178,18 +192,90 @@ def generate_VNF_definitions(topo: dict):
 
 # NPGI file exporter
 
-def generate_NPGI_file(G: nx.graph, filepath: str):
+@tracing.traced()
+def generate_NPGI_dict(G: nx.Graph, filepath: str):
 	npgi = dict()
 	npgi["VERSION"] = "1.0"
 	npgi["TOPO"] = generate_topo_dict(G, filepath)
 	npgi["VMS"] = generate_VM_definitions(G)
 	npgi["POSITIONS"] = generate_position_dict(G)
+	return npgi
+
+@tracing.traced()
+def generate_NPGI_file(G: nx.graph, filepath: str):
+	npgi = generate_NPGI_dict(G, filepath)
 
-	with open(add_default_extension(filepath, "npgi"), "w") as fp:
+	with tracing.span("file_export.write_NPGI"), open(add_default_extension(filepath, "npgi"), "w") as fp:
 		json.dump(npgi, fp, indent=4)
 
+@tracing.traced()
 def load_NPGI_file(filepath: str):
 	npgi: dict
 	with open(filepath, "r") as fp:
 		npgi = json.load(fp)
 	return npgi
+
+# NIEP export directory
+
+@tracing.traced()
+def export_directory(G: nx.Graph, dirpath: str, topoid: str, archive: bool = False):
+	# Writes the topology JSON and the VM and VNF definitions it refers to under dirpath,
+	# then zips the directory into dirpath.zip with archive
+	os.mkdir(dirpath)
+	os.mkdir(f"{dirpath}/VMS")
+	os.mkdir(f"{dirpath}/VNFS")
+	topo = generate_topo_dict(G, "Topology")
+	topo["ID"] = topoid
+	vms = generate_VM_definitions(G)
+	vnfs = generate_VNF_definitions(topo)
+	with tracing.span("file_export.write_topology"), open(f"{dirpath}/{topo['ID']}.json", "w") as fp:
+		json.dump(topo, fp, indent=4)
+	with tracing.span("file_export.write_VMs", files=len(vms)):
+		for vm in vms:
+			with open(f"{dirpath}/VMS/{vm['ID']}.json", "w") as fp:
+				json.dump(vm, fp, indent=4)
+	with tracing.span("file_export.write_VNFs", files=len(vnfs)):
+		for vnf in vnfs:
+			with open(f"{dirpath}/VNFS/{vnf['ID']}.json", "w") as fp:
+				json.dump(vnf, fp, indent=4)
+	if archive:
+		with tracing.span("file_export.archive"):
+			shutil.make_archive(dirpath, "zip", f"{dirpath}/../", dirpath)
+
+# NIEP topology import
+
+def read_json(filepath: str):
+	with open(filepath, "r") as fp:
+		return json.load(fp)
+
+def find_topology_file(dirpath: str) -> str:
+	# The topology JSON of an exported directory lies next to its VMS and VNFS directories
+	for name in sorted(os.listdir(dirpath)):
+		filepath = os.path.join(dirpath, name)
+		if name.endswith(".json") and os.path.isfile(filepath) and "MININET" in read_json(filepath):
+			return filepath
+	raise FileNotFoundError(f"No NIEP topology JSON in {dirpath}")
+
+@tracing.traced()
+def load_NIEP_topology(path: str, workers: int = 8) -> dict:
+	# NPGI dict, without positions, of a NIEP topology JSON or of a directory exported by the editor.
+	# The VM and VNF definitions referred to by the topology are read and parsed on a thread pool.
+	if os.path.isdir(path):
+		path = find_topology_file(path)
+	topo = read_json(path)
+	mininet = topo.setdefault("MININET", {})
+	for key in ("HOSTS", "SWITCHES", "CONTROLLERS", "OVSWITCHES"):
+		mininet.setdefault(key, [])
+	topo.setdefault("CONNECTIONS", [])
+	base = os.path.dirname(path)
+	def resolve(reference: str) -> str:
+		return os.path.normpath(os.path.join(base, reference))
+
+	vmFiles = [resolve(r) for r in topo.setdefault("VMS", [])]
+	vnfFiles = [resolve(r) for r in topo.setdefault("VNFS", [])]
+	with ThreadPoolExecutor(max_workers=workers) as pool:
+		definitions = list(pool.map(read_json, vmFiles + vnfFiles))
+		vms, vnfs = definitions[:len(vmFiles)], definitions[len(vmFiles):]
+		# VNF definitions name the file of their VM
+		vms.extend(pool.map(read_json, [resolve(vnf["VM"]) for vnf in vnfs]))
+	return {"VERSION": "1.0", "TOPO": topo, "VMS": vms, "POSITIONS": {}}
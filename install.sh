@@ -1,6 +1,6 @@
 #!/bin/bash
 
-PIP_DEP=("pyside6" "networkx" "matplotlib")
+PIP_DEP=("pyside6" "networkx" "numpy")
 
 if [ $# -gt 0 ]
 then
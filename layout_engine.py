@@ -0,0 +1,204 @@
+import numpy as np
+
+# Automatic node placement for topologies without stored positions.
+# Every function takes node indices (0..n-1) and an (m, 2) integer edge array
+# and returns an (n, 2) float array of scene coordinates.
+
+TYPE_RANKS = {
+	"Controller": 0,
+	"OVSwitch": 1,
+	"Switch": 1,
+	"Host": 2,
+	"VM": 2
+}
+
+def edge_array(edges) -> np.ndarray:
+	edges = np.asarray(edges, dtype=np.int64)
+	return edges.reshape(-1, 2)
+
+def csr_adjacency(n: int, edges: np.ndarray):
+	src = np.concatenate([edges[:, 0], edges[:, 1]])
+	dst = np.concatenate([edges[:, 1], edges[:, 0]])
+	order = np.argsort(src, kind="stable")
+	indptr = np.zeros(n + 1, dtype=np.int64)
+	np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+	return indptr, dst[order]
+
+def expand_ranges(starts: np.ndarray, counts: np.ndarray):
+	# Returns, for every range, the repeated range index and the positions start..start+count-1
+	total = int(counts.sum())
+	owner = np.repeat(np.arange(len(counts)), counts)
+	offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+	return owner, np.repeat(starts, counts) + offsets
+
+# Force-directed layout
+
+def _grid_cells(pos: np.ndarray, cellSize: float, maxLevels: int = 9):
+	# Square cells of about cellSize, on a power of two grid so that cells can be merged level by level
+	low = pos.min(axis=0)
+	extent = max(float((pos.max(axis=0) - low).max()), 1e-9)
+	levels = int(np.clip(np.ceil(np.log2(extent / cellSize)), 2, maxLevels))
+	gridSize = 1 << levels
+	cells = np.floor((pos - low) / extent * gridSize).astype(np.int64)
+	return np.clip(cells, 0, gridSize - 1), levels
+
+def _near_pairs(cells: np.ndarray, gridSize: int, sources: np.ndarray):
+	# Exact interactions are only computed between nodes of the same or adjacent cells,
+	# and only for the source nodes since fixed nodes do not need their forces
+	cellId = cells[:, 0] * gridSize + cells[:, 1]
+	order = np.argsort(cellId, kind="stable")
+	counts = np.bincount(cellId, minlength=gridSize * gridSize)
+	starts = np.cumsum(counts) - counts
+	srcs, dsts = [], []
+	for ox in (-1, 0, 1):
+		for oy in (-1, 0, 1):
+			ncx, ncy = cells[sources, 0] + ox, cells[sources, 1] + oy
+			valid = (ncx >= 0) & (ncx < gridSize) & (ncy >= 0) & (ncy < gridSize)
+			nodes = sources[valid]
+			ncell = ncx[valid] * gridSize + ncy[valid]
+			owner, slots = expand_ranges(starts[ncell], counts[ncell])
+			src, dst = nodes[owner], order[slots]
+			keep = src != dst
+			srcs.append(src[keep])
+			dsts.append(dst[keep])
+	return np.concatenate(srcs), np.concatenate(dsts)
+
+def _far_field(pos: np.ndarray, cells: np.ndarray, levels: int, k2: float):
+	# Barnes-Hut style approximation on a grid pyramid: at every level a cell is pushed by
+	# the centroids of the cells that are not adjacent to it but whose parents are adjacent
+	# to its parent, so each pair of distant nodes is accounted for exactly once.
+	force = np.zeros_like(pos)
+	for level in range(2, levels + 1):
+		g = 1 << level
+		shift = levels - level
+		cx, cy = cells[:, 0] >> shift, cells[:, 1] >> shift
+		cellId = cx * g + cy
+		mass = np.bincount(cellId, minlength=g * g).astype(np.float64)
+		occupied = np.nonzero(mass)[0]
+		centroid = np.zeros((g * g, 2))
+		centroid[occupied, 0] = np.bincount(cellId, weights=pos[:, 0], minlength=g * g)[occupied] / mass[occupied]
+		centroid[occupied, 1] = np.bincount(cellId, weights=pos[:, 1], minlength=g * g)[occupied] / mass[occupied]
+		ox, oy = occupied // g, occupied % g
+		cellForce = np.zeros((g * g, 2))
+		for dx in range(-3, 4):
+			for dy in range(-3, 4):
+				if max(abs(dx), abs(dy)) < 2:
+					continue
+				tx, ty = ox + dx, oy + dy
+				valid = (tx >= 0) & (tx < g) & (ty >= 0) & (ty < g)
+				valid &= (np.abs((ox >> 1) - (tx >> 1)) <= 1) & (np.abs((oy >> 1) - (ty >> 1)) <= 1)
+				target = np.where(valid, tx * g + ty, 0)
+				valid &= mass[target] > 0
+				source, target = occupied[valid], target[valid]
+				delta = centroid[source] - centroid[target]
+				dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+				cellForce[source] += delta * (k2 * mass[target] / dist2)[:, None]
+		force += cellForce[cellId]
+	return force
+
+def force_directed_layout(n: int, edges, initial=None, fixed=None,
+		spacing: float = 250.0, iterations: int = 80, seed: int = 0) -> np.ndarray:
+	# Fruchterman-Reingold with grid accelerated repulsion
+	edges = edge_array(edges)
+	rng = np.random.default_rng(seed)
+	side = spacing * max(np.sqrt(n), 1.0)
+	if initial is None:
+		pos = rng.uniform(-side / 2, side / 2, size=(n, 2))
+	else: pos = np.array(initial, dtype=np.float64)
+	if fixed is None:
+		fixed = np.zeros(n, dtype=bool)
+	else: fixed = np.asarray(fixed, dtype=bool)
+	free = ~fixed
+	if n < 2 or not free.any():
+		return pos
+	if fixed.any():
+		# Free nodes start around the placed ones, next to their placed neighbours when they have any
+		center = pos[fixed].mean(axis=0)
+		pos[free] = center + rng.uniform(-side / 2, side / 2, size=(int(free.sum()), 2))
+		anchor = np.zeros((n, 2))
+		anchored = np.zeros(n)
+		for a, b in ((0, 1), (1, 0)):
+			use = fixed[edges[:, b]]
+			np.add.at(anchor, edges[use, a], pos[edges[use, b]])
+			np.add.at(anchored, edges[use, a], 1)
+		placed = free & (anchored > 0)
+		pos[placed] = anchor[placed] / anchored[placed, None] + rng.uniform(-spacing, spacing, size=(int(placed.sum()), 2))
+
+	active = np.nonzero(free)[0]
+	k2 = spacing * spacing
+	startTemperature = side / 10
+	for it in range(iterations):
+		temperature = max(startTemperature * (1 - it / iterations), spacing / 50)
+		cells, levels = _grid_cells(pos, 2 * spacing)
+		disp = _far_field(pos, cells, levels, k2)
+		src, dst = _near_pairs(cells, 1 << levels, active)
+		delta = pos[src] - pos[dst]
+		dist2 = np.maximum((delta ** 2).sum(axis=1), 1e-9)
+		repulsion = delta * (k2 / dist2)[:, None]
+		disp[:, 0] += np.bincount(src, weights=repulsion[:, 0], minlength=n)
+		disp[:, 1] += np.bincount(src, weights=repulsion[:, 1], minlength=n)
+		if len(edges) > 0:
+			delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+			attraction = delta * (np.sqrt((delta ** 2).sum(axis=1)) / spacing)[:, None]
+			for axis in (0, 1):
+				disp[:, axis] -= np.bincount(edges[:, 0], weights=attraction[:, axis], minlength=n)
+				disp[:, axis] += np.bincount(edges[:, 1], weights=attraction[:, axis], minlength=n)
+		length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-9)
+		step = np.minimum(length, temperature) / length
+		pos[free] += disp[free] * step[free, None]
+	return pos
+
+# Hierarchical layout
+
+def bfs_layers(n: int, edges, roots: np.ndarray, ranks: np.ndarray):
+	# Multi-source BFS; components without a root start from their lowest ranked node
+	indptr, indices = csr_adjacency(n, edge_array(edges))
+	depth = np.full(n, -1, dtype=np.int64)
+	parent = np.full(n, -1, dtype=np.int64)
+	byRank = np.lexsort((np.arange(n), ranks))
+	frontier = np.asarray(roots, dtype=np.int64)
+	nextSeed = 0
+	while True:
+		if len(frontier) == 0:
+			while nextSeed < n and depth[byRank[nextSeed]] != -1:
+				nextSeed += 1
+			if nextSeed == n:
+				break
+			frontier = byRank[nextSeed:nextSeed + 1]
+		depth[frontier] = np.maximum(depth[frontier], 0)
+		starts, counts = indptr[frontier], indptr[frontier + 1] - indptr[frontier]
+		owner, slots = expand_ranges(starts, counts)
+		src, dst = frontier[owner], indices[slots]
+		new = depth[dst] == -1
+		src, dst = src[new], dst[new]
+		dst, first = np.unique(dst, return_index=True)
+		depth[dst] = depth[src[first]] + 1
+		parent[dst] = src[first]
+		frontier = dst
+	return depth, parent
+
+def hierarchical_layout(types: list[str], edges, spacing: float = 250.0, layerGap: float = 400.0) -> np.ndarray:
+	# Controllers on top, then switches, then hosts and VMs, following BFS depth from the top ranked nodes
+	n = len(types)
+	pos = np.zeros((n, 2))
+	if n == 0:
+		return pos
+	ranks = np.array([TYPE_RANKS.get(t, len(TYPE_RANKS)) for t in types])
+	roots = np.nonzero(ranks == ranks.min())[0]
+	depth, parent = bfs_layers(n, edges, roots, ranks)
+	order = np.zeros(n)
+	# Wide layers wrap into several rows to keep the drawing close to square
+	rowLength = max(10, int(2 * np.sqrt(n)))
+	y = 0.0
+	for layer in range(int(depth.max()) + 1):
+		members = np.nonzero(depth == layer)[0]
+		# Children are ordered by the position of their parent to reduce crossings
+		key = np.where(parent[members] >= 0, order[np.maximum(parent[members], 0)], 0.0)
+		members = members[np.lexsort((members, key))]
+		slots = np.arange(len(members))
+		order[members] = slots
+		width = min(len(members), rowLength)
+		pos[members, 0] = (slots % rowLength - (width - 1) / 2) * spacing
+		pos[members, 1] = y + (slots // rowLength) * layerGap / 2
+		y += ((len(members) - 1) // rowLength) * layerGap / 2 + layerGap
+	return pos
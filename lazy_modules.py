@@ -0,0 +1,27 @@
+import importlib
+import threading
+
+# Modules that are slow to import (networkx, and numpy through the layout and analysis modules)
+# are bound to LazyModule objects, imported on the first use of one of their attributes. Once
+# the window is shown, preload() imports them on a thread so that the first load or layout
+# does not wait for them either.
+
+class LazyModule:
+	def __init__(self, name: str):
+		self.__dict__["_name"] = name
+
+	def __getattr__(self, attribute: str):
+		# import_module returns the module at once when it is already in sys.modules, and waits
+		# for another thread importing it
+		return getattr(importlib.import_module(self._name), attribute)
+
+	def __repr__(self) -> str:
+		return f"<lazy module {self._name}>"
+
+def preload(names: list[str]) -> threading.Thread:
+	def run():
+		for name in names:
+			importlib.import_module(name)
+	thread = threading.Thread(target=run, name="preload", daemon=True)
+	thread.start()
+	return thread
@@ -0,0 +1,85 @@
+import heapq
+import re
+
+# Default node names are a prefix (the node type) followed by a number, as in Host12.
+# Existing names are indexed by prefix and numeric suffix. For every prefix a cursor
+# sits past the run of used suffixes starting at 1, and suffixes freed below the
+# cursor are kept in a heap, so the next name is found in O(log n) amortized.
+
+NAME_PATTERN = re.compile(r"(.*?)([1-9][0-9]*)")
+
+def split_name(name: str) -> tuple[str, int] | None:
+	match = NAME_PATTERN.fullmatch(name)
+	if match is None:
+		return None
+	return match.group(1), int(match.group(2))
+
+class SuffixSet:
+	def __init__(self):
+		self.used: set[int] = set()
+		self.cursor = 1
+		self.gaps: list[int] = [] # Suffixes below the cursor that were freed, possibly used again since
+
+	def add(self, suffix: int):
+		self.used.add(suffix)
+		while self.cursor in self.used:
+			self.cursor += 1
+
+	def remove(self, suffix: int):
+		self.used.discard(suffix)
+		if suffix < self.cursor:
+			heapq.heappush(self.gaps, suffix)
+
+	def removeMany(self, suffixes: list[int]):
+		self.used.difference_update(suffixes)
+		self.gaps.extend(s for s in suffixes if s < self.cursor)
+		heapq.heapify(self.gaps)
+
+	def next(self, reuseGaps: bool) -> int:
+		# Consecutive calls return different suffixes even if the names are not added
+		if reuseGaps:
+			while len(self.gaps) > 0:
+				suffix = heapq.heappop(self.gaps)
+				if suffix not in self.used:
+					return suffix
+		while self.cursor in self.used:
+			self.cursor += 1
+		suffix = self.cursor
+		self.cursor += 1
+		return suffix
+
+class NameAllocator:
+	def __init__(self):
+		self.prefixes: dict[str, SuffixSet] = dict()
+
+	def add(self, name: str):
+		parts = split_name(name)
+		if parts is not None:
+			self.prefixes.setdefault(parts[0], SuffixSet()).add(parts[1])
+
+	def remove(self, name: str):
+		parts = split_name(name)
+		if parts is not None and parts[0] in self.prefixes:
+			self.prefixes[parts[0]].remove(parts[1])
+
+	def removeMany(self, names: list[str]):
+		# Like remove for every name, with the heap of freed suffixes rebuilt once per prefix
+		freed: dict[str, list[int]] = dict()
+		for name in names:
+			parts = split_name(name)
+			if parts is not None and parts[0] in self.prefixes:
+				freed.setdefault(parts[0], []).append(parts[1])
+		for prefix, suffixes in freed.items():
+			self.prefixes[prefix].removeMany(suffixes)
+
+	def rename(self, name: str, newName: str):
+		self.remove(name)
+		self.add(newName)
+
+	def next(self, prefix: str, reuseGaps: bool = False) -> str:
+		# Returns an unused name made of prefix and a number. Without reuseGaps numbers only
+		# increase, so names of deleted nodes are not given to new ones.
+		return f"{prefix}{self.prefixes.setdefault(prefix, SuffixSet()).next(reuseGaps)}"
+
+	def clear(self):
+		self.prefixes.clear()
@@ -1,7 +1,15 @@
 #!./venv/bin/python
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import sys
 import json
+import argparse
+from html import escape
+import networkx as nx
+import numpy as np
+import theme
+import validation
+import layout_engine
+from file_export import get_filename_no_extension
 
 def loadTopologyGraph(filepath: str) -> nx.Graph:
 	with open(filepath, "r") as fp:
@@ -19,16 +27,135 @@ def loadTopologyGraph(filepath: str) -> nx.Graph:
 		node1 = edge["IN/OUT"]
 		node2 = edge["OUT/IN"]
 		G.add_edge(node1, node2, attr=edge)
-	
+
 	return G
 
+# Headless rendering. PNG images are drawn by Qt's raster engine on the offscreen platform
+# and SVG files are written as text, so neither a display nor matplotlib is needed.
+
+class TopologyDrawing:
+	def __init__(self, data: dict):
+		# data is an NPGI dict or a NIEP topology JSON. Without stored positions for every node,
+		# nodes are placed by the hierarchical layout.
+		if "TOPO" in data:
+			npgi = data
+		else:
+			vms = [{"ID": get_filename_no_extension(r)} for r in data.get("VMS", [])]
+			vms += [{"ID": f"{get_filename_no_extension(r)}@VNF"} for r in data.get("VNFS", [])]
+			npgi = {"TOPO": data, "VMS": vms, "POSITIONS": {}}
+		mininet = npgi["TOPO"].setdefault("MININET", {})
+		for key in ("HOSTS", "SWITCHES", "CONTROLLERS", "OVSWITCHES"):
+			mininet.setdefault(key, [])
+		nodes = [(name, type) for name, type, _ in validation.npgi_nodes(npgi)]
+		self.names = [name for name, _ in nodes]
+		self.types = [type for _, type in nodes]
+		index = {name: i for i, name in enumerate(self.names)}
+		links = [(c["IN/OUT"], c["OUT/IN"]) for c in npgi["TOPO"].get("CONNECTIONS", [])]
+		links += [(ovs["ID"], ovs["CONTROLLER"]) for ovs in mininet["OVSWITCHES"] if ovs["CONTROLLER"] is not None]
+		self.edges = layout_engine.edge_array([(index[u], index[v]) for u, v in links if u in index and v in index])
+		stored = npgi.get("POSITIONS", {})
+		if len(self.names) > 0 and all(name in stored for name in self.names):
+			self.positions = np.array([stored[name] for name in self.names], dtype=np.float64).reshape(-1, 2)
+		elif len(self.names) > 0:
+			self.positions = layout_engine.hierarchical_layout(self.types, self.edges)
+		else: self.positions = np.zeros((0, 2))
+
+	def fit(self, width: int, height: int, margin: float = 10.0) -> tuple[np.ndarray, float]:
+		# Image coordinates of the nodes and the node radius, keeping the aspect ratio
+		if len(self.positions) == 0:
+			return self.positions, 0.0
+		r = theme.NODE_RADIUS
+		low = self.positions.min(axis=0) - r
+		extent = np.maximum(self.positions.max(axis=0) + r - low, 1.0)
+		scale = min((width - 2 * margin) / extent[0], (height - 2 * margin) / extent[1])
+		offset = (np.array([width, height]) - extent * scale) / 2
+		return (self.positions - low) * scale + offset, max(r * scale, 1.5)
+
+def rgb(color: tuple[int, int, int]) -> str:
+	return f"rgb({color[0]},{color[1]},{color[2]})"
+
+def render_svg(drawing: TopologyDrawing, filepath: str, width: int, height: int):
+	points, radius = drawing.fit(width, height)
+	parts = [
+		f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+		f'<rect width="{width}" height="{height}" fill="{rgb(theme.BACKGROUND_COLOR)}"/>'
+	]
+	# All links in one path and the nodes of each type in one group
+	if len(drawing.edges) > 0:
+		ends = points[drawing.edges].reshape(-1, 4).round(1).tolist()
+		path = "".join(f"M{x1} {y1}L{x2} {y2}" for x1, y1, x2, y2 in ends)
+		parts.append(f'<path d="{path}" stroke="{rgb(theme.EDGE_COLOR)}" stroke-width="{max(radius / 15, 0.5):.2f}" fill="none"/>')
+	types = np.array(drawing.types)
+	for type, color in theme.NODE_COLORS.items():
+		nodes = points[types == type].round(1).tolist() if len(types) > 0 else []
+		if len(nodes) == 0:
+			continue
+		circles = "".join(f'<circle cx="{x}" cy="{y}" r="{radius:.1f}"/>' for x, y in nodes)
+		parts.append(f'<g fill="{rgb(color)}" stroke="black" stroke-width="{max(radius / 40, 0.25):.2f}">{circles}</g>')
+	if radius >= 8:
+		labels = "".join(f'<text x="{x:.1f}" y="{y:.1f}">{escape(name)}</text>' for name, (x, y) in zip(drawing.names, points.tolist()))
+		parts.append(f'<g font-family="sans-serif" font-size="{radius / 3:.1f}" text-anchor="middle" dominant-baseline="central">{labels}</g>')
+	parts.append("</svg>")
+	with open(filepath, "w") as fp:
+		fp.write("\n".join(parts))
+
+qtApplication = None
+
+def render_png(drawing: TopologyDrawing, filepath: str, width: int, height: int):
+	global qtApplication
+	os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+	from PySide6.QtCore import QLineF, QPointF, QRectF, Qt
+	from PySide6.QtGui import QColor, QFont, QGuiApplication, QImage, QPainter, QPen
+	if qtApplication is None:
+		# Text rendering needs a GUI application; one is kept for every file of the process
+		qtApplication = QGuiApplication.instance() or QGuiApplication([])
+	points, radius = drawing.fit(width, height)
+	image = QImage(width, height, QImage.Format.Format_RGB32)
+	image.fill(QColor(*theme.BACKGROUND_COLOR))
+	painter = QPainter(image)
+	painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+	painter.setPen(QPen(QColor(*theme.EDGE_COLOR), max(radius / 15, 0.5)))
+	painter.drawLines([QLineF(*line) for line in points[drawing.edges].reshape(-1, 4).tolist()])
+	painter.setPen(QPen(QColor(0, 0, 0), max(radius / 40, 0.25)))
+	for (x, y), type in zip(points.tolist(), drawing.types):
+		painter.setBrush(QColor(*theme.NODE_COLORS[type]))
+		painter.drawEllipse(QPointF(x, y), radius, radius)
+	if radius >= 8:
+		font = QFont("sans-serif")
+		font.setPixelSize(max(int(radius / 3), 1))
+		painter.setFont(font)
+		for name, (x, y) in zip(drawing.names, points.tolist()):
+			painter.drawText(QRectF(x - radius, y - radius, 2 * radius, 2 * radius), Qt.AlignmentFlag.AlignCenter, name)
+	painter.end()
+	# A fast zlib level: encoding dominates the time of small topologies, for slightly larger files
+	if not image.save(filepath, "PNG", 80):
+		raise OSError(f"Could not write {filepath}")
+
+RENDERERS = {"png": render_png, "svg": render_svg}
 
 if __name__ == "__main__":
-	G = loadTopologyGraph("ServerClient.json")
-	options = {
-		'node_size': 3000,
-		'width': 3,
-	}
-	nx.draw(G, with_labels=True, **options)
-
-	plt.savefig("plot/graph")
+	# Draws topology JSON or NPGI files, one image per file named after it. Without files the
+	# ServerClient example is drawn to plot/graph.png.
+	parser = argparse.ArgumentParser(description="Draws topologies without a display")
+	parser.add_argument("files", nargs="*")
+	parser.add_argument("-o", "--output", default="plot", help="directory of the images")
+	parser.add_argument("-f", "--format", choices=RENDERERS.keys(), default="png")
+	parser.add_argument("-s", "--size", default="800x600", help="image size as WIDTHxHEIGHT")
+	args = parser.parse_args()
+	width, height = (int(v) for v in args.size.lower().split("x"))
+	files = args.files if len(args.files) > 0 else ["ServerClient.json"]
+	os.makedirs(args.output, exist_ok=True)
+	status = 0
+	for filepath in files:
+		name = get_filename_no_extension(filepath) if len(args.files) > 0 else "graph"
+		output = os.path.join(args.output, f"{name}.{args.format}")
+		try:
+			with open(filepath, "r") as fp:
+				drawing = TopologyDrawing(json.load(fp))
+			RENDERERS[args.format](drawing, output, width, height)
+		except (OSError, ValueError, KeyError, TypeError) as e:
+			print(f"{filepath}: {e}", file=sys.stderr)
+			status = 1
+			continue
+		print(f"{filepath}: {len(drawing.names)} nodes -> {output}")
+	sys.exit(status)
@@ -0,0 +1,257 @@
+from collections import deque
+from typing import NamedTuple
+
+# Reachability over the links between nodes of the allowed types, Controllers being left out
+# by default since their links do not carry traffic. Components are merged with union-find
+# as links are added. Removing a link or a node only marks its component stale: stale
+# components are split again, and shortest paths found, by solve(), which works on a copy of
+# the affected components so that it can run on another thread. Paths are cached per
+# component and dropped when their component changes.
+
+DEFAULT_TYPES = ("Host", "Switch", "OVSwitch", "VM")
+
+class Job(NamedTuple):
+	version: int
+	components: dict[str, dict[str, tuple[str, ...]]] # Root -> links of every member, for stale components and path queries
+	stale: list[str]
+	queries: list[tuple[str, str, str]] # (root, source, target)
+
+def shortest_path(adjacency: dict[str, tuple[str, ...]], source: str, target: str) -> list[str] | None:
+	previous = {source: None}
+	queue = deque([source])
+	while len(queue) > 0:
+		node = queue.popleft()
+		if node == target:
+			path = []
+			while node is not None:
+				path.append(node)
+				node = previous[node]
+			return path[::-1]
+		for other in adjacency[node]:
+			if other not in previous:
+				previous[other] = node
+				queue.append(other)
+	return None
+
+def split_component(adjacency: dict[str, tuple[str, ...]]) -> list[list[str]]:
+	seen = set()
+	components = []
+	for start in adjacency:
+		if start in seen:
+			continue
+		seen.add(start)
+		component = [start]
+		queue = deque([start])
+		while len(queue) > 0:
+			for other in adjacency[queue.popleft()]:
+				if other not in seen:
+					seen.add(other)
+					component.append(other)
+					queue.append(other)
+		components.append(component)
+	return components
+
+def solve(job: Job) -> tuple[dict[str, list[list[str]]], dict[tuple[str, str], list[str] | None]]:
+	# Only reads the job, so it can run while the index keeps changing
+	split = {root: split_component(job.components[root]) for root in job.stale}
+	paths = {(u, v): shortest_path(job.components[root], u, v) for root, u, v in job.queries}
+	return split, paths
+
+class ReachabilityIndex:
+	def __init__(self, types=DEFAULT_TYPES, onChange=None):
+		self.types = set(types)
+		self.onChange = onChange # Called whenever a component changes
+		self.adjacency: dict[str, set[str]] = dict()
+		self.parent: dict[str, str] = dict()
+		self.members: dict[str, set[str]] = dict() # Root -> nodes of its component
+		self.stale: set[str] = set() # Roots of components that may have been split
+		self.removed: set[str] = set() # Removed nodes other nodes of a stale component may still point to
+		self.paths: dict[str, dict[tuple[str, str], list[str] | None]] = dict()
+		self.version = 0
+
+	def find(self, name: str) -> str:
+		parent = self.parent
+		while parent[name] != name:
+			parent[name] = parent[parent[name]]
+			name = parent[name]
+		return name
+
+	def changed(self, root: str | None):
+		self.paths.pop(root, None)
+		self.version += 1
+		if self.onChange is not None:
+			self.onChange()
+
+	def addNode(self, name: str, type: str):
+		if type not in self.types:
+			return
+		if name in self.removed:
+			self.reclaim(name)
+		self.adjacency[name] = set()
+		self.parent[name] = name
+		self.members[name] = {name}
+		self.changed(None)
+
+	def addEdge(self, u: str, v: str):
+		if u not in self.adjacency or v not in self.adjacency:
+			return
+		self.adjacency[u].add(v)
+		self.adjacency[v].add(u)
+		ru, rv = self.find(u), self.find(v)
+		if ru != rv:
+			if len(self.members[ru]) < len(self.members[rv]):
+				ru, rv = rv, ru
+			self.parent[rv] = ru
+			self.members[ru] |= self.members.pop(rv)
+			self.paths.pop(rv, None)
+			if rv in self.stale:
+				self.stale.discard(rv)
+				self.stale.add(ru)
+		# A link inside a component can also shorten its cached paths
+		self.changed(ru)
+
+	def removeEdge(self, u: str, v: str):
+		if u not in self.adjacency or v not in self.adjacency[u]:
+			return
+		self.adjacency[u].discard(v)
+		self.adjacency[v].discard(u)
+		root = self.find(u)
+		self.stale.add(root)
+		self.changed(root)
+
+	def removeNode(self, name: str):
+		if name not in self.adjacency:
+			return
+		for other in self.adjacency.pop(name):
+			self.adjacency[other].discard(name)
+		root = self.find(name)
+		self.members[root].discard(name)
+		if len(self.members[root]) == 0:
+			# Removed nodes of the component are no longer reached through any member
+			for other in [r for r in self.removed if self.find(r) == root]:
+				self.removed.discard(other)
+				del self.parent[other]
+			del self.members[root]
+			del self.parent[name]
+			self.stale.discard(root)
+		else:
+			# Members may still point to the node until the component is split
+			self.removed.add(name)
+			self.stale.add(root)
+		self.changed(root)
+
+	def reclaim(self, name: str):
+		# A removed node is given back its name before its stale component was split: the members
+		# of the component, and removed nodes they may go through, are pointed at a live root
+		root = self.find(name)
+		newRoot = next(iter(self.members[root])) if root == name else root
+		for other in self.members[root] | {r for r in self.removed if self.find(r) == root}:
+			self.parent[other] = newRoot
+		if newRoot != root:
+			self.members[newRoot] = self.members.pop(root)
+			self.stale.discard(root)
+			self.stale.add(newRoot)
+			self.paths.pop(root, None)
+		self.removed.discard(name)
+		del self.parent[name]
+
+	def renameNode(self, name: str, newName: str, type: str):
+		if name not in self.adjacency:
+			return
+		neighbours = list(self.adjacency[name])
+		self.removeNode(name)
+		self.addNode(newName, type)
+		for other in neighbours:
+			self.addEdge(newName, other)
+
+	def setTypes(self, types, nodes, edges):
+		# Rebuilds the index for other allowed types from (name, type) and (u, v) pairs
+		self.clear()
+		self.types = set(types)
+		for name, type in nodes:
+			self.addNode(name, type)
+		for u, v in edges:
+			self.addEdge(u, v)
+
+	def job(self, queries: list[tuple[str, str]]) -> Job:
+		# Work left for solve(): splitting the stale components and the uncached paths of queries
+		components = {root: None for root in self.stale}
+		pending = []
+		for u, v in queries:
+			if u not in self.adjacency or v not in self.adjacency:
+				continue
+			root = self.find(u)
+			if root in self.stale or (root == self.find(v) and (u, v) not in self.paths.get(root, {})):
+				components[root] = None
+				pending.append((root, u, v))
+		for root in components:
+			components[root] = {m: tuple(self.adjacency[m]) for m in self.members[root]}
+		return Job(self.version, components, list(self.stale), pending)
+
+	def apply(self, job: Job, result) -> bool:
+		# Stores the result of solve(), unless the index changed since the job was made
+		if job.version != self.version:
+			return False
+		split, paths = result
+		for root, components in split.items():
+			del self.members[root]
+			self.paths.pop(root, None)
+			for component in components:
+				newRoot = component[0]
+				for name in component:
+					self.parent[name] = newRoot
+				self.members[newRoot] = set(component)
+		for name in self.removed:
+			del self.parent[name]
+		self.removed.clear()
+		self.stale.clear()
+		for (u, v), path in paths.items():
+			self.paths.setdefault(self.find(u), dict())[(u, v)] = path
+		return True
+
+	def isCurrent(self) -> bool:
+		return len(self.stale) == 0
+
+	def connected(self, u: str, v: str) -> bool:
+		# Only exact without stale components
+		return u in self.adjacency and v in self.adjacency and self.find(u) == self.find(v)
+
+	def path(self, u: str, v: str) -> list[str] | None:
+		if not self.connected(u, v):
+			return None
+		return self.paths.get(self.find(u), {}).get((u, v))
+
+	def componentCount(self) -> int:
+		return len(self.members)
+
+	def clear(self):
+		self.adjacency.clear()
+		self.parent.clear()
+		self.members.clear()
+		self.stale.clear()
+		self.removed.clear()
+		self.paths.clear()
+		self.changed(None)
+
+if __name__ == "__main__":
+	# Regression check: the root of a stale component is removed and its name reused before the
+	# component is split
+	index = ReachabilityIndex()
+	for name in ("Switch1", "Switch2", "Host1", "Host2"):
+		index.addNode(name, "Switch" if name.startswith("Switch") else "Host")
+	for u, v in (("Switch1", "Switch2"), ("Switch1", "Host1"), ("Switch2", "Host2")):
+		index.addEdge(u, v)
+	assert index.find("Host1") == "Switch1"
+	index.removeNode("Switch1")
+	index.addNode("Switch1", "Switch")
+	index.addEdge("Switch1", "Host2")
+	assert index.apply(index.job([]), solve(index.job([])))
+	index.addEdge("Switch1", "Host1")
+	assert index.connected("Host1", "Switch2") and index.componentCount() == 1
+	index.removeNode("Host2")
+	index.removeNode("Switch2")
+	index.removeNode("Switch1")
+	index.addNode("Switch2", "Switch")
+	assert index.apply(index.job([]), solve(index.job([])))
+	assert index.componentCount() == 2 and not index.connected("Host1", "Switch2")
+	print("ok")
@@ -1,3 +1,3 @@
-ipv4 = "([01]?\d\d?|2[0-4]\d|25[0-5])(?:\.(?:[01]?\d\d?|2[0-4]\d|25[0-5])){3}(?:\/[0-2]\d|\/3[0-2])?"
-mac = "([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})"
-defaultNaming = "[^ @]*"
+ipv4 = r"([01]?\d\d?|2[0-4]\d|25[0-5])(?:\.(?:[01]?\d\d?|2[0-4]\d|25[0-5])){3}(?:\/[0-2]?\d|\/3[0-2])?"
+mac = r"([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})"
+defaultNaming = r"[^ @]*"
@@ -0,0 +1,580 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\xad\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x03*\x00\x00\x03*\
+\x01\x10\x97X\x18\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x04*ID\
+ATx\x9c\xed\xdd\xbfj\x1cW\x18\x86\xf1\xe7,\x84\
+\xa8\x09\xb2\xaa\x80\x09\x844\x01\x83+!\x81R\xa4\x14\
+\xc47\x11\x83\x8c\x8b\xb8\xd4-\xb8\x0c\xa8t\x0aC\x0a\
+\xdd\x84\x05i\x83c\x90P%,P\x13\x02\x89\xc1\x95\
+\xbc\xa4q0\xde/\xc5\xcc\x9au\x22\xa1\xfd3\xb33\
+\xfb\xbd\xef\x0fNcVgG\x9cG\xb3\xd2\xeexN\
+\x89\x08T\x94R6\x80\x1d`kb\x00\x9cL\x8c\x17\
+\x11q\xd9\xcd\x11._Q\x09\xa0\x94\xb2\x07\x1c\x00\xeb\
+7<t\x08\xecG\xc4\xcf\xed\x1fU\xf7\xd2\x07PJ\
+\xf9\x02x\x0a|7\xe3\x97\x1e\x01\x0f#\xe2\xcf\xe6\x8f\
+\xaa?R\x07PJ\xd9\x06~\xe1\xe6\x9f\xfa\xeb\x0c\x81\
+\xdd\x888n\xee\xa8\xfa%m\x00\xa5\x945\xe0\x14\xb8\
+\xb3\xe0T\xe7\xc0fD\xbc]\xfc\xa8\xfag\xd0\xf5\x01\
+\xb4\xe81\x8b/>\xf5\x1c\x8f\x1b\x98\xa7\x97R\x9e\x01\
+J)\xdf\x00\xbf\xd2\x5c\xe0#\xe0\xdb\x88x\xde\xd0|\
+\xbd\x91\xf5\x0c\xf0\x88f\xbf\xb7\x01\xf0C\x83\xf3\xf5F\
+\xd6\x00\xb6n~H/\xe6\xec\x5c\xba\x97\x80R\xcag\
+\xc0\x1b\x9a\x8f{\x04\xdc\x8a\x88\xbf\x1b\x9e\xb7S\x19\xcf\
+\x00\x9b\xb4\xf3}\x0d\xea\xb9S\xc9\x18\xc0\xdd\x15\x9d\xbb\
+\x13\x19\x03\xf8dE\xe7\xeeD\xc6\x00l\x06\x0e@\x9c\
+\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc4\
+9\x00q\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\
+\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\
+\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e\
+@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\
+\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\
+\x19\x03\xb8\xbd\xa2sw\x22\xd5\x9dBK)\x9f\x02\x7f\
+\x00\x9f\xb7\xf4\x14\xaf\x81/#\xe2\x9f\x96\xe6_\xba\xa9\
+\x02\xa8o\xbf\xbaIu\xa3\xc4\xbe\xde+\xef6\xf0=\
+\xed-\xfe\xd8k\xe0\x10x\xd5\xf2\xf3\xcc\xeb\x1dp\x06\
+\x9cNs[\xdbk\x03\xa8o\xb9\xfe\x88\xea&\xc9_\
+\x93\xf3\xe5\x22\xb3\x11pA\xb5\x11\xd6\x93\x88\xf8\xed\xca\
+GE\xc4G\x03X\x03~\x04\xde\x03\xe1\x91b\xbc\xaf\
+\xd7t\xed\x7f\xeb\xfd\x9f\xc5\xdf\x06^\xf6\xe0\x80=\xda\
+\x19/\x81\xed\xc95\xff\xf0\x12P\xef\xaeu\xc6\xfc\x1b\
+,\xd9j\x18\x02w\xc7\xbb\xa1M\xbe\xae?\xc5\x8b\xaf\
+`\x9dj\xad+\xf5\x19`\x8f\xeeOO\x1e\xcb\x1d{\
+\x11A\x016\x80\xdf\xf1O\xbf\x9a!\xf0\xd5\x80j/\
+]/\xbe\x9eu`g@\xd2\xcd\x90l*[\x0e@\
+\xdbV\x01\xfe\x22\xe1\x87\x1c6\x95W~{W\xdc\x80\
+\xea\xbdb\xd3t\xe2\x00\xb49\x00q'~#HW\
+\xf5FPD\x5c\x02\xfb]\x1f\x8d-\xdd~D\x5cN\
+~\x14\xfc\x8c\xee\xdf\x9f\xf6X\xcex\xe6\x8f\x83u]\
+\xfdqp\xfd\x0f\xbb\xc0yG\x07f\xed;\x07v\xc7\
+\x8b\x0f\xe0K\xc24\xc6\xb5\x97\x84\xf9\xa2\xd0\xbc\xa6\xba\
+(\xd4\x97\x85\xcfN\xe3\xb2\xf0U\xe4\xff\x182\xbbT\
+\xa7\xf5za\x0e[|\x8a\xc3L\x8b\x0f\xc9\x02\xa8\xb5\
+yj\xee\xebi\x7fn\x19\x03\xb0\x198\x00q\x0e@\
+\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\
+\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e\
+@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\
+\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\
+\x0e@\x9c\x03\x10\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\
+\xe7\x00\xc49\x00q\x0e@\x9c\x03\x10\xe7\x00\xc4e\x0c\
+\xe0\xdd\x8a\xce\xdd\x89\x8c\x01\x9c\xad\xe8\xdc\x9dHu\xa7\
+P\xf8p[\xdb74\x1f\xf7\x08\xb85\xcd\xedWW\
+I\xba3@\xbd@\x17-L}\x91m\xf1!a\x00\
+\xb566\xc2J\xb9\xb9V\xd6\x00\x9eP\x9d\xb2\x9b2\
+\x02~jp\xbe\xdeH\x19@}o\xfc\x83\x06\xa7<\
+\x88\x88\xe7\x0d\xce\xd7\x1b\xe9~\x09\x1c+\xa5\xac\x01\xa7\
+\xc0\x9d\x05\xa7:\x076#\xe2\xed\xe2G\xd5?)\xcf\
+\x00\x00\xf5\x82\xdd\xa7\xda$i^C\xe0~\xd6\xc5\x87\
+\xc4\x01\x00D\xc41\xd5.'Gs|\xf9\x11\xd5\xee\
+Z\xc7\xcd\x1eU\xbf\xa4\x0e\x00\xaa\xdd\xd0\x22\xe2\x1e\xf0\
+\x80\xe9\xce\x06C\xe0AD\xdc\xfbhw\xad\xa4\xd2\xfe\
+\x0ep\x95R\xca\x06\xb0C\xb5\x11\xd6x@\xf5'\xde\
+x\xbc\xa8wS\x95\xf0/\xf4\x00\xcc\xf3\xa8\xc1\x81\x12\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x08\x15\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
+\x00\x00\x00\x03sBIT\x08\x08\x08\xdb\xe1O\xe0\x00\
+\x00\x00\x09pHYs\x00\x00D$\x00\x00D$\x01\
+@g\xc4T\x00\x00\x00\x19tEXtSoft\
+ware\x00www.inkscap\
+e.org\x9b\xee<\x1a\x00\x00\x02\xc4PLT\
+E\xff\xff\xff\x00\x00\x00\x03\x01\x04\x03\x01\x04\x00\x00\x00\
+\x03\x01\x04\x03\x01\x04\x00\x00\x00\x03\x01\x04\x00\x00\x00\x03\
+\x01\x04\x03\x01\x04\x00\x00\x00\x03\x01\x04\x00\x00\x00\x03\x01\
+\x04\x03\x01\x04\x00\x00\x00\x03\x01\x04\x03\x01\x04\x00\x00\x00\
+\x03\x01\x04\x00\x00\x00\x03\x01\x04\x00\x00\x00\x03\x01\x04\x03\
+\x01\x04\x00\x00\x00\x03\x01\x04\x03\x01\x04\x00\x00\x00\x03\x01\
+\x04\x00\x00\x00\x03\x01\x04\x03\x01\x04\x02\x01\x03\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x00\x00\x00\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x00\x00\x08\x03\x01\x04\x00\x00\x07\x03\x01\x04\x03\x01\
+\x04\x00\x00\x07\x03\x01\x04\x03\x01\x04\x03\x01\x04\x06\x00\x06\
+\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x05\
+\x00\x05\x03\x01\x04\x05\x00\x05\x05\x00\x05\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x04\x00\x04\x03\x01\x04\
+\x04\x00\x04\x03\x01\x04\x03\x01\x04\x04\x00\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x00\x03\x03\x01\x04\x03\x00\
+\x03\x03\x01\x04\x03\x01\x04\x03\x00\x03\x03\x01\x04\x03\x00\x03\
+\x03\x01\x04\x03\x01\x04\x03\x00\x03\x03\x00\x03\x03\x01\x04\x03\
+\x01\x04\x03\x00\x03\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x04\x01\x04\
+\x03\x00\x05\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x02\
+\x00\x05\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x02\x00\x04\x02\x00\x04\
+\x03\x01\x04\x03\x01\x03\x02\x00\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\
+\x04\x04\x02\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x04\x02\x04\x03\x01\x04\x03\x01\x04\x04\x02\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x02\x03\x03\x01\
+\x04\x03\x02\x03\x03\x02\x03\x03\x01\x04\x03\x02\x03\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x03\x02\x05\x03\x02\x05\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x02\x05\x03\x02\x05\x03\x01\
+\x04\x03\x02\x05\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x02\x01\x04\x03\x01\x04\x02\x01\x04\x02\x01\
+\x04\x02\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x04\x01\x04\x04\x01\x04\x04\x01\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x03\x03\x01\x04\x03\x01\x03\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\
+\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\
+\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\x01\x04\x03\
+\x01\x04\x03\x01\x04bF\x88\x90\x00\x00\x00\xebtRN\
+S\x00\x01\x01\x02\x03\x03\x04\x05\x05\x06\x06\x07\x08\x08\x09\
+\x09\x0a\x0b\x0b\x0c\x0d\x0d\x0e\x0e\x0f\x0f\x10\x12\x12\x14\x15\
+\x15\x17\x17\x18\x19\x19\x1a\x1b\x1c\x1d\x1e\x1f!!##\
+$%%',,1234556789\
+;<=??@BCDDEFHIJL\
+MMOPPRRSTUVWXYZ[\
+\x5c^`accdefghjlmor\
+stuvwxxyzz{|}~\x7f\x81\
+\x85\x85\x87\x88\x89\x8a\x8a\x8f\x90\x91\x93\x94\x95\x96\x98\x98\
+\x99\x99\x9b\x9c\x9c\x9e\x9f\xa0\xa0\xa2\xa4\xa5\xa6\xa7\xa7\xa8\
+\xa9\xaa\xab\xac\xae\xaf\xb0\xb2\xb3\xb5\xb6\xb7\xb8\xb9\xbc\xbf\
+\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcc\xcd\xce\xcf\xd0\xd0\xd1\
+\xd2\xd3\xd3\xd4\xd5\xd6\xd6\xd7\xd8\xd9\xdb\xdc\xdd\xdd\xde\xde\
+\xdf\xe0\xe1\xe2\xe5\xe6\xe7\xe8\xea\xeb\xec\xed\xef\xf0\xf1\xf2\
+\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\xdae\x09d\
+\x00\x00\x03\xccIDATx\xda\xed\xd8\xe5[\x14Q\
+\x14\x06\xf0#\x88\x82-\xb6\xa2ka`\x226*v\
+\x80\x8a\x89\xdd\xddb\x8b\x85\xdd\x05\xa2 v\x13*\x06\
+\x22`\x81\x85\xad\x08\x88\xa0(\xe9\xc2\xfd'\xe4\x01W\
+\xe6\xb2#N\x9c\xb9\xf7\xcb\xbc\xdfx\xf7\xde{~\xcf\
+\xcc\xee\xf2\xcc\x02\xa8L\xbf=w\xd2\x1e\x1c\x1d\x0f\x9c\
+R\xfdP\x1e)Hps.\xf3m\x1e\x11SR\xb8\
+\x08\xbcIQB9\xcco\xffK\x00 \x93\x84/\x95\
+e\x02\x98#\x9cO|Mu\xa5\xb5AI\xc6\xc7'\
+\x06k\x0f8B\x01\x1e\xfdi{\xbc\xfcS\x1c\xa9\xae\
+5\xe0\x15\x05\xc8),{\x1a\xff6\xe1\xa55\x06$\
+P\x00R\xd0Ux!hV\xe2\xcf\xacW\xf5\x9fW\
+\xa0\x10\xb0J\xd8d5\xc4\x9d\xde\xf3\xcc\x1bb|\xe2\
+\xdb\xca\xf4\xf7}\x11@\x08U\x8d\xc2\x1c_agn\
+\xe1\xa9?\x17\x96*l\xc2E\x00_\xa9\xca\x1b\x13p\
+\xda\xec\xde\x8a\x00\x9a\xd0U$\xe2\xfc\xf1\xc2{\xdb\xf1\
+_\x80\xc6t\x15\x83\x08H\x14\x1e\x1c\x22\x11\x10\x867\
+\xbf\x15u\xf0\xb7R\xd2\x00W\xf0\x00\xe3\xe8\x93\xdbH\
+\x03\x5c\xc6\x03\x1c\xa3O\x9e\xcd\x1c\xb0\x9f>y$s\
+\xc0\x06\xfad7\xd9\x00\x9b\xee\xddm\xd4\x00V\xab\x03\
+\xb8Gd\x13\x92\x1d\xe1\xce\x09P\xd3\xdfT\xf8\xd7\xe4\
+\x028W\xd4\x9c\xe6\x01\x98$\xac\xc6p\x00\xbc\x13V\
+\xcf\xd9\x03\x1aPU^m\xe6\x80at7\x809`\
+/\xddmg\x0eXCw\x8b\x98\x03\x16\xd0\xdd\x0c\x1d\
+\xa0\x03t\x80\x0e\xd0\x01:@\x07\xe8\x00\x1d\xa0\x03t\
+\x80\x0e@\x01,\xc9\xaf\xac\x93\xe8\xce1\xbf\xeb\xc3\x0a\
+\x10g\x050\x91\xae\xc8\xae\xfce\xa7X\x01H\xfc\xe6\
+\x8b\xc6b\x15\xb9\xb5.\x9a0\x03H\x8b\x0exm\x91\
+\xbf\xf5\x80\x5c\x80\xed\x94M\x8b\xa7\xf6\xb5\xc0\x00\x90\xd1\
+\x00\x864y\x00\xe7\xc0\xf4\x82u1\x93\xad\x10\x00\xe4\
+\xba_\x06\x91\x05\x18T\xb4>\xce\x11\x01`\x9e\x92\x01\
+\xae\x99\xc2\x8f\x9a\x03s\x80!\x93~\x0f\xd9\xb3\x06,\
++\xb68\xaa<c\xc0\xb3\xe2\xabw\xb3\x058\x99/\
+\x1f\xce\x14\xd0\xcd|y\xb2=K@\x17\x91\xf57,\
+\x19\x02:\x89m\xf0b\x08\xa8\x93.\xb2\xc1\xe8\xc2\xf0\
+S\xe0#\xb6\xe3S]v\x80\xae\xa2[.0\xfc*\
+\x0e\x17\xdd3\x9f\x1d\xa0\xf3/\xb1=\x19N\xcc\x00\xb0\
+EtSlef\x80\xf2OEw\x1dd\x06\x00g\
+\xa3\xe8\xb6\xbb\xcc\x00\xb0\x83h\x9b\xff\x02*\xc6q\x06\
+\x80K.g\x00\xec\xe2\x0d\xa8\xf2\x9a3\x00\xfa\xe6q\
+\x06\xc0>\xde\x80j\x1f8\x03` o\x00\x1c\xe6\x0d\
+\xa8\x15\xcf\x19\x00n\xbc\x01\xe0\xc7\x1bP\xf73g\x00\
+\x8c\xd0\x060]2\x00\x024\x01xH\x07\xd8%i\
+\x01p\x95\x0e\x80\xb1Z\x00z\xc9\x00\xc0Y\x0d\x00\x8e\
+r\x00\x86/\xe8\xf33\xad\xe4\x00\xcc~\x0fV\x9fh\
+\x90\x97\x8b\xd8\x80\x00\x99\x80F)\xc8\x80\xd52\x010\
+\x0d\x190P.\x00\xae\xa2\xceO\xb5\x96\x0d\xb0O\xc5\
+\x04\x9c\x04\xf9\x99\x89\x09\x98\xa0\x00\x00\xc1x\xf3\xb3k\
+(\x01\xb4\xf8\x8e\x06\x08\x06E\x99\x87\x06pS\x06\x80\
+P\xa4\xf97\x15\xce\x87FH\xff\x98{+\x05\xc0\x10\
+\x94\x87\xb5k\xa0<[\x11\xe6\xe7uR\x01(\x13\xa2\
+\x1e\x10\x08jb\xab\xfaW\xa2\xd8:\xaa\x00`\x17\xab\
+n~\x92\x03\xa8L\xb3\xb7j\xe6g8\x83\xea\x18\xc2\
+T\xbc\x01=\x00!\xe5\x94?\xae\xad\x00\x9cx\x1a\x15\
+\x8d\xcf]\x0fX\xe9\x1a\xad`~\xeaP\xc0K\x19\xcf\
+t\xb9\xf3\xef\xb5\x05\xd4\xb4\xbe$\xeb{9y\xae%\
+`\xa7\xc3\xc1\x0c\xa9\xe3\xb3\xf6\xd9\x81\x16\xa9\xbf1Q\
+\xca\xf8\x04/\x03h\x15\x0b\xe7\xcd\x91%\xdf\x8a\xb4K\
+\x93\xadA\xdb4\x9du<\xe2\x87\xf8\x95\x8f\xda\xd6_\
+\xeb\xe9\xa6+\xd1\xd2m\xe9\xe1\xf3!\xb7c>\xa6\xe4\
+d%\xbf\x7f\x18\x16\xe4\xb3|x;\xc9O\xa0\xbf\x01\
+\xb1\xa4\xda\xfaKk\xb9d\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\x06~\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x03\xb1\x00\x00\x03\xb1\
+\x01\xf5\x83\xedI\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x05\xfbID\
+ATx\x9c\xed\x9d\xdd\x8bWE\x18\xc7?\xa6n/\
+[\xa0\xb8Y$aA\x85Q\xb27*D\x05\xddD\
+f\x11]\x94P\x10\x0a\xfd\x01\xddH^\xd7U\xddE\
+\x84\x11Af]\x14u\x91/Tt\x93\xd0\x85\xb7\xf9\
+\x82\xa6\x9bZk\x14e\xbe\xa0\xad\xe6\xb6\xae\xdb\xc5\xfc\
+6\xe8\xe7\x9e3\xbf\xdfo\xe69s\xc6\xf9~\xe0\x01\
+\xf1\x9c}\xce3\xcf|w\xce\xce\xcb\x99\x81k\x83\xeb\
+\x80\xb5\xc0\xbb\xc0>\xe040\x13\xd9Nw|o\x01\
+\x9e\xe8<S\xb4\x80\xa7\x811\xe2W\xb8\xcf\x8e\x00\xeb\
+\x1a(\x9f\xa8`\x08x\x9f\xe6+\xbe\xdb\xde\x03\x16\x1a\
+\x97Ut\xb1\x00\xf8\x8a\xf4\x95?k;\x81\xf9\xa6%\
+\x16\xff\xe3\x1d\xd2Wz\xb7\xbdeZb\xf1\x1f\x8f\x02\
+WH_\xe1\xdd6\x0d<lXn\xd1a\x0f\xe9+\
+\xbb\xca\xbe3,\xb7\x09\xf3R\x07\xd0'\xa3\xc0^\xcf\
+=\x17\x81\x1d\xc0\x89\xc8\xcf^\x0e<\x03\xdc\xe4\xb9o\
+\x14\xd8\x1f\xf9\xd9\xa2\xc3\x9b\xd4\xff\x06\xee\x07\x96\x19>\
+\x7f\x19p\xc0\x13\xc3\x1b\x86\xcf/\x9ecT'\xfe2\
+\xb0\xa2\x81\x18\xee\x03\xa6j\xe28N~-k\x16\xac\
+\xa2\xfe7oW\x83\xb1\xec\xf2\xc4\xb2\xaa\xc1X\x82\xc8\
+i8s\xbd\xe7\xfag\x8dD\xe1\xf8\xdcs\xfd\xb9F\
+\xa2(\x8c\xa3T\xff\xc6M\x02\x8b\x1b\x8ce\x11p\xa9\
+&\x1e\xbd\x06\x22\xb3\x9a\xfa&wg\x82\x98\xae\x89\xd7\
+@.\xaf\x80\xe7=\xd7}M\xb2\x05\xbeg\xfabn\
+\x05!\xcd\xd4\x08\xf0,\xaeo|/p'0\x1c#\
+(\xe1\xe5\x02\xf0\x0bn\x16t'\xb0\x1d7]\xdd\x08\
+\xb7\x00\xaf\x03\x13\xa4\x1fy\x939\xfb\x0bx\x0d\xb8\xb9\
+\xa6\xde\xa2p\x0fp(aAe\xf56\x86\xe1X\xc8\
+\x83\xc0\x99\x16\x14RVo\xa7\x81\x07*\xeap`F\
+p]\x9b\xd4\x85\x93\xf5f\xc7\x80%s\xd6d\x17\xbd\
+.b\xd8\x02<\xd6\xe3\xbd\x22=\x8bq\x02\xf0v\x8f\
+{\xe9\x05\xac\x04\xbeG+^rc\x1a73y\xb0\
+\xee\xa6^\xc6\x01^F\x95\x9f#\xf3quWK/\
+-\xc0q\xe0\xee\xe0pD\x0a~\xc6Sw>\x01\x8c\
+\x00\x7f\xc6\x8aF$a\x09\xae\xf76'\xbeW\xc0\x1d\
+qc\x11\x09\xa8\xadC\x9f\x00\x9a\x9ca\x136\xd4v\
+\x07}\x02\xd0\x94f\xfe\xd4\xd6a.\xb3\x81\xc2\x08\x09\
+\xa0p$\x80\xc2\x91\x00\x0aG\x02(\x1c\x9f\x00f\x1a\
+\x89BXR[\x87>\x01\xfc\x111\x10\x91\x86\xdf\xea\
+.\xfa\x04p\x14\xf8)^,\xa2av\x03?\xd6\xdd\
+\xe0\x13\xc0e\xe0E\xe0\xd7X\x11\x89\xc6\xd8\x07l\xf4\
+\xdd\xd4\xebH\xdfB\xe0\x11\xe0~\xdc\xa2\xd0Yn\x00\
+n\xec72a\xca%\xdc\xba\xcd\xed\xc0?\x89c\x11\
+B\x08!\x84\x10B\x08\xd1.b\xac\xf8\xd9\x08\xdc\x16\
+\xc1\x8f\xe8\x9f\x93\xc0\xd6\xd4A\xec&\xfd\xa7P\xa5\xda\
+\xee\x1e\xea\xa7\x96\x18\xd3\xc1Z6\x9e\x8e\xe0\xdcK\x00\
+y#\x01\x14\x8e\x04P8\x12@\xe1\xb4B\x00'#\
+\xf8\x10\x83\x11\x9c\xfb6\xb7\x003\xc0\x87\xb8=\x02o\
+\xc5\xed\xbb\xb7\x958\xeb\x14\xc7\x81\x97p;\x80/\xef\
+\xfc{<\x82_\x80Op\xfb\xf4\x0c\xe1\xd6O|\x1a\
+\xc9\xef\x5c\x9c2\xf4\xdd3K\xb1\xe9\xe3n\xaex\xde\
+\xe6@\xbf'p_=w3\x82\xdbz-\xc4\xf7\xdb\
+\x151[\x9dp\xd2\x8a\x01\xb8\xf9\xb8\xdd(b\x16\xec\
+\x0c\xd5\x071-\x04\xce\x06\xf8\xdeTS\x96M\x01~\
+\xcfQ}\x96\xc00p>r\x8e\xa6qg'\x05\x11\
+\xe3\x150M\xcd\xf7\xe7\x03r\x18\xb7%\xfb\x5cL\x01\
+?\x04\xf8\xae;\xcc\xe1@\x80\xdf\x83\xb8\xc3*\xe6\xe2\
+\x02\x9e\xadZ\x06\xe0,n\xcdf\x10\xb1>\x0c\x89\xfd\
+w\xc0d\xe0\xf5:\xea\xd6\xc9\x85\xf8\xf5\xfd\xec\xa5\x00\
+\xdfs\x11\xe5\x8f\xef\xb6\x0a@\xf8\x89\x92s\x09 _\
+$\x80\xc2\x91\x00\x0aG\x02(\x1c\x09\xa0pZ\xd5\x0b\
+\xd0|@\xf3\xa8\x05(\x1c\x09\xa0pZ%\x80S\xb8\
+\xf1i\xd1\x0c3D:#(\x96\x00.\xe3\xc6\xa6E\
+3\x9c\xa5z\xae\xa4/bn\x12\xa5\xd7@sD\xcb\
+\xb5\x04\x90'\x12@\xe1H\x00\x85#\x01\x14N\xb4\x81\
+7\x09 OZ\xd9\x02h8\xb89Z)\x00\xb5\x00\
+\xcd!\x01\x14\x8e\x04P8\xad\x15\x80\xe6\x03\xec\x99!\
+\xe2\x17A1\x050\x85\xfb8B\xd8r\x8e\x88[\xc0\
+\xc6>0B\xaf\x01{\xa2\xe6X\x02\xc8\x0f\x09\xa0p\
+$\x80\xc2\x89:\xe0&\x01\xe4\x87Z\x80\xc2i\xb5\x00\
+4\x1f`O\xab\x05\xa0\x16\xc0\x1e\x09\xa0p$\x80\xc2\
+Q/\xa0p\xa2\xee\x0c\x16[\x00\x93\xb8\xcd\x90\x84\x0d\
+\xe7\x09\xdb\xc6\xe6*,\x0e\x8fV+`G\xf4\xdcJ\
+\x00y!\x01\x14N\xf4q\x16\x09 /\xd4\x02\x14\x8e\
+\x04P8Y\x08@\xf3\x01vd!\x00\xb5\x00vH\
+\x00\x85\xa3^@\xe1\xa8\x05(\x9c\xe8'\x84X\x08\xe0\
+o`\xc2\xc0o\xe9L\xe0r\x1b\x15\x0b\x01\x80Z\x01\
+\x0bLr*\x01\xe4\x83I\xf7Z\x02\xc8\x07\xb5\x00\x85\
+S\x94\x00\xae\x0f\xbc>\xe8\xcfZ\xf9\x0d\xf5\x0dFg\
+\x04Z\x09 \xf4}\xb5\x82\xeac\xe3f\x0fd\x1c\x94\
+\x955\xd7F\x03\xfcZ\xc6\x0c\x85\xb5\x00\x8b\xa9>\xdf\
+\xefU`Q\x80\xefWp'\x91v\xb3\xb4smP\
+,c\x86\xcc^\xab\xeb\x08?\x18\xf1\x0a\xb0\x0dX\x83\
+\xab\x9c5\xc0G\x9d\xff\x0f\xf5=\x0el\x00\xee\xea\xd8\
+\x06\xdc\x89\xa2m\x8e\xf9\xa9>\xf2\x9f\x9c\xd5\xc4=%\
+S\xe6\xceN\x8eN[_\x01\xe2jLr:\xcf\xc2\
+)\xee\x0c\xdd\x0bF\xbeKe\x98\xea\xa3i\x07\xc6\xaa\
+\x05\xb8\x88A\xb0\x05c\x96O+\x01\x80V\x06\xc5\xc4\
+,\x97\x96\x028b\xe8\xbb4\x0eY9\xb6\x14\xc0^\
+C\xdf\xa5a\x96KK\x01\xec0\xf4]\x1a_\xa4\x0e\
+`P\x0e\x90\xbe\xff\x9c\xbbe\xdd\x92\xae%}\x02s\
+\xb7\xc7\xfb\xcez\xcb\xf8\x98\xf4I\xcc\xd5>\x18 \xdf\
+\xadc\x08\xf8\x86\xf4\xc9\xcc\xcd\xbe%|\x0a\xb95\x0c\
+\xa3\x96\xa0\x1f\xdb\xd6\xc9\xd95\xc7\x0b\xc0\x18\xe9\x13\xdc\
+V;\x0c\xac\x1f8\xbb\x03`5\x17P\xc7\x02\xe0I\
+\xdc\xf4\xe6C\xc0\xed\xb8\xa9\xd3\x129\x09\xfc\x0e\xec\x01\
+\xbe\x04\xbe\x06\xa6\x9b\x0c\xe0_\xc6\x82\x1e\x98t\x98{\
+\xc8\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04\xa6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x09pHYs\x00\x00\x03\xb0\x00\x00\x03\xb0\
+\x01'\xc4\x0f\xad\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x043ID\
+ATx\x9c\xed\xdd\xcd\x8a\x5cE\x18\x87\xf1\xc7\xfe\x98\
+\x90\x8c\x03~\xa0\xde\x82\xe0\xce\x85\x8aq&\xe2\x22\x8a\
+F\xc1\x5cB\x82\x83Y\xc4\x85\x9b\x5c\x83\x11\xc4\xa0 \
+\x0a\xde\x82+\xbd\x02#\xe2F\x91\xa8qpP\x18\x8c\
+\xc1\x85b\xc0\xb4\xa6{\xc8\xb8(\x1a&-3]'\
+\xdd\xf5V\xcf\x9c\xe7\x07\xb5\xabIU\xf1\xfeS}\xbe\
+\xba\x0fH\x92$I\x92\xa4\xb6\xe8\x16\xfc\xb7\x97\x80\x87\
+\x80\x87\x81#\xc0-\xe0v\xc1\xf1T\xd9\x11\xe04\xf0\
+1\xb0\x01\x8c\x80\x9d]m\x08\xfc\x00|\x04\xbc\x02\xf4\
+\xebLS\xf3\xb6\x04\x9c\x07~\xe7\xce\x82Ok\xbf\x01\
+\xaf\x03\xbd\xf8)k^N\x02\x9b4+\xfcd\xfb\x11\
+x6x\xde\x9a\x83u\xfe\xbf\xcd\xdfm\x1b\x01\x17b\
+\xa7\xafY\xbc\xcf|\x0a?\xd9\xde\x8e\x5c\x84\xee\xce\x9b\
+\x94)\xfe\xb8\x9d\x8b[\x8a\x9a:\x09lS6\x00C\
+`-jA\xca\xd7\x07~\xa2l\xf1\xc7\xed*\x9e\x1d\
+,\x9c7\x88)\xfe\xb8\x9d\x8dY\x96r,\xd1\xfc<\
+\x7f\xd6\xb6E\xd9+\x95j\xe0Ub\x8b?n\xcfG\
+,\xae\xcd:\x99\xfdN\x15\x9d\xc5\xde^\xac4nk\
+\xe4\x06\xe0\xe9\xa2\xb3\xd8\xdbj\xa5q[\xe3\x9e\x8c>\
+}`@\x9d\xa3\xf2\x01p/\xe9\xe3@\x05\xe4\xec\x00\
+\x0fR\xef\x94\xec\x18\xb0Ri\xecV\xc8\x09\xc0\xd1\xe2\
+\xb3\xd8\xdf\xb1\xca\xe3\x1fj9\x01\x18\x14\x9f\xc5\xfen\
+T\x1e\xffP\xcb9\x06\xe8\x91BP\xe3\x01\x8e\x9b\xa4\
+c\x00\x15\x92\xb3\x03l\x93.\x01\xd7\xf0m\xa5q[\
+#\xf74\xf0r\xd1Y\xec\xed\xabJ\xe3\xb6Fn\x00\
+>-:\x8b\xbd}Ri\x5cM\xe8\x03\xd7\x88\xbd\x0c\
+\xbcI\xde1\x8a\x82\xac\xe3\xdd\xc0V\xeb\x91\xee\xd3G\
+\x05\xe0\x99\x98e\xa9\x895\xd2\x13;\x11\x01\xf8\x0bx\
+2fYj\xe2\x0cq\xbb\xc0\x0d\xe0\xa9\x98e\xa9\x89\
+\xb7\x88\x0b\x81;\xc1\x82z\x8d\xf4}?w\x82\x16[\
+\x05\xae\xe0N\xd0j]\xd2q\xc1\x16\xcd\x0a\xbaI:\
+\xd5;N*\xae!8\xe0\xba\xa4\xef\x0d\x5c\x02\xbe&\
+\xdd\xc8\xd9]\xbc\x9b\xc0\x17\xc0;\xa4\xa2\xef\xbe\xc8\xf3\
+\x04\x86\xe0P\xba\x8f\xf4\xfb\x009\xf7\xf4\x0d\x81x\x1c\
+\xf8\x03\x0f\x0c[\xcd\x10\xc8\x10\xc8\x10\x08C \x0c\x81\
+0\x04\xc2\x10\x08C \x0c\x810\x04\xc2\x10\x08C \
+\x0c\x810\x04\xc2\x10\x08C \x0c\x810\x04\xc2\x10\x08\
+C \x0c\x810\x04\xc2\x10\x08C \x0c\x810\x04\xc2\
+\x10\x08C \x0c\x810\x04\xc2\x10\x08C \x0c\x810\
+\x04\xc2\x10\x08C \x0c\x810\x04\xc2\x10\x08C \x0c\
+\x810\x04\xc2\x10\x08C \x0c\x81(\xf3S\xf7\xcb\xc0\
+#\xc0\xfd\xf8\x02\xcd\x03a\x96\x10tH\xaf\xe4{\x17\
+\xf8\x12\xf8g\xa2\xff\x00\xf8\x06x\x0fx\x81\xf4r\x0e\
+-\xa0\xa6!X%\xbd|\xeb\x97\xcc\xbf\x19\xb7-\xd2\
+\xebv\x0c\xc2\x02j\x12\x82Y\xdbw\xa4\x10i\xc14\
+90\x9c\xb5\x8d\x80\xf31\xcbR\x13\x91;\xc1\x0ep\
+1fYj\x22r'\xd8\x01\xce\xc5,KMD\xee\
+\x04C\xe0D\xcc\xb2\xd4\xc4q\xe2v\x81\xab@/w\
+b\x9dYW\xa6,\x8f\x05\x8e\xf5(\xe9M\xaeZ\x10\
+\x1d\xe0g\xe2v\x80\x1d\xe0\x1a\x0dv\x01\x95\xb5Fl\
+\xf1\xc7\xed\xa5\x9c\xc9\xf9\x11P\xde\xe9J\xe3\x9e\xca\xe9\
+d\x00\xca\xab\xf5\x8e\xe3\xac+\x84\xdee*o\x00\x1c\
+\xad0\xee\x90tGq{\xbfN\xee\x00e-S\xa7\
+\xf8\x00K\xc0\x03\xd3:\x19\x80\xb2V*\x8f\xbf<\xad\
+\x83\x01(\xeb\xdf\xca\xe3\x0f\xa6u\xf0\x18\xa0\xac\x0e\xf0\
+7u>\x06F\xa4\x1d`\xb4_'w\x80\xb2n\x03\
+\x1b\x95\xc6\xdedJ\xf1\xc1\x00D\xb8\x5ci\xdc\xcfs\
+:\x19\x80\xf2>k\xd9\xb8\x9a\xd0%=\xc3\x17y\x19\
+\xf8:\xd0\x8fX\x9c\xf2\x9c%6\x00>\x18\xb2`\xba\
+\xa4\x078#\x8a\xbf\x81\xff\xfb\x17\xd2*\xe9\xf2l\xc9\
+\xe2\x8f\x80\xe7\xa2\x16\xa4\xe6\xceP6\x00>\x1d|\x00\
+\x5c\xa4L\xf1/E.B\xb3Yg~\x1f\x07\xdb\xc0\
+\x85\xd8\xe9k\x1eN\x90\x1e\xe0\x9c\xf5\x80\xcf\xcf\xfc\x03\
+\xacG\xfan\xe0\xaf4+\xfcu\xd2\xa9\x9eG\xfb\x87\
+D\x8f\xf4\x0c\xdf\x07\xc0\x15\xe0\x16w\x16|\x08|\x0f\
+|\x08\xbc\xcc\x1c\x0b\xef\xdd\xc0\xc5\xd4#\xfd.\xc0\x0a\
+\xe9n\xe2\x9fLy\xb2G\x92$I\x92$i\x9a\xff\
+\x00h\xe1\x1a\xa8\xcc\x1bQ7\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x08/\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x03v\x00\x00\x03v\
+\x01}\xd5\x82\xcc\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x07\xacID\
+ATx\x9c\xed\x9d}\xc8\xdde\x19\xc7?\xdf\xcd\xbd\
+X.\xa7\xd3T\x86\x0dQ\x86Y\xca0\x0c\xc1\x9c\x0e\
+\x07\xae\xacI\x0fI-\x87\x8dTlL\x9da\x90P\
+\x940!\xa3\xa8\xa5\x96\x0fd+\x14I\x93D\x97c\
+I-\xdf\xff(\x22\x03I\x90H\xc1\x14_+3#\
+[\xb6\xab?\xeesH\xe7\xf3\x9cs\x9es~\xf7}\
+\xdd\xf7\xefw\x7f\xe0\xf9\xe3<g\xe7\xbe\xbe\xe3\xf7}\
+\xaes\xbf_23\x9aD\xd2\xb9\xc0\xcbf\xf6H\xa3\
+\x0dW\xa20/B\x9b\x87\x00\xbf\x90tN\x84\xb6+\
+\x0d\x13\xc3\x00\x00\x07\x02wI\xda\x18\xa9\xfdJC\xc4\
+2\x00\xc0\x01\xc0\xcd\x92\xae\x88\x18\xa32!1\x0d\x00\
+ \xe0\xdb\x92\xae\x89\x1c\xa72&\xb1\x0d\xd0\xe7K\x92\
+\xa6%\xa5\x8aW\x19\x91\x94\x0f\xe4\x12\xe0vI\x0b\x13\
+\xc6\xac\x0c!\x86\x014\xe0\xbdO\x00\xbb$\x1d\x14!\
+ne\x0c<R\xf2Z\xe0W\x92\x0es\x88]\xd9\x0f\
+\xaf\xef\xe4S\x80\x87$\x1d\xed\x14\xbf\xd2\xc3\xb3Sv\
+<\xf0\x88\xa4\xe3\x1d5t\x1e\xef^\xf9\xd1\xc0\xc3\x92\
+>\xe8\xac\xa3\xb3x\x1b\x00`\x19\xb0G\xd2Zo!\
+]$\x07\x03\x00\x1cD\x18\x1d\x9c\xe7-\xa4k\xe4b\
+\x00\x80\x85\xc0m\x92>\xe7-\xa4K\xa4\x9e\x07\x18\xc6\
+<\xe0FI_nJLe09e\x807\xb3M\
+\xd2vI\x93\x98\xa92\x02\xb9\x1a\x00`+p\x8b\xa4\
+\x03\xbc\x85\xb4\x99\x9c\x0d\x00p>p\xb7\xa4\x03\xbd\x85\
+\xb4\x95\xdc\x0d\x00\xf0\x11\xc2\x0e\xa3\xa5\xdeB\xdaH\x09\
+\x06\x008\x0dxP\xd2Q\xdeB\xdaF)\x06\x008\
+\x910u|\x9c\xb7\x906\x91\xdb0p\x18\xc7\x10\xa6\
+\x8eWE\x8c\xd1)J\xca\x00}\x8e\x00\xee\x97\xb4\xda\
+[H\x1b(\xd1\x00\x00\x07\x03\xf7JZ\xef-\xa4t\
+J5\x00\xc0b\xe0NI\x9b\xbc\x85\x94L\xc9\x06\x00\
+\x98\x0f\xec\x90\xf4\x05o!\xa5R\xba\x01 t:\xbf\
+!\xe9Zo!%\xd2\x06\x03\xf4\xf9\xa2\xa4\x9b$\xcd\
+\xf7\x16R\x12\xa5\x0d\x03\x87q!p\x87\xa4E\x8e\x1a\
+\x8a\xa2M\x19\xa0\xcf\xc7\x81\xdd\x92\x96x\x0b)\x816\
+\x1a\x00`\x0da\xae\xe0po!\xb9\xd3V\x03\x00\x9c\
+L\x985\x5c\xe1-$g\xdal\x00\x80\x95\x84\xf5\x83\
+\xf7y\x0b\xc9\x95\xb6\x1b\x00`9a%\xf1To!\
+9\xd2\x05\x03\x00\x1cJ\xd8z\xbe\xce[Hnt\xc5\
+\x00\x00\xef\x00vJ\xda\xe0-$'\xda6\x0f0\x8c\
+\x05\xc0\xad\x92\xb6x\x0b\xc9\x85.e\x80>\x02n\x90\
+t\xb5\xb7\x90\x1c\xe8\xa2\x01\xfa|U\xd2\x0d]\xbf\xb5\
+\xa4\xd3\xffy`\x0b\xe1+a\x81\xb7\x10/\xban\x00\
+\x80O\x01?\x93\xf4No!\x1eT\x03\x04\xce\x06~\
+)\xe9Po!\xa9\xa9\x06\xf8?\xa7\x12n-Y\xee\
+-$%]\x1b\x06\x0e\xe3\x04\xc2\xd4\xf1Jo!\xa9\
+\xa8\x19\xe0\xed\xac ,\x22}\xc0[H\x0a\xaa\x01f\
+\xe6p\xe0>Ik\xbc\x85\xc4\xa6\x1a`v\x96\x106\
+\x96Ly\x0b\x89I5\xc0`\x16\x01?\x91t\x91\xb7\
+\x90XT\x03\x0cg>\xf0}IWy\x0b\x89A5\
+\xc0\xe8|M\xd27\xdbvkI5\xc0\xdc\xb8\x12\xf8\
+a\x9bn-\xa9\xf3\x00s\xe73\xc0O%-\xf6\x16\
+\xd2\x045\x03\x8c\xc7z\xc2\xe1\xd4\x83\xbd\x85LJ5\
+\xc0\xf8\xac&l=?\xc2[\xc8$T\x03L\xc6*\
+\xc2\xd4\xf11\xdeB\xc6\xa5\x1a`r\x8e%\x98\xe0D\
+o!\xe3P\x0d\xd0\x0cG\x11\xb6\x9e\x9f\xe6-d\xae\
+T\x034\xc7R\x0a,\x98Y\x87\x81\xcdR\x5c\xc1\xcc\
+\x9a\x01\x9a\xa7_0s\xab\xb7\x90Q\xa8\x06\x88\x83\x80\
+\xed%\x14\xcc\xac\x06\x88K\xf6\x053\xb3\x15\xd6\x22\xb2\
+.\x98Y\x0d\x90\x86l\x0bfV\x03\xa4#\xcb\x82\x99\
+u\x18\x98\x96\xec\x0af\xd6\x0c\x90\x9e\xac\x0afV\x03\
+\xf8\xd0/\x98y\x8a\xb7\x90j\x00?\x96\x11\xfa\x04\xae\
+\x053\xab\x01|q/\x98Y\x0d\xe0O\xbf`\xe6%\
+\x1e\xc1\xab\x01\xf2`\x1e0\xedQ0\xb3\x1a /\x92\
+\x17\xcc\xac\xf3\x00\xf9\xb1\x95\xb0\x9a\x98d\xeby\xcd\x00\
+y\xb2\x91D\x053\xab\x01\xf2%I\xc1\xccj\x80\xbc\
+\x89^0\xb3\x1a \x7f\xa2\x16\xcc\xac\x06\xc8\x9f}\xc0\
+!\x84J\xeaG6\xddxk\x0e9f\xcek\xc0+\
+o\xfa\xf9\xdb\x80\xd7\xfb\xbf\xf7w3\xb3X\xc2b\x18\
+\xa0\x8d\xc3\xc0\x7f3\xfcA\xcd\xfa\xda\xcc\xdep\xd0<\
+\x125\x03\x0cf\x0a\xd8mf\xaf{\x0b\x89E\xed\x03\
+\x0cfC\x9b\x1f>T\x03\x0ccJ\xd2{\xbcE\xc4\
+\xa4\x1a`0\xf3\x81K\xbdE\xc4\xa4\x1a`8\x17\xb7\
+\xf9\x22\xe9j\x80\xe1,\x056y\x8b\x88E]\x0d\x1c\
+\x8d\xcb\xdbv;X\x9f\x9a\x01Fc%aq\xa6u\
+T\x03\x8c\xce\xe7\xbd\x05\xc4\xa0\x1a`t\xce\x92\xf4~\
+o\x11MS\xb2\x01^u\x88y\x85C\xcc\xa8\x94j\
+\x80\x17\x81\x0f\x01\x0f$\x8e{~\xdb*\x92\x97h\x80\
+g\x81\xd5f\xf6\x18\xb0=q\xec\xc5\x84\xe3\xde\xad\xa1\
+4\x03<\x05\x9cnfO\xf4^\xef\x04\x9eL\xaca\
+K\xaeg\xfd\xc7\xa1\xa4y\x80'\x08\x7f\xf9O\xf5\x7f\
+af\xfb\x80\xeb\x22\xc5\x9b\x8d#\x81O&\x8e\x19\x8d\
+R2\xc0c\xc0\x19f\xf6\xcc\x0c\xef\xed }\x87\xb0\
+5\x9d\xc1\x12\x0c\xf0[\xe0L3{a\xa67\xcd\xec\
+\x1f\x04\x13\xa4\xe4dI\xa7'\x8e\x19\x85\xdc\x0d\xf00\
+p\x96\x99\xfdu\xc8\xbf\xbb\x8e\xb0w.%\xad\x98\x18\
+\xca\xd9\x00{\x80uf64\xbd\xf7\xfa\x05w\xc7\x97\
+\xf4\x16\xce-\xf9\x92\xe8>\xb9\x1a\xe0\x1e\xe0\xa3f\xf6\
+\xcf9|&\xf5\x90p\x1epY\xe2\x98\x8d\x93\xa3\x01\
+\xee\x00\xa6\xe6\xba\x15\xcb\xcc\x1e\x04~\x17G\xd2\xac\x5c\
+(iI\xe2\x98\x8d\x92\xdb0\xf0f\xc2>\xbc\xff\x8c\
+\xf9\xf9\xd4Y\xe0]\xc0g\x13\xc7l\x94\x9c2\xc04\
+\xb0\xc9\xcc\xfe;A\x1b\xb7\x03\xcf7\xa4gT.\xcb\
+\xf9&\xd0a\xe4\x22\xfc[f\xb6y\xd2\x03\x10f\xb6\
+\x17\xf8^C\x9aF\xe5X\xe0c\x89c6F\x0e\x06\
+\xd8ffW6\xd8\xde4\x90z+w\xb1\x13C\xde\
+\x06\xb8\xca\xcc\xbe\xd2d\x83f\xf6\x12pk\x93m\x8e\
+\xc0\x99\x92V%\x8e\xd9\x08^\x060\xe0r3\xfbz\
+\xa4\xf6\xbf\x13\xa9\xddA\x14\x99\x05<\x0c\xb0\x0f\xb8\xc8\
+\xcc\xae\x8f\x15\xa0\xb7T\xbc'V\xfb\xb3\xb0\xa1\xc4\x12\
+r\xa9\x0d\xf0\x06\xb0\xd1\xccR\xcc\xdd\xa7\x1e\x12.\x04\
+6'\x8e91)\xe7\x01\xf6\x02\xe7\x99\xd9\x8f#\xc4\
+\x9c\x89]\xc0\x1f\x13\xc5\xea\xb3Y\xd2\xa2\xc41'\x22\
+U\x06\xf8\x17\xb0\xde\xcc\xeeJ\x14\x8f\xde\x902u_\
+\xe0\xdd\xc0\xa7\x13\xc7\x9c\x88\x14\x06x\x0d\xf8\xb0\x99\xdd\
+\x9b \xd6\xfe\xfc\x88pF?%Eu\x06c\x1b\xe0\
+\x15`\xad\x99\xa5\xde\xbc\x09@o1\xe9\xa6\xc4aO\
+\x92\xb4&q\xcc\xb1\x89i\x80\x97\x815f\xf6\xeb\x88\
+1F\xe1z`\x92\xe9\xe5q(f\xaf@,\x03<\
+G\xd8\xc2\xf5\xfbH\xed\x8f\x8c\x99=\x0d\xdc\x998\xec\
+9\xb1n\xf5j\x9a\x18\x06x\x9a\xb0s\xf7\xf1\x08m\
+\x8fK\xea!\xe1\x9f\x08\xf5\x84\xb3G\x11/\xa0\xca\x0a\
+I\xbf!\xd4\xec\x89\xc9\x1e\x82\xd9v\xc5\xbc\xd9\xabI\
+\xbc\xd7\x02R\x12+\x0b\xbc\x0e\xfc\x008\xc9\xcc\xd6\x9a\
+\xd9=\xa5<|\xe8V\x06X@8X\xb2\xbc\xa1&\
+\x9f',=O\xf7\x16\xa0\x8a\xa43\x19\xa0\xb7\xcb\xe8\
+\xbb\x0d4\xf5(p\x01\xb0\xc2\xcc\xb6\x95\xfc\xf0\xa1C\
+\x19\x00@\xd22\xe0\xcf\x842\xefsa\x1fa\xd7\xf1\
+\xf6\xde\xde\xc3\xd6\xd0\x99\x0c\x00`f\x7f\x01n\x99\xc3\
+G^%\xf4\x1d\x8e3\xb3\xa9\xb6=|\xe8X\x06\x00\
+\x90\xf4^\xe0\x0f\x0c\xde\xbc\xfa$\xe1\xb0\xc9\x8e\xde\xc9\
+\xa3\xd6\xd29\x03\x00H\xfa9p\xf6\x0co=@\xf8\
+\x8b\xdf\xd9;x\xdaz\xbaj\x80u\xc0\xee\xde\xcb\xbd\
+\xc0m\x84\xef\xf7G\xfdT\xf9\xd0U\x03\x08\xb8\xbf\xf7\
+s\xa3\x99\xa5\xdeJ\x9e\x0d\xff\x03\xea\xa3\xc3\xe7\xc9D\
+\xa0\x06\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x07\
+\x07\xa7W\x87\
+\x00a\
+\x00d\x00d\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x08\xd1\xd0G\
+\x00p\
+\x00a\x00l\x00m\x00-\x00o\x00f\x00-\x00h\x00a\x00n\x00d\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x08\x9b\xa0G\
+\x00t\
+\x00r\x00a\x00s\x00h\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x00HY'\
+\x00l\
+\x00i\x00n\x00e\x00.\x00p\x00n\x00g\
+\x00\x0a\
+\x0ah\x0eg\
+\x00c\
+\x00u\x00r\x00s\x00o\x00r\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x13L\
+\x00\x00\x01\x92\xe48|\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x92\xe48|\x00\
+\x00\x00\x00:\x00\x00\x00\x00\x00\x01\x00\x00\x0c\xca\
+\x00\x00\x01\x92\xe48|\x00\
+\x00\x00\x00\x14\x00\x00\x00\x00\x00\x01\x00\x00\x04\xb1\
+\x00\x00\x01\x92\xe48|\x00\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00\x17\xf6\
+\x00\x00\x01\x92\xe48|\x00\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
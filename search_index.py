@@ -0,0 +1,117 @@
+from bisect import bisect_left, insort
+
+# Inverted index from lowercase attribute values to node names with prefix lookups.
+# Keys are kept in a sorted list so a prefix query is a binary search followed by a
+# scan of the matching range, independent of the number of indexed values.
+# Updates only touch the postings: new keys are sorted into the list on the next
+# query and keys left without postings are skipped until the list is rebuilt.
+
+SEARCH_FIELDS = ("name", "type", "ip", "mac", "management_mac", "disk")
+
+def node_terms(name: str, type: str, nodeInfo: dict) -> list[tuple[str, str]]:
+	# Returns the (field, value) pairs of a node that can be searched for
+	terms = [("name", name), ("type", type)]
+	for iface in nodeInfo.get("INTERFACES", []):
+		if iface.get("IP"):
+			terms.append(("ip", iface["IP"]))
+		if iface.get("MAC"):
+			terms.append(("mac", iface["MAC"]))
+	if type == "Controller" and nodeInfo.get("IP"):
+		terms.append(("ip", nodeInfo["IP"]))
+	if nodeInfo.get("MANAGEMENT_MAC"):
+		terms.append(("management_mac", nodeInfo["MANAGEMENT_MAC"]))
+	if nodeInfo.get("DISK"):
+		terms.append(("disk", nodeInfo["DISK"]))
+	return [(field, str(value)) for field, value in terms]
+
+class SearchIndex:
+	def __init__(self):
+		self.keys: list[str] = []
+		# key -> {node name: {field: original value}}
+		self.postings: dict[str, dict[str, dict[str, str]]] = dict()
+		self.nodeKeys: dict[str, list[str]] = dict()
+		self.pending: list[str] = []
+		self.stale = 0
+
+	def addNode(self, name: str, terms: list[tuple[str, str]]):
+		if name in self.nodeKeys:
+			self.removeNode(name)
+		keys = []
+		for field, value in terms:
+			key = value.lower()
+			posting = self.postings.get(key)
+			if posting is None:
+				posting = self.postings[key] = dict()
+				self.pending.append(key)
+			posting.setdefault(name, dict())[field] = value
+			keys.append(key)
+		self.nodeKeys[name] = keys
+
+	def removeNode(self, name: str):
+		for key in self.nodeKeys.pop(name, []):
+			posting = self.postings.get(key)
+			if posting is None or posting.pop(name, None) is None:
+				continue
+			if len(posting) == 0:
+				del self.postings[key]
+				self.stale += 1
+
+	def renameNode(self, name: str, newName: str, terms: list[tuple[str, str]]):
+		self.removeNode(name)
+		self.addNode(newName, terms)
+
+	def flush(self):
+		if self.stale > len(self.keys) // 2:
+			self.keys = sorted(self.postings)
+			self.stale = 0
+		elif len(self.pending) <= 32:
+			for key in self.pending:
+				insort(self.keys, key)
+		else:
+			self.keys.extend(self.pending)
+			self.keys.sort()
+		self.pending.clear()
+
+	def query(self, text: str, limit: int = 200) -> list[tuple[str, str, str]]:
+		# Returns up to limit (node name, field, value) matches of a prefix, optionally
+		# restricted to one field with a "field:" qualifier such as "ip:10.0."
+		text = text.strip()
+		field = None
+		qualifier, sep, rest = text.partition(":")
+		if sep and qualifier.lower() in SEARCH_FIELDS:
+			field, text = qualifier.lower(), rest.strip()
+		prefix = text.lower()
+		if prefix == "" and field is None:
+			return []
+		if len(self.pending) > 0 or self.stale > len(self.keys) // 2:
+			self.flush()
+		results = []
+		previous = None
+		i = bisect_left(self.keys, prefix)
+		while i < len(self.keys) and len(results) < limit:
+			key = self.keys[i]
+			i += 1
+			if not key.startswith(prefix):
+				break
+			# Keys removed and added again appear twice, keys without nodes are stale
+			posting = self.postings.get(key)
+			if key == previous or posting is None:
+				continue
+			previous = key
+			for name, fields in posting.items():
+				if len(results) >= limit:
+					break
+				for f, value in fields.items():
+					if field is None or f == field:
+						results.append((name, f, value))
+		return results[:limit]
+
+	def clear(self):
+		self.keys.clear()
+		self.postings.clear()
+		self.nodeKeys.clear()
+		self.pending.clear()
+		self.stale = 0
+
+	def __len__(self):
+		return len(self.nodeKeys)
@@ -0,0 +1,57 @@
+import math
+
+# Uniform grid spatial hash used to find which topology elements lie inside a
+# scene region without keeping a QGraphicsItem (and its BSP entry) per element.
+
+class GridIndex:
+	def __init__(self, cellSize: float):
+		self.cellSize = cellSize
+		self.cells: dict[tuple[int, int], set] = dict()
+		self.keyCells: dict = dict()
+
+	def cellOf(self, x: float, y: float) -> tuple[int, int]:
+		return (math.floor(x / self.cellSize), math.floor(y / self.cellSize))
+
+	def insert(self, key, x: float, y: float):
+		cell = self.cellOf(x, y)
+		self.keyCells[key] = cell
+		self.cells.setdefault(cell, set()).add(key)
+
+	def remove(self, key):
+		cell = self.keyCells.pop(key, None)
+		if cell is None:
+			return
+		bucket = self.cells[cell]
+		bucket.discard(key)
+		if len(bucket) == 0:
+			del self.cells[cell]
+
+	def move(self, key, x: float, y: float):
+		cell = self.cellOf(x, y)
+		if self.keyCells.get(key) == cell:
+			return
+		self.remove(key)
+		self.keyCells[key] = cell
+		self.cells.setdefault(cell, set()).add(key)
+
+	def query(self, left: float, top: float, right: float, bottom: float):
+		cx0, cy0 = self.cellOf(left, top)
+		cx1, cy1 = self.cellOf(right, bottom)
+		# When zoomed far out the rectangle spans more cells than are occupied
+		if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+			for (cx, cy), bucket in self.cells.items():
+				if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+					yield from bucket
+			return
+		for cx in range(cx0, cx1 + 1):
+			for cy in range(cy0, cy1 + 1):
+				bucket = self.cells.get((cx, cy))
+				if bucket is not None:
+					yield from bucket
+
+	def clear(self):
+		self.cells.clear()
+		self.keyCells.clear()
+
+	def __len__(self):
+		return len(self.keyCells)
@@ -0,0 +1,192 @@
+import numpy as np
+from socket import inet_ntoa
+from typing import NamedTuple
+
+# Whole topology IPv4 checks on integer arrays. Addresses are parsed for all interfaces
+# at once, and conflicts are found by sorting instead of comparing every pair.
+
+WIDTH = 18
+
+class ParsedIPv4(NamedTuple):
+	address: np.ndarray # uint32 as int64
+	prefix: np.ndarray # -1 when the address has no prefix length
+	valid: np.ndarray
+	leadingZero: np.ndarray # Some octet is written with a leading zero, as in 192.168.122.01
+
+class SubnetReport(NamedTuple):
+	parsed: ParsedIPv4
+	network: np.ndarray
+	duplicateOf: np.ndarray # Index of the first interface with the same address, or -1
+	hostReserved: np.ndarray # Address is the network or broadcast address of its subnet
+	overlaps: np.ndarray # (k, 2) interface indices representing a subnet and a larger subnet containing it
+	segment: np.ndarray # Link segment of every interface
+	expected: np.ndarray # Interface whose subnet is the most used in the segment, -1 when consistent
+
+def parse_ipv4(texts: list[str]) -> ParsedIPv4:
+	# Addresses become rows of a byte matrix, the longest valid one being 255.255.255.255/32.
+	# The matrix is read one column at a time for all addresses at once.
+	n = len(texts)
+	try:
+		rows = np.array([t if t is not None and len(t) <= WIDTH else "" for t in texts], dtype=f"S{WIDTH}")
+	except UnicodeEncodeError:
+		rows = np.array([t if t is not None and len(t) <= WIDTH and t.isascii() else "" for t in texts], dtype=f"S{WIDTH}")
+	columns = np.zeros((WIDTH + 1, n), dtype=np.uint8)
+	columns[:WIDTH] = rows.view(np.uint8).reshape(n, WIDTH).T
+	field = np.zeros(n, dtype=np.int8) # 0-3 for the octets, 4 for the prefix length
+	current = np.zeros(n, dtype=np.int32)
+	length = np.zeros(n, dtype=np.int8)
+	values = np.zeros((5, n), dtype=np.int32)
+	lengths = np.zeros((5, n), dtype=np.int8)
+	valid = np.ones(n, dtype=bool)
+	leadingZero = np.zeros(n, dtype=bool)
+	slash = np.zeros(n, dtype=bool)
+	ended = np.zeros(n, dtype=bool)
+	for ch in columns:
+		digit = ch - np.uint8(48)
+		isDigit = digit < 10
+		isDot = ch == 46
+		isSlash = ch == 47
+		isEnd = (ch == 0) & ~ended
+		leadingZero |= isDigit & (length == 1) & (current == 0) & (field < 4)
+		current = np.where(isDigit, current * 10 + digit, current)
+		length += isDigit
+		store = isDot | isSlash | isEnd
+		valid &= isDigit | store | ended
+		valid &= ~(isDot & slash) & ~(isSlash & ((field != 3) | slash))
+		at = np.nonzero(store)[0]
+		f = np.minimum(field[at], 4)
+		values[f, at] = current[at]
+		lengths[f, at] = length[at]
+		current[at] = 0
+		length[at] = 0
+		field += isDot | isSlash
+		slash |= isSlash
+		ended |= isEnd
+
+	valid &= (field == 3) | ((field == 4) & slash)
+	valid &= ((lengths[:4] >= 1) & (lengths[:4] <= 3) & (values[:4] <= 255)).all(axis=0)
+	valid &= ~slash | ((lengths[4] >= 1) & (lengths[4] <= 2) & (values[4] <= 32))
+	v = values.astype(np.int64)
+	address = (v[0] << 24) | (v[1] << 16) | (v[2] << 8) | v[3]
+	prefix = np.where(valid & slash, v[4], -1)
+	return ParsedIPv4(np.where(valid, address, 0), prefix, valid, leadingZero & valid)
+
+def subnet_masks(prefix: np.ndarray) -> np.ndarray:
+	bits = np.clip(prefix, 0, 32)
+	return ((1 << 32) - 1) ^ ((1 << (32 - bits)) - 1)
+
+def connected_labels(n: int, pairs: np.ndarray) -> np.ndarray:
+	# Connected components by hooking roots to the smallest neighbouring root and pointer jumping
+	label = np.arange(n)
+	pairs = pairs.reshape(-1, 2)
+	if len(pairs) == 0:
+		return label
+	u, v = pairs[:, 0], pairs[:, 1]
+	while True:
+		lu, lv = label[u], label[v]
+		differ = lu != lv
+		if not differ.any():
+			return label
+		low = np.minimum(lu[differ], lv[differ])
+		np.minimum.at(label, lu[differ], low)
+		np.minimum.at(label, lv[differ], low)
+		while True:
+			jumped = label[label]
+			if (jumped == label).all():
+				break
+			label = jumped
+
+def analyze_subnets(addresses: list[str], elementCount: int, links) -> SubnetReport:
+	# Elements 0..len(addresses)-1 are interfaces, the others are switches forwarding between
+	# their ports. links pairs the elements connected by a topology link.
+	parsed = parse_ipv4(addresses)
+	n = len(addresses)
+	indices = np.arange(n)
+	withSubnet = parsed.valid & (parsed.prefix >= 0)
+	mask = subnet_masks(parsed.prefix)
+	network = parsed.address & mask
+	broadcast = network | (((1 << 32) - 1) ^ mask)
+
+	# Duplicated addresses are adjacent once sorted
+	duplicateOf = np.full(n, -1)
+	valid = indices[parsed.valid]
+	order = valid[np.argsort(parsed.address[valid], kind="stable")]
+	sortedAddress = parsed.address[order]
+	repeated = np.nonzero(sortedAddress[1:] == sortedAddress[:-1])[0] + 1
+	if len(repeated) > 0:
+		runStart = np.maximum.accumulate(np.where(np.r_[True, sortedAddress[1:] != sortedAddress[:-1]], np.arange(len(order)), 0))
+		duplicateOf[order[repeated]] = order[runStart[repeated]]
+
+	hostReserved = withSubnet & (parsed.prefix <= 30) & ((parsed.address == network) | (parsed.address == broadcast))
+
+	# Overlaps: distinct subnets sorted by start, then by decreasing size. A subnet starting
+	# before the largest end seen so far is contained in the subnet that reached that end.
+	subnets = indices[withSubnet]
+	key = network[subnets] * 64 + parsed.prefix[subnets]
+	_, first = np.unique(key, return_index=True)
+	subnets = subnets[first]
+	order = subnets[np.lexsort((parsed.prefix[subnets], network[subnets]))]
+	overlaps = np.zeros((0, 2), dtype=np.int64)
+	if len(order) > 1:
+		ends = broadcast[order]
+		reach = np.maximum.accumulate(ends * len(order) + np.arange(len(order)))
+		container = reach[:-1] % len(order)
+		inside = network[order[1:]] <= reach[:-1] // len(order)
+		overlaps = np.stack([order[1:][inside], order[container[inside]]], axis=1)
+
+	# Interfaces on the same link segment should share one subnet; the most used one is expected
+	links = np.asarray(links, dtype=np.int64).reshape(-1, 2)
+	segment = connected_labels(max(elementCount, n), links)[:n]
+	expected = np.full(n, -1)
+	members = indices[withSubnet]
+	if len(members) > 0:
+		pairKey = np.stack([segment[members], network[members] * 64 + parsed.prefix[members]], axis=1)
+		uniquePairs, pairIndex, counts = np.unique(pairKey, axis=0, return_index=True, return_counts=True)
+		# For every segment, the pair with the highest count comes last in this order
+		best = np.lexsort((counts, uniquePairs[:, 0]))
+		lastOfSegment = np.r_[uniquePairs[best[1:], 0] != uniquePairs[best[:-1], 0], True]
+		segments = uniquePairs[best[lastOfSegment], 0]
+		bestMember = members[pairIndex[best[lastOfSegment]]][np.searchsorted(segments, segment[members])]
+		differs = (network[bestMember] != network[members]) | (parsed.prefix[bestMember] != parsed.prefix[members])
+		expected[members[differs]] = bestMember[differs]
+	return SubnetReport(parsed, network, duplicateOf, hostReserved, overlaps, segment, expected)
+
+def format_subnet(network: int, prefix: int) -> str:
+	return f"{inet_ntoa(int(network).to_bytes(4, 'big'))}/{prefix}"
+
+def interface_messages(report: SubnetReport, addresses: list[str]) -> tuple[dict[int, list[str]], dict[int, list[str]]]:
+	# Messages of every flagged interface, and separately those about the link of the interface
+	messages: dict[int, list[str]] = dict()
+	linkMessages: dict[int, list[str]] = dict()
+	parsed, network = report.parsed, report.network
+	def subnet(i: int) -> str:
+		return format_subnet(network[i], parsed.prefix[i])
+
+	for i in np.nonzero(parsed.leadingZero)[0].tolist():
+		messages.setdefault(i, []).append(f"{addresses[i]} has an octet with a leading zero, which some tools read as octal")
+	for i in np.nonzero(report.duplicateOf >= 0)[0].tolist():
+		first = int(report.duplicateOf[i])
+		messages.setdefault(i, []).append(f"{addresses[i]} has the same address as {addresses[first]}")
+		messages.setdefault(first, []).append(f"{addresses[first]} is used more than once")
+	for i in np.nonzero(report.hostReserved)[0].tolist():
+		messages.setdefault(i, []).append(f"{addresses[i]} is the network or broadcast address of {subnet(i)}")
+
+	if len(report.overlaps) > 0:
+		key = network * 64 + parsed.prefix
+		withSubnet = parsed.valid & (parsed.prefix >= 0)
+		related: dict[int, list[str]] = dict()
+		for inner, outer in report.overlaps.tolist():
+			related.setdefault(int(key[inner]), []).append(f"lies inside {subnet(outer)}")
+			related.setdefault(int(key[outer]), []).append(f"contains {subnet(inner)}")
+		affected = np.nonzero(withSubnet & np.isin(key, np.fromiter(related, dtype=np.int64)))[0]
+		for i in affected.tolist():
+			notes = related[int(key[i])]
+			shown = ", ".join(notes[:3]) + (f" and {len(notes) - 3} more" if len(notes) > 3 else "")
+			messages.setdefault(i, []).append(f"Subnet {subnet(i)} of {addresses[i]} {shown}")
+
+	for i in np.nonzero(report.expected >= 0)[0].tolist():
+		expected = int(report.expected[i])
+		message = f"{addresses[i]} is not in {subnet(expected)} like the other interfaces on its link"
+		messages.setdefault(i, []).append(message)
+		linkMessages.setdefault(i, []).append(message)
+	return messages, linkMessages
@@ -0,0 +1,15 @@
+# Colours and sizes shared by the editor and the headless renderer. Colours are RGB tuples
+# so that they can be used without Qt.
+
+NODE_RADIUS = 50
+
+NODE_COLORS = {
+	"Host": (35, 158, 207),
+	"Switch": (228, 240, 122),
+	"Controller": (56, 207, 96),
+	"OVSwitch": (172, 184, 68),
+	"VM": (40, 55, 168)
+}
+
+EDGE_COLOR = (0, 0, 0)
+BACKGROUND_COLOR = (255, 255, 255)
@@ -0,0 +1,302 @@
+import numpy as np
+from typing import NamedTuple
+
+# Parametric topology families. A generator only decides the node types, a structured
+# layout and the links between node indices; names, interfaces and addresses are given
+# to the nodes when the blueprint is inserted into a scene.
+
+SPACING = 150.0 # Distance between neighbouring nodes
+LEVEL = 400.0 # Distance between the tiers of a fabric
+
+class Blueprint(NamedTuple):
+	types: list[str]
+	positions: np.ndarray # (n, 2) coordinates around (0, 0)
+	edges: np.ndarray # (m, 2) node indices
+
+class BlueprintBuilder:
+	def __init__(self):
+		self.types: list[str] = []
+		self.positions: list[np.ndarray] = []
+		self.edges: list[np.ndarray] = []
+
+	def add(self, type: str, positions: np.ndarray) -> np.ndarray:
+		# Appends len(positions) nodes of a type and returns their indices
+		first = len(self.types)
+		self.types.extend([type] * len(positions))
+		self.positions.append(np.asarray(positions, dtype=np.float64).reshape(-1, 2))
+		return np.arange(first, len(self.types))
+
+	def connect(self, u: np.ndarray, v: np.ndarray):
+		u, v = np.broadcast_arrays(np.asarray(u, dtype=np.int64), np.asarray(v, dtype=np.int64))
+		self.edges.append(np.stack([u.ravel(), v.ravel()], axis=1))
+
+	def blueprint(self) -> Blueprint:
+		positions = np.concatenate(self.positions) if len(self.positions) > 0 else np.zeros((0, 2))
+		if len(positions) > 0:
+			positions -= (positions.min(axis=0) + positions.max(axis=0)) / 2
+		edges = np.concatenate(self.edges) if len(self.edges) > 0 else np.zeros((0, 2), dtype=np.int64)
+		return Blueprint(self.types, positions, edges)
+
+def row(count: int, y: float, width: float | None = None) -> np.ndarray:
+	# count positions evenly spread over width (SPACING apart by default) and centred on x = 0
+	if width is None:
+		width = count * SPACING
+	x = (np.arange(count) + 0.5) * (width / max(count, 1)) - width / 2
+	return np.stack([x, np.full(count, y)], axis=1)
+
+def circle(count: int, radius: float) -> np.ndarray:
+	angle = np.arange(count) * (2 * np.pi / max(count, 1))
+	return np.stack([np.cos(angle) * radius, np.sin(angle) * radius], axis=1)
+
+def ring_radius(count: int) -> float:
+	return max(count * SPACING / (2 * np.pi), 2 * SPACING)
+
+def attach_hosts(builder: BlueprintBuilder, switches: np.ndarray, hostsPerSwitch: int, y: float, width: float):
+	# A row of hosts below the switches, every switch linked to the hostsPerSwitch hosts under it
+	hosts = builder.add("Host", row(len(switches) * hostsPerSwitch, y, width))
+	builder.connect(np.repeat(switches, hostsPerSwitch), hosts)
+	return hosts
+
+def star(hosts: int) -> Blueprint:
+	builder = BlueprintBuilder()
+	center = builder.add("Switch", np.zeros((1, 2)))
+	builder.connect(center, builder.add("Host", circle(hosts, ring_radius(hosts))))
+	return builder.blueprint()
+
+def tree(depth: int, fanout: int, hostsPerLeaf: int) -> Blueprint:
+	# depth levels of switches below a root switch, hosts under the deepest level
+	builder = BlueprintBuilder()
+	leaves = fanout ** depth
+	width = max(leaves * max(hostsPerLeaf, 1), 1) * SPACING
+	parents = builder.add("Switch", row(1, 0, width))
+	for level in range(1, depth + 1):
+		switches = builder.add("Switch", row(fanout ** level, level * LEVEL, width))
+		builder.connect(np.repeat(parents, fanout), switches)
+		parents = switches
+	attach_hosts(builder, parents, hostsPerLeaf, (depth + 1) * LEVEL, width)
+	return builder.blueprint()
+
+def fat_tree(k: int) -> Blueprint:
+	# k-ary fat-tree: (k/2)^2 core switches and k pods of k/2 aggregation and k/2 edge switches,
+	# every edge switch serving k/2 hosts
+	half = k // 2
+	builder = BlueprintBuilder()
+	width = k * half * half * SPACING
+	core = builder.add("Switch", row(half * half, 0, width))
+	aggregation = builder.add("Switch", row(k * half, LEVEL, width))
+	edge = builder.add("Switch", row(k * half, 2 * LEVEL, width))
+	# Aggregation switch a of a pod links to the core switches a*half .. a*half+half-1
+	position = np.arange(k * half) % half
+	builder.connect(np.repeat(aggregation, half), core[(position[:, None] * half + np.arange(half)).ravel()])
+	# Edge and aggregation switches of a pod are fully connected
+	pod = np.arange(k * half) // half
+	builder.connect(np.repeat(edge, half), aggregation[(pod[:, None] * half + np.arange(half)).ravel()])
+	attach_hosts(builder, edge, half, 3 * LEVEL, width)
+	return builder.blueprint()
+
+def leaf_spine(spines: int, leaves: int, hostsPerLeaf: int) -> Blueprint:
+	builder = BlueprintBuilder()
+	width = max(leaves * max(hostsPerLeaf, 1), spines) * SPACING
+	spine = builder.add("Switch", row(spines, 0, width))
+	leaf = builder.add("Switch", row(leaves, LEVEL, width))
+	builder.connect(np.repeat(leaf, spines), np.tile(spine, leaves))
+	attach_hosts(builder, leaf, hostsPerLeaf, 2 * LEVEL, width)
+	return builder.blueprint()
+
+def ring(switches: int, hostsPerSwitch: int) -> Blueprint:
+	builder = BlueprintBuilder()
+	radius = ring_radius(switches * max(hostsPerSwitch, 1))
+	nodes = builder.add("Switch", circle(switches, radius))
+	# Two switches are only linked once
+	closing = switches if switches > 2 else switches - 1
+	builder.connect(nodes[:closing], nodes[(np.arange(closing) + 1) % switches])
+	# Hosts of a switch on an outer circle, around the angle of their switch
+	angle = (np.arange(switches * hostsPerSwitch) + 0.5 - hostsPerSwitch / 2) * (2 * np.pi / max(switches * hostsPerSwitch, 1))
+	outer = radius + LEVEL
+	hosts = builder.add("Host", np.stack([np.cos(angle) * outer, np.sin(angle) * outer], axis=1))
+	builder.connect(np.repeat(nodes, hostsPerSwitch), hosts)
+	return builder.blueprint()
+
+def service_chains(chains: int, vnfsPerChain: int) -> Blueprint:
+	# ServerClient style chains: a client host, vnfsPerChain VNF VMs and a server host in a row
+	builder = BlueprintBuilder()
+	length = vnfsPerChain + 2
+	y = np.repeat(np.arange(chains) * SPACING, length)
+	x = np.tile(np.arange(length) * 2 * SPACING, chains)
+	kinds = np.tile(np.arange(length), chains)
+	positions = np.stack([x, y], axis=1)
+	clients = builder.add("Host", positions[kinds == 0])
+	vnfs = builder.add("VM", positions[(kinds > 0) & (kinds < length - 1)]).reshape(chains, vnfsPerChain)
+	servers = builder.add("Host", positions[kinds == length - 1])
+	chain = np.concatenate([clients[:, None], vnfs, servers[:, None]], axis=1)
+	builder.connect(chain[:, :-1], chain[:, 1:])
+	return builder.blueprint()
+
+def with_controller(blueprint: Blueprint) -> Blueprint:
+	# Makes the switches OVSwitches managed by one controller placed above the topology
+	types = ["OVSwitch" if t == "Switch" else t for t in blueprint.types]
+	switches = np.array([i for i, t in enumerate(types) if t == "OVSwitch"], dtype=np.int64)
+	top = blueprint.positions[:, 1].min() - LEVEL if len(blueprint.positions) > 0 else 0.0
+	controller = len(types)
+	positions = np.concatenate([blueprint.positions, [[0.0, top]]])
+	edges = np.concatenate([blueprint.edges, np.stack([switches, np.full(len(switches), controller)], axis=1)])
+	return Blueprint(types + ["Controller"], positions, edges)
+
+# Template stamping
+
+class Template(NamedTuple):
+	# A subgraph captured once so that copies are built from index arrays
+	prefixes: list[str] # Name prefix of every node
+	types: list[str]
+	positions: np.ndarray # (k, 2)
+	shared: list[dict] # nodeInfo keys copied as they are
+	newManagementMAC: np.ndarray # (k,) node has a MANAGEMENT_MAC
+	newIP: np.ndarray # (k,) node has its own IP, as controllers do
+	slotStart: np.ndarray # (k + 1,) interfaces of node i are the slots slotStart[i]..slotStart[i+1]-1
+	slotShared: list[dict] # Interface keys copied as they are
+	slotNewIP: np.ndarray # (s,) interface has an IP to replace
+	slotLink: np.ndarray # (s,) slot whose MAC LINK_MAC refers to, -1 to clear it, -2 without LINK_MAC
+	edges: np.ndarray # (e, 2) node indices
+	edgeInterfaces: list[list[int | None]]
+	external: list[tuple[int, str]] # Links kept to nodes outside the template, like a shared controller
+
+def capture_template(prefixes: list[str], types: list[str], positions: np.ndarray, infos: list[dict], edges: list[tuple[int, int]], edgeInterfaces: list[list[int | None]], external: list[tuple[int, str]]) -> Template:
+	slotStart = np.zeros(len(infos) + 1, dtype=np.int64)
+	np.cumsum([len(info.get("INTERFACES", [])) for info in infos], out=slotStart[1:])
+	macs = [iface.get("MAC") for info in infos for iface in info.get("INTERFACES", [])]
+	slotOf = {mac: i for i, mac in enumerate(macs) if mac}
+	shared, slotShared, slotNewIP, slotLink = [], [], [], []
+	for info in infos:
+		# CONTROLLER is set again when the copy is linked to its controller
+		shared.append({k: None if k == "CONTROLLER" else v for k, v in info.items() if k not in ("INTERFACES", "MANAGEMENT_MAC", "IP")})
+		for iface in info.get("INTERFACES", []):
+			newIP = bool(iface.get("IP"))
+			slotShared.append({k: v for k, v in iface.items() if k not in ("MAC", "LINK_MAC") and not (newIP and k == "IP")})
+			slotNewIP.append(newIP)
+			slotLink.append(slotOf.get(iface["LINK_MAC"], -1) if "LINK_MAC" in iface else -2)
+	return Template(
+		prefixes, types, np.asarray(positions, dtype=np.float64).reshape(-1, 2), shared,
+		np.array(["MANAGEMENT_MAC" in info for info in infos], dtype=bool),
+		np.array([bool(info.get("IP")) for info in infos], dtype=bool),
+		slotStart, slotShared, np.array(slotNewIP, dtype=bool), np.array(slotLink, dtype=np.int64),
+		np.asarray(edges, dtype=np.int64).reshape(-1, 2), edgeInterfaces, external)
+
+def copy_offsets(template: Template, count: int) -> np.ndarray:
+	# Copies fill a grid of cells the size of the template, the original being in the first cell
+	if len(template.positions) == 0:
+		return np.zeros((count, 2))
+	size = template.positions.max(axis=0) - template.positions.min(axis=0) + 2 * SPACING
+	columns = int(np.ceil(np.sqrt(count + 1)))
+	cells = np.arange(1, count + 1)
+	return np.stack([cells % columns, cells // columns], axis=1) * size
+
+def stamp(template: Template, count: int, newIPv4, newMAC):
+	# Nodes and links of count copies as (prefixes, types, positions, infos, edges, edgeInterfaces).
+	# Links to nodes outside the template are given by name.
+	k = len(template.types)
+	positions = (template.positions[None, :, :] + copy_offsets(template, count)[:, None, :]).reshape(-1, 2)
+	edges = (template.edges[None, :, :] + (np.arange(count) * k)[:, None, None]).reshape(-1, 2).tolist()
+	edges += [(copy * k + local, name) for copy in range(count) for local, name in template.external]
+	edgeInterfaces = template.edgeInterfaces * count + [[None, None]] * (count * len(template.external))
+
+	slotStart = template.slotStart.tolist()
+	slotNewIP = template.slotNewIP.tolist()
+	slotLink = template.slotLink.tolist()
+	newManagementMAC = template.newManagementMAC.tolist()
+	newIP = template.newIP.tolist()
+	infos = []
+	for _ in range(count):
+		macs = [newMAC() for _ in slotLink]
+		for i in range(k):
+			info = dict(template.shared[i])
+			if newManagementMAC[i]:
+				info["MANAGEMENT_MAC"] = newMAC()
+			if newIP[i]:
+				info["IP"] = newIPv4()
+			if slotStart[i + 1] > slotStart[i]:
+				interfaces = []
+				for slot in range(slotStart[i], slotStart[i + 1]):
+					iface = dict(template.slotShared[slot])
+					if slotNewIP[slot]:
+						iface["IP"] = newIPv4()
+					iface["MAC"] = macs[slot]
+					if slotLink[slot] != -2:
+						iface["LINK_MAC"] = macs[slotLink[slot]] if slotLink[slot] >= 0 else ""
+					interfaces.append(iface)
+				info["INTERFACES"] = interfaces
+			infos.append(info)
+	return template.prefixes * count, template.types * count, positions, infos, edges, edgeInterfaces
+
+MAX_NODES = 100000 # Largest topology the generator dialog builds
+
+# Name, parameters as (name, minimum, maximum, default) and generator of every family
+FAMILIES = {
+	"Star": ([("Hosts", 1, 100000, 16)], star),
+	"Tree": ([("Depth", 1, 8, 2), ("Fanout", 1, 64, 4), ("Hosts per leaf", 0, 1000, 4)], tree),
+	"Fat-tree": ([("K (even)", 2, 64, 4)], lambda k: fat_tree(k + k % 2)),
+	"Leaf-spine": ([("Spines", 1, 256, 4), ("Leaves", 1, 4096, 8), ("Hosts per leaf", 0, 1000, 16)], leaf_spine),
+	"Ring": ([("Switches", 2, 10000, 8), ("Hosts per switch", 0, 1000, 2)], ring),
+	"Service chains": ([("Chains", 1, 10000, 4), ("VNFs per chain", 0, 64, 1)], service_chains)
+}
+
+def node_count(family: str, values: list[int]) -> int:
+	# Size of a family without building it, for previews and limits
+	if family == "Star":
+		return values[0] + 1
+	if family == "Tree":
+		depth, fanout, hosts = values
+		return sum(fanout ** level for level in range(depth + 1)) + fanout ** depth * hosts
+	if family == "Fat-tree":
+		k = values[0] + values[0] % 2
+		return 5 * k * k // 4 + k ** 3 // 4
+	if family == "Leaf-spine":
+		return values[0] + values[1] * (1 + values[2])
+	if family == "Ring":
+		return values[0] * (1 + values[1])
+	return values[0] * (values[1] + 2)
+
+def link_interfaces(types: list[str], edges: list[tuple[int, int]]) -> tuple[list[int], list[list[int | None]]]:
+	# Hosts and VMs get one interface per link, and at least one. Returns the interface count of
+	# every node and the interface at both ends of every link, None for other node types.
+	counts = [0] * len(types)
+	interfaces = []
+	for u, v in edges:
+		ends = []
+		for n in (u, v):
+			if types[n] in ("Host", "VM"):
+				ends.append(counts[n])
+				counts[n] += 1
+			else: ends.append(None)
+		interfaces.append(ends)
+	return [max(count, 1) for count in counts], interfaces
+
+def host_segments(types: list[str], edges: list[tuple[int, int]], counts: list[int], interfaces: list[list[int | None]]) -> list[list[tuple[int, int]]]:
+	# Host interfaces as (node, interface) grouped by link segment, switches joining their links into
+	# one segment like the subnet analysis does. Segments come in the order of their first host.
+	parent: dict = dict()
+	def find(x):
+		while parent.setdefault(x, x) != x:
+			parent[x] = parent[parent[x]]
+			x = parent[x]
+		return x
+	for (u, v), ends in zip(edges, interfaces):
+		elements = []
+		for n, i in ((u, ends[0]), (v, ends[1])):
+			if i is not None:
+				elements.append((n, i))
+			elif types[n] in ("Switch", "OVSwitch"):
+				elements.append(n)
+		if len(elements) == 2:
+			parent[find(elements[0])] = find(elements[1])
+	segments: dict = dict()
+	for n, type in enumerate(types):
+		if type == "Host":
+			for i in range(counts[n]):
+				segments.setdefault(find((n, i)), []).append((n, i))
+	return list(segments.values())
+
+def ipv4_count(blueprint: Blueprint) -> int:
+	# New IPv4 addresses needed to insert a blueprint: one per link of a host (at least one) and one per controller
+	links = np.bincount(blueprint.edges.ravel(), minlength=len(blueprint.types)) if len(blueprint.edges) > 0 else np.zeros(len(blueprint.types), dtype=np.int64)
+	types = np.array(blueprint.types)
+	return int(np.maximum(links[types == "Host"], 1).sum()) + int((types == "Controller").sum())
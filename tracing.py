@@ -0,0 +1,92 @@
+import os
+import json
+import time
+import threading
+from functools import wraps
+
+# Spans of the slow paths, written as Chrome trace events that chrome://tracing or Perfetto
+# open. Recording is off until start(), and span() then only returns a shared object whose
+# enter and exit do nothing, so instrumented code costs one call and a global read. Code run
+# for every item of a frame should test recording first instead.
+
+recording = False
+filepath: str | None = None
+events: list[dict] = []
+origin = 0.0
+
+class Span:
+	__slots__ = ("name", "args", "start")
+
+	def __init__(self, name: str, args: dict | None):
+		self.name = name
+		self.args = args
+
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+
+	def __exit__(self, *exc):
+		end = time.perf_counter()
+		event = {"name": self.name, "ph": "X", "ts": (self.start - origin) * 1e6, "dur": (end - self.start) * 1e6, "pid": os.getpid(), "tid": threading.get_ident()}
+		if self.args:
+			event["args"] = self.args
+		# list.append is atomic, so worker threads record without a lock
+		events.append(event)
+		return False
+
+class NullSpan:
+	__slots__ = ()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+NULL_SPAN = NullSpan()
+
+def span(name: str, **args) -> Span | NullSpan:
+	if not recording:
+		return NULL_SPAN
+	return Span(name, args)
+
+def traced(name: str | None = None):
+	# Decorator recording every call of a function as a span
+	def decorate(fn):
+		label = name or f"{fn.__module__}.{fn.__qualname__}"
+		@wraps(fn)
+		def wrapper(*args, **kwargs):
+			if not recording:
+				return fn(*args, **kwargs)
+			with Span(label, None):
+				return fn(*args, **kwargs)
+		return wrapper
+	return decorate
+
+def instant(name: str, **args):
+	if recording:
+		events.append({"name": name, "ph": "i", "s": "p", "ts": (time.perf_counter() - origin) * 1e6, "pid": os.getpid(), "tid": threading.get_ident(), "args": args})
+
+def start(path: str):
+	global recording, filepath, origin
+	events.clear()
+	filepath = path
+	origin = time.perf_counter()
+	recording = True
+
+def stop() -> int:
+	# Writes the recorded events to the file given to start and returns how many there were
+	global recording
+	recording = False
+	names = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": thread.ident, "args": {"name": thread.name}} for thread in threading.enumerate()]
+	with open(filepath, "w") as fp:
+		json.dump({"traceEvents": names + events, "displayTimeUnit": "ms"}, fp)
+	count = len(events)
+	events.clear()
+	return count
+
+def start_from_environment():
+	# NIEP_TRACE=path records from startup until stop() or the end of the process
+	path = os.environ.get("NIEP_TRACE")
+	if path:
+		start(path)
@@ -0,0 +1,259 @@
+#!./venv/bin/python
+import re
+import sys
+import json
+from typing import NamedTuple
+import regexdef
+
+# Topology checks that are kept up to date while the topology is edited. Every rule
+# only looks at one node, one link or one address, and the issues are stored per
+# node, link and address, so an edit only re-runs the rules of what it touched.
+
+IPV4 = re.compile(regexdef.ipv4)
+MAC = re.compile(regexdef.mac)
+
+ERROR = "error"
+WARNING = "warning"
+
+class Issue(NamedTuple):
+	severity: str
+	nodes: tuple[str, ...] # Nodes the issue is about, the first one being the one to show
+	message: str
+
+def normalize_ipv4(value: str) -> str:
+	return value.split("/")[0].strip()
+
+def normalize_mac(value: str) -> str:
+	return value.strip().lower().replace("-", ":")
+
+def check_node(name: str, type: str, nodeInfo: dict) -> list[Issue]:
+	issues = []
+	def error(message: str):
+		issues.append(Issue(ERROR, (name,), f"{name}: {message}"))
+
+	for i, iface in enumerate(nodeInfo.get("INTERFACES", [])):
+		ip = iface.get("IP", "")
+		if ip is None:
+			issues.append(Issue(WARNING, (name,), f"{name}: interface {i+1} has no IP address"))
+		elif ip != "" and IPV4.fullmatch(ip) is None:
+			error(f"interface {i+1} IP '{ip}' is not a valid IPv4 address")
+		for key in ("MAC", "LINK_MAC"):
+			mac = iface.get(key, "")
+			if mac is None or (mac != "" and MAC.fullmatch(mac) is None) or (mac == "" and key == "MAC"):
+				error(f"interface {i+1} {key.replace('_', ' ')} '{mac}' is not a valid MAC address")
+	if type == "Host" and len(nodeInfo.get("INTERFACES", [])) == 0:
+		error("host has no interfaces")
+	if "MANAGEMENT_MAC" in nodeInfo and MAC.fullmatch(str(nodeInfo["MANAGEMENT_MAC"])) is None:
+		error(f"management MAC '{nodeInfo['MANAGEMENT_MAC']}' is not a valid MAC address")
+	if type == "Controller":
+		if IPV4.fullmatch(str(nodeInfo.get("IP"))) is None:
+			error(f"IP '{nodeInfo.get('IP')}' is not a valid IPv4 address")
+		port = str(nodeInfo.get("PORT"))
+		if not port.isdigit() or not 0 < int(port) < 65536:
+			error(f"port '{port}' is not a valid TCP port")
+	if type == "OVSwitch" and nodeInfo.get("CONTROLLER") is None:
+		issues.append(Issue(WARNING, (name,), f"{name}: OVSwitch has no controller"))
+	return issues
+
+def node_values(type: str, nodeInfo: dict) -> dict[str, list[str]]:
+	# Addresses that must be unique in the topology
+	values = {"IP": [], "MAC": []}
+	for iface in nodeInfo.get("INTERFACES", []):
+		if iface.get("IP"):
+			values["IP"].append(normalize_ipv4(iface["IP"]))
+		if iface.get("MAC"):
+			values["MAC"].append(normalize_mac(iface["MAC"]))
+	if type == "Controller" and nodeInfo.get("IP"):
+		values["IP"].append(normalize_ipv4(str(nodeInfo["IP"])))
+	if nodeInfo.get("MANAGEMENT_MAC"):
+		values["MAC"].append(normalize_mac(str(nodeInfo["MANAGEMENT_MAC"])))
+	return values
+
+class TopologyValidator:
+	def __init__(self, onChange=None):
+		self.onChange = onChange # Called whenever the issue list changes
+		self.issues: dict[tuple, list[Issue]] = dict()
+		self.errorCount = 0
+		self.warningCount = 0
+		self.nodes: dict[str, tuple[str, dict]] = dict()
+		self.edges: dict[frozenset, tuple[str, str, dict]] = dict()
+		self.nodeEdges: dict[str, set[frozenset]] = dict()
+		self.nodeValues: dict[str, dict[str, list[str]]] = dict()
+		self.owners: dict[tuple[str, str], dict[str, int]] = dict() # (kind, value) -> {node name: uses}
+
+	def setIssues(self, key: tuple, issues: list[Issue]):
+		old = self.issues.pop(key, [])
+		if len(old) == 0 and len(issues) == 0:
+			return
+		for sign, group in ((-1, old), (1, issues)):
+			for issue in group:
+				if issue.severity == ERROR:
+					self.errorCount += sign
+				else: self.warningCount += sign
+		if len(issues) > 0:
+			self.issues[key] = issues
+		if self.onChange is not None and old != issues:
+			self.onChange()
+
+	def setNode(self, name: str, type: str, nodeInfo: dict):
+		self.nodes[name] = (type, nodeInfo)
+		self.nodeEdges.setdefault(name, set())
+		self.setIssues(("node", name), check_node(name, type, nodeInfo))
+		self.setValues(name, node_values(type, nodeInfo))
+		self.checkNodeEdges(name)
+
+	def removeNode(self, name: str):
+		for key in list(self.nodeEdges.get(name, [])):
+			self.removeEdge(*self.edges[key][:2])
+		self.nodes.pop(name, None)
+		self.nodeEdges.pop(name, None)
+		self.setIssues(("node", name), [])
+		self.setValues(name, {"IP": [], "MAC": []})
+
+	def renameNode(self, name: str, newName: str):
+		if name not in self.nodes:
+			return
+		edges = [self.edges[key] for key in self.nodeEdges[name]]
+		type, nodeInfo = self.nodes[name]
+		self.removeNode(name)
+		self.setNode(newName, type, nodeInfo)
+		for u, v, edgeInfo in edges:
+			self.setEdge(newName if u == name else u, newName if v == name else v, edgeInfo)
+
+	def setValues(self, name: str, values: dict[str, list[str]]):
+		old = self.nodeValues.pop(name, {})
+		affected = set()
+		for kind, items in old.items():
+			for value in items:
+				owners = self.owners[(kind, value)]
+				owners[name] -= 1
+				if owners[name] == 0:
+					del owners[name]
+				affected.add((kind, value))
+		for kind, items in values.items():
+			for value in items:
+				owners = self.owners.setdefault((kind, value), dict())
+				owners[name] = owners.get(name, 0) + 1
+				affected.add((kind, value))
+		if any(len(items) > 0 for items in values.values()):
+			self.nodeValues[name] = values
+		for kind, value in affected:
+			self.checkDuplicate(kind, value)
+
+	def checkDuplicate(self, kind: str, value: str):
+		owners = self.owners.get((kind, value))
+		if owners is not None and len(owners) == 0:
+			del self.owners[(kind, value)]
+			owners = None
+		if owners is None or (len(owners) == 1 and next(iter(owners.values())) == 1):
+			self.setIssues((kind, value), [])
+			return
+		names = tuple(owners.keys())
+		shown = ", ".join(names[:5]) + (f" and {len(names) - 5} more" if len(names) > 5 else "")
+		self.setIssues((kind, value), [Issue(ERROR, names, f"{kind} {value} is used more than once ({shown})")])
+
+	def setEdge(self, u: str, v: str, edgeInfo: dict):
+		# edgeInfo["INTERFACES"][i] is the interface index used on the i-th of u, v
+		key = frozenset((u, v))
+		self.edges[key] = (u, v, edgeInfo)
+		self.nodeEdges.setdefault(u, set()).add(key)
+		self.nodeEdges.setdefault(v, set()).add(key)
+		self.checkEdge(key)
+
+	def removeEdge(self, u: str, v: str):
+		key = frozenset((u, v))
+		if self.edges.pop(key, None) is None:
+			return
+		for n in (u, v):
+			if n in self.nodeEdges:
+				self.nodeEdges[n].discard(key)
+		self.setIssues(("edge", key), [])
+
+	def checkNodeEdges(self, name: str):
+		# Interface indices of the links depend on the node's interfaces
+		for key in self.nodeEdges.get(name, []):
+			self.checkEdge(key)
+
+	def checkEdge(self, key: frozenset):
+		u, v, edgeInfo = self.edges[key]
+		interfaces = edgeInfo.get("INTERFACES", [None, None])
+		issues = []
+		for i, name in enumerate((u, v)):
+			if name not in self.nodes:
+				issues.append(Issue(ERROR, (u, v), f"Link {u} - {v}: {name} does not exist"))
+				continue
+			type, nodeInfo = self.nodes[name]
+			if "INTERFACES" not in nodeInfo:
+				continue
+			index = interfaces[i] if i < len(interfaces) else None
+			if not isinstance(index, int):
+				issues.append(Issue(ERROR, (u, v), f"Link {u} - {v}: no interface of {name} is used"))
+			elif not 0 <= index < len(nodeInfo["INTERFACES"]):
+				issues.append(Issue(ERROR, (u, v), f"Link {u} - {v}: {name} interface {index + 1} does not exist"))
+		self.setIssues(("edge", key), issues)
+
+	def allIssues(self):
+		for issues in self.issues.values():
+			yield from issues
+
+	def clear(self):
+		changed = len(self.issues) > 0
+		self.issues.clear()
+		self.errorCount = 0
+		self.warningCount = 0
+		self.nodes.clear()
+		self.edges.clear()
+		self.nodeEdges.clear()
+		self.nodeValues.clear()
+		self.owners.clear()
+		if changed and self.onChange is not None:
+			self.onChange()
+
+# Batch mode
+
+def npgi_nodes(npgi: dict):
+	# (name, type, nodeInfo) of every node of an NPGI dict, as the editor loads them
+	mininet = npgi["TOPO"]["MININET"]
+	for h in mininet["HOSTS"]:
+		yield h["ID"], "Host", {"INTERFACES": h["INTERFACES"]}
+	for s in mininet["SWITCHES"]:
+		yield s, "Switch", {}
+	for vm in npgi["VMS"]:
+		vminfo = dict(vm)
+		name = vminfo.pop("ID")
+		vminfo["VNF"] = name.endswith("@VNF")
+		yield name.removesuffix("@VNF"), "VM", vminfo
+	for c in mininet["CONTROLLERS"]:
+		yield c["ID"], "Controller", {"IP": c["IP"], "PORT": c["PORT"]}
+	for ovs in mininet["OVSWITCHES"]:
+		yield ovs["ID"], "OVSwitch", {"CONTROLLER": ovs["CONTROLLER"]}
+
+def validate_npgi(npgi: dict) -> TopologyValidator:
+	validator = TopologyValidator()
+	for name, type, nodeInfo in npgi_nodes(npgi):
+		validator.setNode(name, type, nodeInfo)
+	for ovs in npgi["TOPO"]["MININET"]["OVSWITCHES"]:
+		if ovs["CONTROLLER"] is not None:
+			validator.setEdge(ovs["ID"], ovs["CONTROLLER"], {})
+	for c in npgi["TOPO"]["CONNECTIONS"]:
+		u, v = c["IN/OUT"], c["OUT/IN"]
+		indices = []
+		for name, mac in ((u, c.get("IN/OUTIFACE")), (v, c.get("OUT/INIFACE"))):
+			nodeInfo = validator.nodes.get(name, ("", {}))[1]
+			macs = [iface.get("MAC") for iface in nodeInfo.get("INTERFACES", [])]
+			indices.append(macs.index(mac) if mac in macs else None)
+		validator.setEdge(u, v, {"INTERFACES": indices})
+	return validator
+
+if __name__ == "__main__":
+	# Usage: validation.py topology.npgi ... Exits with status 1 if any file has errors
+	status = 0
+	for filepath in sys.argv[1:]:
+		with open(filepath, "r") as fp:
+			validator = validate_npgi(json.load(fp))
+		for issue in validator.allIssues():
+			print(f"{filepath}: {issue.severity}: {issue.message}")
+		print(f"{filepath}: {validator.errorCount} errors, {validator.warningCount} warnings")
+		if validator.errorCount > 0:
+			status = 1
+	sys.exit(status)